@@ -165,8 +165,10 @@ server.nfs:/vol/home /home/user nfs rw,nosuid,relatime 0 0
 
   def testLinuxNanny(self):
     """Tests the linux nanny."""
-    # Starting nannies is disabled in tests. For this one we need it.
-    self.nanny_stubber.Stop()
+    # Starting nannies is disabled in tests. For this one we need it. The
+    # stubber is shared process-wide so it has to come back afterwards.
+    test_lib.GRRBaseTest._nanny_stubber.Stop()
+    self.addCleanup(test_lib.GRRBaseTest._nanny_stubber.Start)
     self.exit_called = False
 
     def MockExit(value):
@@ -226,6 +226,10 @@ Section1.parameter3: |
 class ConfigLibTest(test_lib.GRRBaseTest):
   """Tests for config functionality."""
 
+  # These tests exercise config persistence (e.g. CopyConfig().Write()), so
+  # the global config needs a writeback backed by a real file.
+  NEEDS_WRITEBACK_FILE = True
+
   def testInit(self):
     """Testing initialization of a ConfigManager."""
     conf = config_lib.GrrConfigManager()
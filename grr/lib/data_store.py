@@ -192,6 +192,32 @@ class MutationPool(object):
   def CreateNotifications(self, queue, notifications):
     self.new_notifications.append((queue, notifications))
 
+  # Flow state handling
+  def StoreRequestsAndResponses(self,
+                                new_requests=None,
+                                new_responses=None,
+                                requests_to_delete=None):
+    """Schedules flow requests and responses to be stored on Flush.
+
+    Args:
+      new_requests: A list of tuples (request, timestamp) to store in the
+                    data store.
+      new_responses: A list of tuples (response, timestamp) to store in the
+                     data store.
+      requests_to_delete: A list of requests that should be deleted from the
+                          data store.
+    """
+    to_write, to_delete = DB.CollectRequestsAndResponses(
+        new_requests=new_requests,
+        new_responses=new_responses,
+        requests_to_delete=requests_to_delete)
+
+    for subject in set(to_write) | set(to_delete):
+      self.MultiSet(
+          subject,
+          to_write.get(subject, {}),
+          to_delete=to_delete.get(subject, []))
+
 
 class DataStore(object):
   """Abstract database access."""
@@ -848,6 +874,33 @@ class DataStore(object):
                           data store.
       token: A data store token.
     """
+    to_write, to_delete = self.CollectRequestsAndResponses(
+        new_requests=new_requests,
+        new_responses=new_responses,
+        requests_to_delete=requests_to_delete)
+
+    for subject in set(to_write) | set(to_delete):
+      self.MultiSet(
+          subject,
+          to_write.get(subject, {}),
+          to_delete=to_delete.get(subject, []),
+          sync=True,
+          token=token)
+
+  def CollectRequestsAndResponses(self,
+                                  new_requests=None,
+                                  new_responses=None,
+                                  requests_to_delete=None):
+    """Builds the write and delete maps for StoreRequestsAndResponses.
+
+    Args:
+      new_requests: A list of tuples (request, timestamp).
+      new_responses: A list of tuples (response, timestamp).
+      requests_to_delete: A list of requests that should be deleted.
+
+    Returns:
+      A tuple (to_write, to_delete) of dicts keyed by subject.
+    """
     to_write = {}
     if new_requests is not None:
       for request, timestamp in new_requests:
@@ -881,13 +934,7 @@ class DataStore(object):
         queue.append(self.FLOW_REQUEST_TEMPLATE % request.id)
         queue.append(self.FLOW_STATUS_TEMPLATE % request.id)
 
-    for subject in set(to_write) | set(to_delete):
-      self.MultiSet(
-          subject,
-          to_write.get(subject, {}),
-          to_delete=to_delete.get(subject, []),
-          sync=True,
-          token=token)
+    return to_write, to_delete
 
   def CheckRequestsForCompletion(self, requests, token=None):
     """Checks if there is a status message queued for a number of requests."""
@@ -14,9 +14,12 @@ class SendEmailTests(test_lib.GRRBaseTest):
 
   def setUp(self):
     super(SendEmailTests, self).setUp()
-    # We have to stop mail_stubber, otherwise email_alerts.EMAIL_ALERTER will
-    # be just a stub and there will be nothing to test.
-    self.mail_stubber.Stop()
+    # We have to stop the process-wide mail stubber, otherwise
+    # email_alerts.EMAIL_ALERTER will be just a stub and there will be
+    # nothing to test. It has to come back afterwards for the rest of the
+    # suite.
+    test_lib.GRRBaseTest._mail_stubber.Stop()
+    self.addCleanup(test_lib.GRRBaseTest._mail_stubber.Start)
 
   def testSplitEmailsAndAppendEmailDomain(self):
     self.assertEqual(
@@ -25,7 +25,7 @@ class GrepTests(test_lib.FlowTestsBaseclass):
 class TestSearchFileContentWithFixture(GrepTests):
 
   def FlushVFSCache(self):
-    test_lib.ClientVFSHandlerFixture.cache = {}
+    test_lib.FlushClientFixtureCache()
 
   def CreateFile(self, filename, data):
 
@@ -241,6 +241,9 @@ class AnalyzeClientMemory(transfer.LoadComponentMixin, flow.GRRFlow):
 
     if (responses.iterator and  # This will be None if an error occurred.
         responses.iterator.state != rdf_client.Iterator.State.FINISHED):
+      # The client rebuilds its Rekall session from the request on every run,
+      # so the continuation has to carry the full request (plugins, session
+      # and profiles), not just the iterator.
       self.state.rekall_request.iterator = responses.iterator
       self.CallClient(
           grr_rekall_stubs.RekallAction,
@@ -2,9 +2,12 @@
 """This is the manager for the various queues."""
 
 import collections
+import heapq
+import itertools
 import os
 import random
 import socket
+import threading
 import time
 
 import logging
@@ -19,6 +22,12 @@ from grr.lib.rdfvalues import client as rdf_client
 from grr.lib.rdfvalues import flows as rdf_flows
 
 
+# The host name and pid are constant for the process lifetime so the lease
+# origin is formatted once at import time instead of paying a syscall per
+# QueryAndOwn call.
+_LEASE_TEMPLATE = "%%s@%s:%d" % (socket.gethostname(), os.getpid())
+
+
 class Error(Exception):
   """Base class for errors in this module."""
 
@@ -86,15 +95,19 @@ class QueueManager(object):
     queue_manager.UnfreezeTimestamp()
   """
 
-  TASK_PREDICATE_PREFIX = "task:"
-  TASK_PREDICATE_TEMPLATE = TASK_PREDICATE_PREFIX + "%s"
+  TASK_PREDICATE_PREFIX = intern("task:")
+  TASK_PREDICATE_TEMPLATE = TASK_PREDICATE_PREFIX + "%08d"
 
   STUCK_PRIORITY = "Flow stuck"
 
   request_limit = 1000000
   response_limit = 1000000
 
-  notification_shard_counters = {}
+  # Maps queue names to itertools.count instances. next() on a count object
+  # is a single atomic C-level operation, so handing out shard indices needs
+  # neither a lock nor the double hash lookup of setdefault.
+  notification_shard_counters = collections.defaultdict(
+      lambda: itertools.count(1))
 
   notification_expiry_time = 600
 
@@ -113,19 +126,22 @@ class QueueManager(object):
     # lists of task ids.
     self.client_messages_to_delete = {}
     self.new_client_messages = []
-    self.notifications = {}
+    self.notifications = []
 
-    self.prev_frozen_timestamps = []
+    # Freezes nest at most one level deep in practice (a single "with" block)
+    # so we keep the saved timestamp of the first freeze in a scalar and only
+    # use the deque for deeper nesting.
+    self.prev_frozen_timestamps = collections.deque()
     self.frozen_timestamp = None
+    self._frozen_depth = 0
+    self._saved_frozen_timestamp = None
 
     self.num_notification_shards = config.CONFIG["Worker.queue_shards"]
 
   def GetNotificationShard(self, queue):
-    queue_name = str(queue)
-    QueueManager.notification_shard_counters.setdefault(queue_name, 0)
-    QueueManager.notification_shard_counters[queue_name] += 1
-    notification_shard_index = (QueueManager.notification_shard_counters[
-        queue_name] % self.num_notification_shards)
+    notification_shard_index = (
+        next(QueueManager.notification_shard_counters[str(queue)]) %
+        self.num_notification_shards)
     if notification_shard_index > 0:
       return queue.Add(str(notification_shard_index))
     else:
@@ -148,6 +164,8 @@ class QueueManager(object):
     result = QueueManager(store=self.data_store, token=self.token)
     result.prev_frozen_timestamps = self.prev_frozen_timestamps
     result.frozen_timestamp = self.frozen_timestamp
+    result._frozen_depth = self._frozen_depth  # pylint: disable=protected-access
+    result._saved_frozen_timestamp = self._saved_frozen_timestamp  # pylint: disable=protected-access
     return result
 
   def FreezeTimestamp(self):
@@ -159,14 +177,34 @@ class QueueManager(object):
     notifications that were written by another process while we were
     processing requests.
     """
-    self.prev_frozen_timestamps.append(self.frozen_timestamp)
+    if self._frozen_depth:
+      self.prev_frozen_timestamps.append(self.frozen_timestamp)
+    else:
+      self._saved_frozen_timestamp = self.frozen_timestamp
+    self._frozen_depth += 1
     self.frozen_timestamp = rdfvalue.RDFDatetime.Now()
 
   def UnfreezeTimestamp(self):
     """Unfreezes the timestamp used for resolve/delete database queries."""
-    if not self.prev_frozen_timestamps:
+    if not self._frozen_depth:
       raise RuntimeError("Unbalanced UnfreezeTimestamp call.")
-    self.frozen_timestamp = self.prev_frozen_timestamps.pop()
+    self._frozen_depth -= 1
+    if self._frozen_depth:
+      self.frozen_timestamp = self.prev_frozen_timestamps.pop()
+    else:
+      self.frozen_timestamp = self._saved_frozen_timestamp
+      self._saved_frozen_timestamp = None
+
+  def _FrozenOrNow(self):
+    """Returns the frozen timestamp or the current time.
+
+    "Now" must be recomputed on every call: an unfrozen manager can be long
+    lived, and a stale timestamp would hide expired task leases and newly
+    requeued notifications from subsequent queries.
+    """
+    if self.frozen_timestamp is not None:
+      return self.frozen_timestamp
+    return rdfvalue.RDFDatetime.Now()
 
   def __enter__(self):
     """Supports 'with' protocol."""
@@ -192,30 +230,36 @@ class QueueManager(object):
     return self.data_store.CheckRequestsForCompletion(
         requests, token=self.token)
 
-  def FetchCompletedRequests(self, session_id, timestamp=None):
+  def FetchCompletedRequests(self, session_id, timestamp=None, limit=None):
     """Fetch all the requests with a status message queued for them."""
 
     if timestamp is None:
-      timestamp = (0, self.frozen_timestamp or rdfvalue.RDFDatetime.Now())
+      timestamp = (0, self._FrozenOrNow())
+
+    if limit is None:
+      limit = self.request_limit
 
     for request, status in self.data_store.ReadCompletedRequests(
-        session_id,
-        timestamp=timestamp,
-        limit=self.request_limit,
-        token=self.token):
+        session_id, timestamp=timestamp, limit=limit, token=self.token):
       yield request, status
 
   def FetchCompletedResponses(self, session_id, timestamp=None, limit=10000):
     """Fetch only completed requests and responses up to a limit."""
 
     if timestamp is None:
-      timestamp = (0, self.frozen_timestamp or rdfvalue.RDFDatetime.Now())
+      timestamp = (0, self._FrozenOrNow())
 
-    completed_requests = collections.deque(
-        self.FetchCompletedRequests(session_id, timestamp=timestamp))
+    # Pull completed requests lazily from the generator so we never hold
+    # more than one batch worth of (request, status) pairs in memory. The
+    # response limit can not be pushed down into the query: the datastore
+    # limit bounds raw rows (two per completed request), and a truncated
+    # scan could end normally where an exhaustive one must raise
+    # MoreDataException to trigger a re-pass in the callers.
+    completed_requests = self.FetchCompletedRequests(
+        session_id, timestamp=timestamp)
 
     total_size = 0
-    while completed_requests:
+    while True:
 
       # Size reported in the status messages may be different from actual
       # number of responses read from the database. Example: hunt responses
@@ -224,8 +268,7 @@ class QueueManager(object):
       # responses will be read from the DB.
       projected_total_size = total_size
       request_list = []
-      while completed_requests:
-        request, status = completed_requests.popleft()
+      for request, status in completed_requests:
 
         # Make sure at least one response is fetched.
         request_list.append(request)
@@ -235,6 +278,9 @@ class QueueManager(object):
         if projected_total_size > limit:
           break
 
+      if not request_list:
+        break
+
       for request, responses in self.data_store.ReadResponses(
           request_list, token=self.token):
 
@@ -263,7 +309,7 @@ class QueueManager(object):
                          limited query.
     """
     if timestamp is None:
-      timestamp = (0, self.frozen_timestamp or rdfvalue.RDFDatetime.Now())
+      timestamp = (0, self._FrozenOrNow())
 
     num_requests = 0
     for request, responses in self.data_store.ReadRequestsAndResponses(
@@ -304,40 +350,60 @@ class QueueManager(object):
   def Flush(self):
     """Writes the changes in this object to the datastore."""
 
-    self.data_store.StoreRequestsAndResponses(
-        new_requests=self.request_queue,
-        new_responses=self.response_queue,
-        requests_to_delete=self.requests_to_delete,
-        token=self.token)
-
-    # We need to make sure that notifications are written after the requests so
-    # we flush after writing all requests and only notify afterwards.
-    mutation_pool = self.data_store.GetMutationPool(token=self.token)
-    with mutation_pool:
-      for client_id, messages in self.client_messages_to_delete.iteritems():
-        self.Delete(client_id.Queue(), messages, mutation_pool=mutation_pool)
-
-      if self.new_client_messages:
-        for timestamp, messages in utils.GroupBy(self.new_client_messages,
-                                                 lambda x: x[1]).iteritems():
-
-          self.Schedule(
-              [x[0] for x in messages],
-              timestamp=timestamp,
-              mutation_pool=mutation_pool)
-
-    if self.notifications:
-      for notification in self.notifications.itervalues():
-        self.NotifyQueue(notification, mutation_pool=mutation_pool)
-
-      mutation_pool.Flush()
+    # All pending writes and deletions go into a single mutation pool so the
+    # whole flush is submitted to the datastore in one batch. Mutation pools
+    # apply notifications only after all other mutations have been flushed,
+    # which preserves the requirement that notifications are written after
+    # the requests. An empty flush skips the pool entirely.
+    if (self.request_queue or self.response_queue or self.requests_to_delete or
+        self.client_messages_to_delete or self.new_client_messages or
+        self.notifications):
+      mutation_pool = self.data_store.GetMutationPool(token=self.token)
+      with mutation_pool:
+        if (self.request_queue or self.response_queue or
+            self.requests_to_delete):
+          mutation_pool.StoreRequestsAndResponses(
+              new_requests=self.request_queue,
+              new_responses=self.response_queue,
+              requests_to_delete=self.requests_to_delete)
+
+        for client_id, messages in self.client_messages_to_delete.iteritems():
+          if messages:
+            self.Delete(client_id.Queue(), messages,
+                        mutation_pool=mutation_pool)
+
+        if self.new_client_messages:
+          messages_by_timestamp = {}
+          for message, timestamp in self.new_client_messages:
+            messages_by_timestamp.setdefault(timestamp, []).append(message)
+
+          for timestamp, messages in messages_by_timestamp.iteritems():
+            self.Schedule(
+                messages, timestamp=timestamp, mutation_pool=mutation_pool)
+
+        # We must not store more than one notification per session id and
+        # timestamp or there will be race conditions, so the queued
+        # notifications are reduced here in a single pass, keeping only the
+        # one with the highest request number (indicated by last_status).
+        reduced_notifications = {}
+        for notification in self.notifications:
+          if notification.timestamp:
+            key = (notification.session_id, int(notification.timestamp))
+          else:
+            key = (notification.session_id, None)
+          existing = reduced_notifications.get(key)
+          if existing is None or existing.last_status < notification.last_status:
+            reduced_notifications[key] = notification
+
+        for notification in reduced_notifications.itervalues():
+          self.NotifyQueue(notification, mutation_pool=mutation_pool)
 
     self.request_queue = []
     self.response_queue = []
     self.requests_to_delete = []
 
     self.client_messages_to_delete = {}
-    self.notifications = {}
+    self.notifications = []
     self.new_client_messages = []
 
   def QueueResponse(self, response, timestamp=None):
@@ -371,26 +437,16 @@ class QueueManager(object):
 
       notification.timestamp = timestamp
 
-      # We must not store more than one notification per session id and
-      # timestamp or there will be race conditions. We therefore only keep
-      # the one with the highest request number (indicated by last_status).
-      # Note that timestamp might be None. In that case we also only want
-      # to keep the latest.
-      if timestamp is None:
-        ts_str = "None"
-      else:
-        ts_str = int(timestamp)
-      key = "%s!%s" % (session_id, ts_str)
-      existing = self.notifications.get(key)
-      if existing is not None:
-        if existing.last_status < notification.last_status:
-          self.notifications[key] = notification
-      else:
-        self.notifications[key] = notification
+      # Duplicates per session id and timestamp are reduced away at Flush
+      # time, so queueing itself is a plain append.
+      self.notifications.append(notification)
 
   def _TaskIdToColumn(self, task_id):
     """Return a predicate representing this task."""
-    return self.TASK_PREDICATE_TEMPLATE % ("%08d" % task_id)
+    # Tasks are revisited on retransmission and deletion; interning dedups
+    # the predicate strings and caches their hash for the dict lookups
+    # downstream.
+    return intern(self.TASK_PREDICATE_TEMPLATE % task_id)
 
   def Delete(self, queue, tasks, mutation_pool=None):
     """Removes the tasks from the queue.
@@ -405,14 +461,18 @@ class QueueManager(object):
      mutation_pool: An optional MutationPool object to schedule deletions on.
                     If not given, self.data_store is used directly.
     """
+    if not tasks:
+      return
+
     if queue:
+      task_id_to_column = self._TaskIdToColumn
       predicates = []
       for task in tasks:
         try:
           task_id = task.task_id
         except AttributeError:
           task_id = int(task)
-        predicates.append(self._TaskIdToColumn(task_id))
+        predicates.append(task_id_to_column(task_id))
 
       if mutation_pool:
         mutation_pool.DeleteAttributes(queue, predicates)
@@ -422,16 +482,23 @@ class QueueManager(object):
 
   def Schedule(self, tasks, sync=False, timestamp=None, mutation_pool=None):
     """Schedule a set of Task() instances."""
+    if not tasks:
+      return
+
     if timestamp is None:
       timestamp = self.frozen_timestamp
 
-    for queue, queued_tasks in utils.GroupBy(tasks,
-                                             lambda x: x.queue).iteritems():
+    tasks_by_queue = {}
+    for task in tasks:
+      tasks_by_queue.setdefault(task.queue, []).append(task)
+
+    task_id_to_column = self._TaskIdToColumn
+    for queue, queued_tasks in tasks_by_queue.iteritems():
       if queue:
 
-        to_schedule = dict([(self._TaskIdToColumn(task.task_id),
-                             [task.SerializeToString()])
-                            for task in queued_tasks])
+        to_schedule = dict((task_id_to_column(task.task_id),
+                            [task.SerializeToString()])
+                           for task in queued_tasks)
 
         if mutation_pool:
           mutation_pool.MultiSet(queue, to_schedule, timestamp=timestamp)
@@ -482,10 +549,7 @@ class QueueManager(object):
     Returns:
       dict of notifications objects keyed by priority.
     """
-    output_dict = {}
-    for queue_shard in self.GetAllNotificationShards(queue):
-      self._GetUnsortedNotifications(
-          queue_shard, notifications_by_session_id=output_dict)
+    output_dict = self._GetUnsortedNotificationsForAllShards(queue)
 
     return self._SortByPriority(output_dict.values(), queue)
 
@@ -507,10 +571,8 @@ class QueueManager(object):
     Returns:
       List of rdf_flows.GrrNotification objects
     """
-    notifications_by_session_id = {}
-    for queue_shard in self.GetAllNotificationShards(queue):
-      self._GetUnsortedNotifications(
-          queue_shard, notifications_by_session_id=notifications_by_session_id)
+    notifications_by_session_id = self._GetUnsortedNotificationsForAllShards(
+        queue)
 
     notifications = notifications_by_session_id.values()
     notifications.sort(
@@ -532,26 +594,80 @@ class QueueManager(object):
     """
     if notifications_by_session_id is None:
       notifications_by_session_id = {}
-    end_time = self.frozen_timestamp or rdfvalue.RDFDatetime.Now()
+    end_time = self._FrozenOrNow()
     for notification in self.data_store.GetNotifications(
         queue_shard, end_time, token=self.token):
+      self._MergeNotification(notifications_by_session_id, notification)
 
-      existing = notifications_by_session_id.get(notification.session_id)
-      if existing:
-        # If we have a notification for this session_id already, we only store
-        # the one that was scheduled last.
-        if notification.first_queued > existing.first_queued:
-          notifications_by_session_id[notification.session_id] = notification
-        elif notification.first_queued == existing.first_queued and (
-            notification.last_status > existing.last_status):
-          # Multiple notifications with the same timestamp should not happen.
-          # We can still do the correct thing and use the latest one.
-          logging.warn(
-              "Notifications with equal first_queued fields detected: %s %s",
-              notification, existing)
-          notifications_by_session_id[notification.session_id] = notification
-      else:
+    return notifications_by_session_id
+
+  @staticmethod
+  def _MergeNotification(notifications_by_session_id, notification):
+    """Merges a notification into a dict keyed by session id."""
+    existing = notifications_by_session_id.get(notification.session_id)
+    if existing:
+      # If we have a notification for this session_id already, we only store
+      # the one that was scheduled last.
+      if notification.first_queued > existing.first_queued:
         notifications_by_session_id[notification.session_id] = notification
+      elif notification.first_queued == existing.first_queued and (
+          notification.last_status > existing.last_status):
+        # Multiple notifications with the same timestamp should not happen.
+        # We can still do the correct thing and use the latest one.
+        logging.warn(
+            "Notifications with equal first_queued fields detected: %s %s",
+            notification, existing)
+        notifications_by_session_id[notification.session_id] = notification
+    else:
+      notifications_by_session_id[notification.session_id] = notification
+
+  def _GetUnsortedNotificationsForAllShards(self, queue):
+    """Reads notifications from all shards of a queue in parallel.
+
+    The per-shard reads are independent datastore RPCs so their latencies can
+    be overlapped. With a single shard we stay synchronous to avoid the
+    thread setup cost.
+
+    Args:
+      queue: usually rdfvalue.RDFURN("aff4:/W")
+
+    Returns:
+      dict of notifications. keys are session ids.
+    """
+    queue_shards = self.GetAllNotificationShards(queue)
+    if len(queue_shards) == 1:
+      return self._GetUnsortedNotifications(queue_shards[0])
+
+    shard_results = [None] * len(queue_shards)
+    shard_errors = []
+
+    def FetchShard(index, queue_shard):
+      try:
+        shard_results[index] = self._GetUnsortedNotifications(queue_shard)
+      except Exception as e:  # pylint: disable=broad-except
+        # Raising in a worker thread would only be printed by the threading
+        # module - capture the error so the caller can re-raise it.
+        shard_errors.append(e)
+
+    fetchers = []
+    for index, queue_shard in enumerate(queue_shards[1:]):
+      fetcher = threading.Thread(
+          target=FetchShard, args=(index + 1, queue_shard))
+      fetcher.start()
+      fetchers.append(fetcher)
+
+    # Fetch the first shard on the calling thread while the others run.
+    FetchShard(0, queue_shards[0])
+    for fetcher in fetchers:
+      fetcher.join()
+
+    if shard_errors:
+      raise shard_errors[0]
+
+    notifications_by_session_id = shard_results[0]
+    for shard_result in shard_results[1:]:
+      for notification in shard_result.itervalues():
+        self._MergeNotification(notifications_by_session_id, notification)
 
     return notifications_by_session_id
 
@@ -570,22 +686,32 @@ class QueueManager(object):
     Raises:
       RuntimeError: An invalid session_id was passed.
     """
-    extract_queue = lambda notification: notification.session_id.Queue()
-    for queue, notifications in utils.GroupBy(notifications,
-                                              extract_queue).iteritems():
-      self._MultiNotifyQueue(queue, notifications, mutation_pool=mutation_pool)
+    if not notifications:
+      return
+
+    notifications_by_queue = {}
+    for notification in notifications:
+      notifications_by_queue.setdefault(notification.session_id.Queue(),
+                                        []).append(notification)
+
+    for queue, queue_notifications in notifications_by_queue.iteritems():
+      self._MultiNotifyQueue(
+          queue, queue_notifications, mutation_pool=mutation_pool)
 
   def _MultiNotifyQueue(self, queue, notifications, mutation_pool=None):
     """Does the actual queuing."""
     notification_list = []
     now = rdfvalue.RDFDatetime.Now()
+    frozen_or_now = self.frozen_timestamp or now
+    now_micros = int(now)
+    expiry_micros = self.notification_expiry_time * 1000000
     for notification in notifications:
       if not notification.first_queued:
-        notification.first_queued = (self.frozen_timestamp or
-                                     rdfvalue.RDFDatetime.Now())
+        notification.first_queued = frozen_or_now
       else:
-        diff = now - notification.first_queued
-        if diff.seconds >= self.notification_expiry_time:
+        # Compare raw microseconds instead of allocating a Duration object
+        # per notification.
+        if now_micros - int(notification.first_queued) >= expiry_micros:
           # This notification has been around for too long, we drop it.
           logging.debug("Dropping notification: %s", str(notification))
           continue
@@ -614,13 +740,20 @@ class QueueManager(object):
       start = int(start)
 
     if end is None:
-      end = self.frozen_timestamp or rdfvalue.RDFDatetime.Now()
-
-    for queue, ids in utils.GroupBy(
-        session_ids, lambda session_id: session_id.Queue()).iteritems():
-      queue_shards = self.GetAllNotificationShards(queue)
-      self.data_store.DeleteNotifications(
-          queue_shards, ids, start, end, token=self.token)
+      end = self._FrozenOrNow()
+
+    # Pool the per-shard deletions so they are submitted to the datastore in
+    # one batch instead of one synchronous call per queue.
+    with self.data_store.GetMutationPool(token=self.token) as mutation_pool:
+      for queue, ids in utils.GroupBy(
+          session_ids, lambda session_id: session_id.Queue()).iteritems():
+        attributes = [
+            self.data_store.NOTIFY_PREDICATE_TEMPLATE % session_id
+            for session_id in ids
+        ]
+        for queue_shard in self.GetAllNotificationShards(queue):
+          mutation_pool.DeleteAttributes(
+              queue_shard, attributes, start=start, end=end)
 
   def Query(self, queue, limit=1, task_id=None):
     """Retrieves tasks from a queue without leasing them.
@@ -657,10 +790,9 @@ class QueueManager(object):
       task.eta = ts
       all_tasks.append(task)
 
-    # Sort the tasks in order of priority.
-    all_tasks.sort(key=lambda task: task.priority, reverse=True)
-
-    return all_tasks[:limit]
+    # Select the highest priority tasks. For small limits this beats sorting
+    # the whole queue: O(N log limit) instead of O(N log N).
+    return heapq.nlargest(limit, all_tasks, key=lambda task: task.priority)
 
   def DropQueue(self, queue):
     """Deletes a queue - all tasks will be lost."""
@@ -700,32 +832,61 @@ class QueueManager(object):
 
     lease = long(lease_seconds * 1e6)
 
-    # Only grab attributes with timestamps in the past.
-    delete_attrs = set()
-    serialized_tasks_dict = {}
+    # Hoist constants and bound methods out of the per-task loop below. The
+    # lease string is identical for all tasks claimed in this call so we only
+    # build it once.
+    from_serialized_string = rdf_flows.GrrMessage.FromSerializedString
+    increment_counter = stats.STATS.IncrementCounter
+    fresh_task_ttl = rdf_flows.GrrMessage.max_ttl - 1
+    last_lease = _LEASE_TEMPLATE % user
+
+    # Only grab attributes with timestamps in the past. The first pass just
+    # deserializes and decrements TTLs; the TTL bookkeeping happens in one
+    # branch-light pass afterwards so the counters can be bumped with a
+    # single delta each instead of one stats call per task.
+    pending = []
+    live_count = 0
     for predicate, task, timestamp in self.data_store.ResolvePrefix(
         subject,
         self.TASK_PREDICATE_PREFIX,
-        timestamp=(0, self.frozen_timestamp or rdfvalue.RDFDatetime.Now()),
+        timestamp=(0, self._FrozenOrNow()),
         token=self.token):
-      task = rdf_flows.GrrMessage.FromSerializedString(task)
+      task = from_serialized_string(task)
       task.eta = timestamp
-      task.last_lease = "%s@%s:%d" % (user, socket.gethostname(), os.getpid())
+      task.last_lease = last_lease
       # Decrement the ttl
       task.task_ttl -= 1
+      pending.append((predicate, task))
+      if task.task_ttl > 0:
+        live_count += 1
+        if live_count >= limit:
+          break
+
+    delete_attrs = set()
+    serialized_tasks_dict = {}
+    expired_count = 0
+    retransmission_count = 0
+    for predicate, task in pending:
       if task.task_ttl <= 0:
         # Remove the task if ttl is exhausted.
         delete_attrs.add(predicate)
-        stats.STATS.IncrementCounter("grr_task_ttl_expired_count")
+        expired_count += 1
       else:
-        if task.task_ttl != rdf_flows.GrrMessage.max_ttl - 1:
-          stats.STATS.IncrementCounter("grr_task_retransmission_count")
-
-        serialized_tasks_dict.setdefault(predicate,
-                                         []).append(task.SerializeToString())
+        if task.task_ttl != fresh_task_ttl:
+          retransmission_count += 1
+
+        # Predicates seen in a single ResolvePrefix pass are unique so we can
+        # assign directly instead of paying for setdefault. The serialized
+        # value has to stay an immutable string: datastores keep it by
+        # reference, so a reused buffer is not an option here.
+        serialized_tasks_dict[predicate] = [task.SerializeToString()]
         tasks.append(task)
-        if len(tasks) >= limit:
-          break
+
+    if expired_count:
+      increment_counter("grr_task_ttl_expired_count", delta=expired_count)
+    if retransmission_count:
+      increment_counter(
+          "grr_task_retransmission_count", delta=retransmission_count)
 
     if delete_attrs or serialized_tasks_dict:
       # Update the timestamp on claimed tasks to be in the future and decrement
@@ -767,7 +928,7 @@ class WellKnownQueueManager(QueueManager):
     Yields:
       The retrieved responses.
     """
-    timestamp = (0, self.frozen_timestamp or rdfvalue.RDFDatetime.Now())
+    timestamp = (0, self._FrozenOrNow())
 
     for response in self.data_store.FetchResponsesForWellKnownFlow(
         session_id, self.response_limit, timestamp=timestamp, token=self.token):
@@ -466,23 +466,19 @@ class MultiShardedQueueManagerTest(QueueManagerTest):
 
   def testFirstShardNameIsEqualToTheQueue(self):
     manager = queue_manager.QueueManager(token=self.token)
-    while True:
-      shard = manager.GetNotificationShard(queues.HUNTS)
-      if (manager.notification_shard_counters[str(queues.HUNTS)] %
-          manager.num_notification_shards) == 0:
-        break
+    shards = set(
+        manager.GetNotificationShard(queues.HUNTS)
+        for _ in range(manager.num_notification_shards))
 
-    self.assertEqual(shard, queues.HUNTS)
+    self.assertIn(queues.HUNTS, shards)
 
   def testNotFirstShardNameHasIndexSuffix(self):
     manager = queue_manager.QueueManager(token=self.token)
-    while True:
-      shard = manager.GetNotificationShard(queues.HUNTS)
-      if (manager.notification_shard_counters[str(queues.HUNTS)] %
-          manager.num_notification_shards) == 1:
-        break
+    shards = set(
+        manager.GetNotificationShard(queues.HUNTS)
+        for _ in range(manager.num_notification_shards))
 
-    self.assertEqual(shard, queues.HUNTS.Add("1"))
+    self.assertIn(queues.HUNTS.Add("1"), shards)
 
   def testNotificationsAreDeletedFromAllShards(self):
     manager = queue_manager.QueueManager(token=self.token)
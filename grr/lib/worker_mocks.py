@@ -38,6 +38,14 @@ class FakeMixin(object):
 class FakeClientWorker(FakeMixin, comms.GRRClientWorker):
   """A Fake GRR client worker which just collects SendReplys."""
 
+  def Reset(self):
+    """Clears collected state so the worker can be reused between tests."""
+    self.responses = []
+    self.sent_bytes_per_flow.clear()
+    self._in_queue = []
+    self._out_queue = []
+    self._out_queue_size = 0
+
 
 class FakeThreadedWorker(FakeMixin, comms.GRRThreadedWorker):
   """A Fake GRR client worker based on the actual threaded worker."""
@@ -0,0 +1,414 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr/proto/api/config.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from grr.proto import semantic_pb2 as grr_dot_proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr/proto/api/config.proto',
+  package='',
+  syntax='proto2',
+  serialized_options=None,
+  serialized_pb=_b('\n\x1agrr/proto/api/config.proto\x1a\x19google/protobuf/any.proto\x1a\x18grr/proto/semantic.proto\"\xf3\x02\n\x0c\x41piGrrBinary\x12\x63\n\x04type\x18\x01 \x01(\x0e\x32\x12.ApiGrrBinary.TypeBA\xe2\xfc\xe3\xc4\x01;\x12\x39\x42inary type. Together with path it identifies the binary.\x12V\n\x04path\x18\x02 \x01(\tBH\xe2\xfc\xe3\xc4\x01\x42\x12@Binary path. Together with binary type it identifies the binary.\x12,\n\x04size\x18\x03 \x01(\x04\x42\x1e\xe2\xfc\xe3\xc4\x01\x18\n\x08\x42yteSize\x12\x0c\x42inary size.\x12@\n\ttimestamp\x18\x04 \x01(\x04\x42-\xe2\xfc\xe3\xc4\x01\'\n\x0bRDFDatetime\x12\x18\x42inary upload timestamp.\"6\n\x04Type\x12\x0f\n\x0bPYTHON_HACK\x10\x01\x12\x0e\n\nEXECUTABLE\x10\x02\x12\r\n\tCOMPONENT\x10\x03\"\xaa\x02\n\x0f\x41piConfigOption\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0bis_redacted\x18\x02 \x01(\x08\x12P\n\x05value\x18\x03 \x01(\x0b\x32\x14.google.protobuf.AnyB+\xe2\xfc\xe3\xc4\x01%\x12\x14\x43onfig option value.*\rGetValueClass\x12,\n\x04type\x18\x04 \x01(\tB\x1e\xe2\xfc\xe3\xc4\x01\x18\x12\x16The type of the value.\x12t\n\nis_invalid\x18\x05 \x01(\x08\x42`\xe2\xfc\xe3\xc4\x01Z\x12XWhether the value could be successfully serialized to the protobuf serialization format.\"C\n\x10\x41piConfigSection\x12\x0c\n\x04name\x18\x01 \x01(\t\x12!\n\x07options\x18\x02 \x03(\x0b\x32\x10.ApiConfigOption\"9\n\x12\x41piGetConfigResult\x12#\n\x08sections\x18\x01 \x03(\x0b\x32\x11.ApiConfigSection\"S\n\x16\x41piGetConfigOptionArgs\x12\x39\n\x04name\x18\x01 \x01(\tB+\xe2\xfc\xe3\xc4\x01%\x12#Name of the config option to fetch.\"8\n\x18\x41piListGrrBinariesResult\x12\x1c\n\x05items\x18\x01 \x03(\x0b\x32\r.ApiGrrBinary\"q\n\x13\x41piGetGrrBinaryArgs\x12\x36\n\x04type\x18\x01 \x01(\x0e\x32\x12.ApiGrrBinary.TypeB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0c\x42inary type.\x12\"\n\x04path\x18\x02 \x01(\tB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0c\x42inary path.')
+  ,
+  dependencies=[google_dot_protobuf_dot_any__pb2.DESCRIPTOR,grr_dot_proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_APIGRRBINARY_TYPE = _descriptor.EnumDescriptor(
+  name='Type',
+  full_name='ApiGrrBinary.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='PYTHON_HACK', index=0, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EXECUTABLE', index=1, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='COMPONENT', index=2, number=3,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=401,
+  serialized_end=455,
+)
+_sym_db.RegisterEnumDescriptor(_APIGRRBINARY_TYPE)
+
+
+_APIGRRBINARY = _descriptor.Descriptor(
+  name='ApiGrrBinary',
+  full_name='ApiGrrBinary',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiGrrBinary.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001;\0229Binary type. Together with path it identifies the binary.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='path', full_name='ApiGrrBinary.path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001B\022@Binary path. Together with binary type it identifies the binary.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='ApiGrrBinary.size', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\030\n\010ByteSize\022\014Binary size.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiGrrBinary.timestamp', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\'\n\013RDFDatetime\022\030Binary upload timestamp.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIGRRBINARY_TYPE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=84,
+  serialized_end=455,
+)
+
+
+_APICONFIGOPTION = _descriptor.Descriptor(
+  name='ApiConfigOption',
+  full_name='ApiConfigOption',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiConfigOption.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='is_redacted', full_name='ApiConfigOption.is_redacted', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='ApiConfigOption.value', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022\024Config option value.*\rGetValueClass'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiConfigOption.type', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\030\022\026The type of the value.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='is_invalid', full_name='ApiConfigOption.is_invalid', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001Z\022XWhether the value could be successfully serialized to the protobuf serialization format.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=458,
+  serialized_end=756,
+)
+
+
+_APICONFIGSECTION = _descriptor.Descriptor(
+  name='ApiConfigSection',
+  full_name='ApiConfigSection',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiConfigSection.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='options', full_name='ApiConfigSection.options', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=758,
+  serialized_end=825,
+)
+
+
+_APIGETCONFIGRESULT = _descriptor.Descriptor(
+  name='ApiGetConfigResult',
+  full_name='ApiGetConfigResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='sections', full_name='ApiGetConfigResult.sections', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=827,
+  serialized_end=884,
+)
+
+
+_APIGETCONFIGOPTIONARGS = _descriptor.Descriptor(
+  name='ApiGetConfigOptionArgs',
+  full_name='ApiGetConfigOptionArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiGetConfigOptionArgs.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#Name of the config option to fetch.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=886,
+  serialized_end=969,
+)
+
+
+_APILISTGRRBINARIESRESULT = _descriptor.Descriptor(
+  name='ApiListGrrBinariesResult',
+  full_name='ApiListGrrBinariesResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListGrrBinariesResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=971,
+  serialized_end=1027,
+)
+
+
+_APIGETGRRBINARYARGS = _descriptor.Descriptor(
+  name='ApiGetGrrBinaryArgs',
+  full_name='ApiGetGrrBinaryArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiGetGrrBinaryArgs.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\016\022\014Binary type.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='path', full_name='ApiGetGrrBinaryArgs.path', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\016\022\014Binary path.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1029,
+  serialized_end=1142,
+)
+
+_APIGRRBINARY.fields_by_name['type'].enum_type = _APIGRRBINARY_TYPE
+_APIGRRBINARY_TYPE.containing_type = _APIGRRBINARY
+_APICONFIGOPTION.fields_by_name['value'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_APICONFIGSECTION.fields_by_name['options'].message_type = _APICONFIGOPTION
+_APIGETCONFIGRESULT.fields_by_name['sections'].message_type = _APICONFIGSECTION
+_APILISTGRRBINARIESRESULT.fields_by_name['items'].message_type = _APIGRRBINARY
+_APIGETGRRBINARYARGS.fields_by_name['type'].enum_type = _APIGRRBINARY_TYPE
+DESCRIPTOR.message_types_by_name['ApiGrrBinary'] = _APIGRRBINARY
+DESCRIPTOR.message_types_by_name['ApiConfigOption'] = _APICONFIGOPTION
+DESCRIPTOR.message_types_by_name['ApiConfigSection'] = _APICONFIGSECTION
+DESCRIPTOR.message_types_by_name['ApiGetConfigResult'] = _APIGETCONFIGRESULT
+DESCRIPTOR.message_types_by_name['ApiGetConfigOptionArgs'] = _APIGETCONFIGOPTIONARGS
+DESCRIPTOR.message_types_by_name['ApiListGrrBinariesResult'] = _APILISTGRRBINARIESRESULT
+DESCRIPTOR.message_types_by_name['ApiGetGrrBinaryArgs'] = _APIGETGRRBINARYARGS
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiGrrBinary = _reflection.GeneratedProtocolMessageType('ApiGrrBinary', (_message.Message,), {
+  'DESCRIPTOR' : _APIGRRBINARY,
+  '__module__' : 'grr.proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGrrBinary)
+  })
+_sym_db.RegisterMessage(ApiGrrBinary)
+
+ApiConfigOption = _reflection.GeneratedProtocolMessageType('ApiConfigOption', (_message.Message,), {
+  'DESCRIPTOR' : _APICONFIGOPTION,
+  '__module__' : 'grr.proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiConfigOption)
+  })
+_sym_db.RegisterMessage(ApiConfigOption)
+
+ApiConfigSection = _reflection.GeneratedProtocolMessageType('ApiConfigSection', (_message.Message,), {
+  'DESCRIPTOR' : _APICONFIGSECTION,
+  '__module__' : 'grr.proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiConfigSection)
+  })
+_sym_db.RegisterMessage(ApiConfigSection)
+
+ApiGetConfigResult = _reflection.GeneratedProtocolMessageType('ApiGetConfigResult', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETCONFIGRESULT,
+  '__module__' : 'grr.proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetConfigResult)
+  })
+_sym_db.RegisterMessage(ApiGetConfigResult)
+
+ApiGetConfigOptionArgs = _reflection.GeneratedProtocolMessageType('ApiGetConfigOptionArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETCONFIGOPTIONARGS,
+  '__module__' : 'grr.proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetConfigOptionArgs)
+  })
+_sym_db.RegisterMessage(ApiGetConfigOptionArgs)
+
+ApiListGrrBinariesResult = _reflection.GeneratedProtocolMessageType('ApiListGrrBinariesResult', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTGRRBINARIESRESULT,
+  '__module__' : 'grr.proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListGrrBinariesResult)
+  })
+_sym_db.RegisterMessage(ApiListGrrBinariesResult)
+
+ApiGetGrrBinaryArgs = _reflection.GeneratedProtocolMessageType('ApiGetGrrBinaryArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETGRRBINARYARGS,
+  '__module__' : 'grr.proto.api.config_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetGrrBinaryArgs)
+  })
+_sym_db.RegisterMessage(ApiGetGrrBinaryArgs)
+
+
+_APIGRRBINARY.fields_by_name['type']._options = None
+_APIGRRBINARY.fields_by_name['path']._options = None
+_APIGRRBINARY.fields_by_name['size']._options = None
+_APIGRRBINARY.fields_by_name['timestamp']._options = None
+_APICONFIGOPTION.fields_by_name['value']._options = None
+_APICONFIGOPTION.fields_by_name['type']._options = None
+_APICONFIGOPTION.fields_by_name['is_invalid']._options = None
+_APIGETCONFIGOPTIONARGS.fields_by_name['name']._options = None
+_APIGETGRRBINARYARGS.fields_by_name['type']._options = None
+_APIGETGRRBINARYARGS.fields_by_name['path']._options = None
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,1856 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr/proto/api/flow.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from grr.proto.api import output_plugin_pb2 as grr_dot_proto_dot_api_dot_output__plugin__pb2
+from grr.proto.api import reflection_pb2 as grr_dot_proto_dot_api_dot_reflection__pb2
+from grr.proto import api_utils_pb2 as grr_dot_proto_dot_api__utils__pb2
+from grr.proto import jobs_pb2 as grr_dot_proto_dot_jobs__pb2
+from grr.proto import flows_pb2 as grr_dot_proto_dot_flows__pb2
+from grr.proto import output_plugin_pb2 as grr_dot_proto_dot_output__plugin__pb2
+from grr.proto import semantic_pb2 as grr_dot_proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr/proto/api/flow.proto',
+  package='',
+  syntax='proto2',
+  serialized_options=None,
+  serialized_pb=_b('\n\x18grr/proto/api/flow.proto\x1a\x19google/protobuf/any.proto\x1a!grr/proto/api/output_plugin.proto\x1a\x1egrr/proto/api/reflection.proto\x1a\x19grr/proto/api_utils.proto\x1a\x14grr/proto/jobs.proto\x1a\x15grr/proto/flows.proto\x1a\x1dgrr/proto/output_plugin.proto\x1a\x18grr/proto/semantic.proto\"\x9f\x03\n\x11\x41piFlowDescriptor\x12\x35\n\x04name\x18\x01 \x01(\tB\'\xe2\xfc\xe3\xc4\x01!\x12\x1f\x46low name as registered in GRR.\x12\x32\n\rfriendly_name\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\x12\x13\x46riendly flow name.\x12(\n\x08\x63\x61tegory\x18\x03 \x01(\tB\x16\xe2\xfc\xe3\xc4\x01\x10\x12\x0e\x46low category.\x12/\n\x03\x64oc\x18\x04 \x01(\tB\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1a\x46low documentation string.\x12\x34\n\targs_type\x18\x05 \x01(\tB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19\x46low arguments type name.\x12`\n\x0c\x64\x65\x66\x61ult_args\x18\x06 \x01(\x0b\x32\x14.google.protobuf.AnyB4\xe2\xfc\xe3\xc4\x01.\x12\x17\x44\x65\x66\x61ult flow arguments.*\x13GetDefaultArgsClass\x12,\n\nbehaviours\x18\x07 \x03(\tB\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10\x46low behaviours.\"\xa0\x06\n\x07\x41piFlow\x12)\n\x03urn\x18\x01 \x01(\tB\x1c\xe2\xfc\xe3\xc4\x01\x16\n\tSessionID\x12\tFlow URN.\x12,\n\x07\x66low_id\x18\x0c \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\x12 \n\x04name\x18\x02 \x01(\tB\x12\xe2\xfc\xe3\xc4\x01\x0c\x12\nFlow name.\x12I\n\x04\x61rgs\x18\x03 \x01(\x0b\x32\x14.google.protobuf.AnyB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x0f\x46low arguments.*\x0cGetArgsClass\x12\x44\n\x0brunner_args\x18\x04 \x01(\x0b\x32\x0f.FlowRunnerArgsB\x1e\xe2\xfc\xe3\xc4\x01\x18\x12\x16\x46low runner arguments.\x12:\n\x05state\x18\x05 \x01(\x0e\x32\x0e.ApiFlow.StateB\x1b\xe2\xfc\xe3\xc4\x01\x15\x12\x13\x43urrent flow state.\x12?\n\nstarted_at\x18\x06 \x01(\x04\x42+\xe2\xfc\xe3\xc4\x01%\n\x0bRDFDatetime\x12\x16When flow was created.\x12G\n\x0elast_active_at\x18\x07 \x01(\x04\x42/\xe2\xfc\xe3\xc4\x01)\n\x0bRDFDatetime\x12\x1aWhen flow was last active.\x12.\n\x07\x63reator\x18\x08 \x01(\tB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Who started the flow.\x12\x44\n\nstate_data\x18\n \x01(\x0b\x32\x0e.ApiDataObjectB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18\x43urrent flow state data.\x12<\n\x07\x63ontext\x18\x0b \x01(\x0b\x32\x0c.FlowContextB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15\x43urrent flow context.\x12J\n\x0cnested_flows\x18\t \x03(\x0b\x32\x08.ApiFlowB*\xe2\xfc\xe3\xc4\x01$\x12\"Nested flows started by this flow.\"C\n\x05State\x12\x0b\n\x07RUNNING\x10\x00\x12\x0e\n\nTERMINATED\x10\x01\x12\t\n\x05\x45RROR\x10\x03\x12\x12\n\x0e\x43LIENT_CRASHED\x10\x04\"j\n\x0e\x41piFlowRequest\x12\x12\n\nrequest_id\x18\x01 \x01(\t\x12$\n\rrequest_state\x18\x02 \x01(\x0b\x32\r.RequestState\x12\x1e\n\tresponses\x18\x03 \x03(\x0b\x32\x0b.GrrMessage\"\xfd\x01\n\rApiFlowResult\x12O\n\x07payload\x18\x01 \x01(\x0b\x32\x14.google.protobuf.AnyB(\xe2\xfc\xe3\xc4\x01\"\x12\x0fResult payload.*\x0fGetPayloadClass\x12\x32\n\x0cpayload_type\x18\x02 \x01(\tB\x1c\xe2\xfc\xe3\xc4\x01\x16\x12\x14Type of the payload.\x12g\n\ttimestamp\x18\x03 \x01(\x04\x42T\xe2\xfc\xe3\xc4\x01N\n\x0bRDFDatetime\x12?Timestamp indicating when result was written to the data store.\"r\n\x0e\x41piGetFlowArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\"_\n\x11\x41piCreateFlowArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12\x16\n\x04\x66low\x18\x02 \x01(\x0b\x32\x08.ApiFlow\"u\n\x11\x41piCancelFlowArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\"\xeb\x01\n\x17\x41piListFlowRequestsArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\x12\x36\n\x06offset\x18\x03 \x01(\x03\x42&\xe2\xfc\xe3\xc4\x01 \x12\x1eResults items starting offset.\x12\x36\n\x05\x63ount\x18\x04 \x01(\x03\x42\'\xe2\xfc\xe3\xc4\x01!\x12\x1fMax number of results to fetch.\"Z\n\x19\x41piListFlowRequestsResult\x12=\n\x05items\x18\x01 \x03(\x0b\x32\x0f.ApiFlowRequestB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15\x46low\'s requests list.\"\xcd\x02\n\x16\x41piListFlowResultsArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\x12\x36\n\x06offset\x18\x03 \x01(\x03\x42&\xe2\xfc\xe3\xc4\x01 \x12\x1eResults items starting offset.\x12\x36\n\x05\x63ount\x18\x04 \x01(\x03\x42\'\xe2\xfc\xe3\xc4\x01!\x12\x1fMax number of results to fetch.\x12\x61\n\x06\x66ilter\x18\x05 \x01(\tBQ\xe2\xfc\xe3\xc4\x01K\x12IReturn only results whose string representation contains given substring.\"\x88\x01\n\x18\x41piListFlowResultsResult\x12\x38\n\x05items\x18\x01 \x03(\x0b\x32\x0e.ApiFlowResultB\x19\xe2\xfc\xe3\xc4\x01\x13\x12\x11The flow results.\x12\x32\n\x0btotal_count\x18\x02 \x01(\x03\x42\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Total count of items.\"\xca\x02\n\x13\x41piListFlowLogsArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\x12\x36\n\x06offset\x18\x03 \x01(\x03\x42&\xe2\xfc\xe3\xc4\x01 \x12\x1eResults items starting offset.\x12\x36\n\x05\x63ount\x18\x04 \x01(\x03\x42\'\xe2\xfc\xe3\xc4\x01!\x12\x1fMax number of results to fetch.\x12\x61\n\x06\x66ilter\x18\x05 \x01(\tBQ\xe2\xfc\xe3\xc4\x01K\x12IReturn only results whose string representation contains given substring.\"}\n\x15\x41piListFlowLogsResult\x12\x30\n\x05items\x18\x01 \x03(\x0b\x32\x08.FlowLogB\x17\xe2\xfc\xe3\xc4\x01\x11\x12\x0fThe hunt errors\x12\x32\n\x0btotal_count\x18\x02 \x01(\x03\x42\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Total count of items.\"\x86\x01\n\"ApiGetFlowResultsExportCommandArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\"a\n$ApiGetFlowResultsExportCommandResult\x12\x39\n\x07\x63ommand\x18\x01 \x01(\tB(\xe2\xfc\xe3\xc4\x01\"\x12 Export command for flow results.\"\x80\x01\n\x1c\x41piListFlowOutputPluginsArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\"A\n\x1e\x41piListFlowOutputPluginsResult\x12\x1f\n\x05items\x18\x02 \x03(\x0b\x32\x10.ApiOutputPlugin\"\x93\x02\n\x1f\x41piListFlowOutputPluginLogsArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\x12,\n\tplugin_id\x18\x03 \x01(\tB\x19\xe2\xfc\xe3\xc4\x01\x13\x12\x11Output plugin id.\x12-\n\x06offset\x18\x04 \x01(\x03\x42\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Logs starting offset.\x12\x31\n\x05\x63ount\x18\x05 \x01(\x03\x42\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1aMax number of log entries.\"\xa0\x01\n!ApiListFlowOutputPluginLogsResult\x12G\n\x05items\x18\x01 \x03(\x0b\x32\".OutputPluginBatchProcessingStatusB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0cLog entries.\x12\x32\n\x0btotal_count\x18\x02 \x01(\x03\x42\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Total count of items.\"\x92\x02\n!ApiListFlowOutputPluginErrorsArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\x12,\n\tplugin_id\x18\x03 \x01(\tB\x19\xe2\xfc\xe3\xc4\x01\x13\x12\x11Output plugin id.\x12/\n\x06offset\x18\x04 \x01(\x03\x42\x1f\xe2\xfc\xe3\xc4\x01\x19\x12\x17\x45rrors starting offset.\x12,\n\x05\x63ount\x18\x05 \x01(\x03\x42\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Max number of errors.\"\xa5\x01\n#ApiListFlowOutputPluginErrorsResult\x12J\n\x05items\x18\x01 \x03(\x0b\x32\".OutputPluginBatchProcessingStatusB\x17\xe2\xfc\xe3\xc4\x01\x11\x12\x0f\x45rrors entries.\x12\x32\n\x0btotal_count\x18\x02 \x01(\x03\x42\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Total count of items.\"\xe7\x01\n\x1a\x41piGetFlowFilesArchiveArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\x12\x41\n\x0e\x61rchive_format\x18\x03 \x01(\x0e\x32).ApiGetFlowFilesArchiveArgs.ArchiveFormat\"$\n\rArchiveFormat\x12\x07\n\x03ZIP\x10\x00\x12\n\n\x06TAR_GZ\x10\x01\"\xc3\x01\n\x1a\x41piListFlowDescriptorsArgs\x12\x80\x01\n\tflow_type\x18\x01 \x01(\x0e\x32$.ApiListFlowDescriptorsArgs.FlowTypeBG\xe2\xfc\xe3\xc4\x01\x41\x12?If specified, narrows the list to the given type of flows only.\"\"\n\x08\x46lowType\x12\n\n\x06\x43LIENT\x10\x00\x12\n\n\x06GLOBAL\x10\x01\"A\n\x1c\x41piListFlowDescriptorsResult\x12!\n\x05items\x18\x01 \x03(\x0b\x32\x12.ApiFlowDescriptor\"\xa6\x01\n\x10\x41piListFlowsArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12(\n\x06offset\x18\x02 \x01(\x03\x42\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10Starting offset.\x12\x34\n\x05\x63ount\x18\x03 \x01(\x03\x42%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dMax number of flows to fetch.\"-\n\x12\x41piListFlowsResult\x12\x17\n\x05items\x18\x01 \x03(\x0b\x32\x08.ApiFlow\"\xbb\x01\n\x1d\x41piGetExportedFlowResultsArgs\x12\x32\n\tclient_id\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\n\x0b\x41piClientId\x12\nClient id.\x12,\n\x07\x66low_id\x18\x02 \x01(\tB\x1b\xe2\xfc\xe3\xc4\x01\x15\n\tApiFlowId\x12\x08\x46low id.\x12\x38\n\x0bplugin_name\x18\x03 \x01(\tB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1bInstant output plugin name.\"\xad\x03\n\"ApiStartRobotGetFilesOperationArgs\x12@\n\x08hostname\x18\x01 \x01(\tB.\xe2\xfc\xe3\xc4\x01(\x12&Target host. Can be FQDN or client ID.\x12\x45\n\x05paths\x18\x02 \x03(\tB6\xe2\xfc\xe3\xc4\x01\x30\n\x0eGlobExpression\x12\x1e\x46\x65tch this number of elements.\x12Y\n\rmax_file_size\x18\x03 \x01(\x04:\x08\x32\x30\x30\x30\x30\x30\x30\x30\x42\x38\xe2\xfc\xe3\xc4\x01\x32\n\x08\x42yteSize\x12&Maximum size of file we will download.\x12Z\n\x06\x61\x63tion\x18\x04 \x01(\x0e\x32\x18.FileFinderAction.Action:\x08\x44OWNLOADB&\xe2\xfc\xe3\xc4\x01 \x12\x1e\x41\x63tion to apply to found files\x12G\n\x08pathtype\x18\x05 \x01(\x0e\x32\x12.PathSpec.PathType:\x02OSB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Path type to glob in.\"j\n$ApiStartRobotGetFilesOperationResult\x12\x42\n\x0coperation_id\x18\x01 \x01(\tB,\xe2\xfc\xe3\xc4\x01&\x12$The id of the \'get files\' operation.\"k\n%ApiGetRobotGetFilesOperationStateArgs\x12\x42\n\x0coperation_id\x18\x01 \x01(\tB,\xe2\xfc\xe3\xc4\x01&\x12$The id of the \'get files\' operation.\"\xbe\x01\n\'ApiGetRobotGetFilesOperationStateResult\x12N\n\x05state\x18\x01 \x01(\x0e\x32\x0e.ApiFlow.StateB/\xe2\xfc\xe3\xc4\x01)\x12\'The state of the \'get files\' operation.\x12\x43\n\x0cresult_count\x18\x02 \x01(\x04\x42-\xe2\xfc\xe3\xc4\x01\'\x12%Number of files found and downloaded.')
+  ,
+  dependencies=[google_dot_protobuf_dot_any__pb2.DESCRIPTOR,grr_dot_proto_dot_api_dot_output__plugin__pb2.DESCRIPTOR,grr_dot_proto_dot_api_dot_reflection__pb2.DESCRIPTOR,grr_dot_proto_dot_api__utils__pb2.DESCRIPTOR,grr_dot_proto_dot_jobs__pb2.DESCRIPTOR,grr_dot_proto_dot_flows__pb2.DESCRIPTOR,grr_dot_proto_dot_output__plugin__pb2.DESCRIPTOR,grr_dot_proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_APIFLOW_STATE = _descriptor.EnumDescriptor(
+  name='State',
+  full_name='ApiFlow.State',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='RUNNING', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TERMINATED', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ERROR', index=2, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CLIENT_CRASHED', index=3, number=4,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=1403,
+  serialized_end=1470,
+)
+_sym_db.RegisterEnumDescriptor(_APIFLOW_STATE)
+
+_APIGETFLOWFILESARCHIVEARGS_ARCHIVEFORMAT = _descriptor.EnumDescriptor(
+  name='ArchiveFormat',
+  full_name='ApiGetFlowFilesArchiveArgs.ArchiveFormat',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='ZIP', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TAR_GZ', index=1, number=1,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=4949,
+  serialized_end=4985,
+)
+_sym_db.RegisterEnumDescriptor(_APIGETFLOWFILESARCHIVEARGS_ARCHIVEFORMAT)
+
+_APILISTFLOWDESCRIPTORSARGS_FLOWTYPE = _descriptor.EnumDescriptor(
+  name='FlowType',
+  full_name='ApiListFlowDescriptorsArgs.FlowType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='CLIENT', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GLOBAL', index=1, number=1,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=5149,
+  serialized_end=5183,
+)
+_sym_db.RegisterEnumDescriptor(_APILISTFLOWDESCRIPTORSARGS_FLOWTYPE)
+
+
+_APIFLOWDESCRIPTOR = _descriptor.Descriptor(
+  name='ApiFlowDescriptor',
+  full_name='ApiFlowDescriptor',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiFlowDescriptor.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001!\022\037Flow name as registered in GRR.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='friendly_name', full_name='ApiFlowDescriptor.friendly_name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\022\023Friendly flow name.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='category', full_name='ApiFlowDescriptor.category', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\020\022\016Flow category.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='doc', full_name='ApiFlowDescriptor.doc', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\034\022\032Flow documentation string.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='args_type', full_name='ApiFlowDescriptor.args_type', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\033\022\031Flow arguments type name.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='default_args', full_name='ApiFlowDescriptor.default_args', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001.\022\027Default flow arguments.*\023GetDefaultArgsClass'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='behaviours', full_name='ApiFlowDescriptor.behaviours', index=6,
+      number=7, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\022\022\020Flow behaviours.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=252,
+  serialized_end=667,
+)
+
+
+_APIFLOW = _descriptor.Descriptor(
+  name='ApiFlow',
+  full_name='ApiFlow',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='urn', full_name='ApiFlow.urn', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\026\n\tSessionID\022\tFlow URN.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiFlow.flow_id', index=1,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ApiFlow.name', index=2,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\014\022\nFlow name.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='args', full_name='ApiFlow.args', index=3,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\017Flow arguments.*\014GetArgsClass'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='runner_args', full_name='ApiFlow.runner_args', index=4,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\030\022\026Flow runner arguments.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='ApiFlow.state', index=5,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\022\023Current flow state.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='started_at', full_name='ApiFlow.started_at', index=6,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\n\013RDFDatetime\022\026When flow was created.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='last_active_at', full_name='ApiFlow.last_active_at', index=7,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001)\n\013RDFDatetime\022\032When flow was last active.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='creator', full_name='ApiFlow.creator', index=8,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Who started the flow.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state_data', full_name='ApiFlow.state_data', index=9,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030Current flow state data.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='context', full_name='ApiFlow.context', index=10,
+      number=11, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Current flow context.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nested_flows', full_name='ApiFlow.nested_flows', index=11,
+      number=9, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001$\022\"Nested flows started by this flow.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIFLOW_STATE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=670,
+  serialized_end=1470,
+)
+
+
+_APIFLOWREQUEST = _descriptor.Descriptor(
+  name='ApiFlowRequest',
+  full_name='ApiFlowRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='request_id', full_name='ApiFlowRequest.request_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='request_state', full_name='ApiFlowRequest.request_state', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='responses', full_name='ApiFlowRequest.responses', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1472,
+  serialized_end=1578,
+)
+
+
+_APIFLOWRESULT = _descriptor.Descriptor(
+  name='ApiFlowResult',
+  full_name='ApiFlowResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='payload', full_name='ApiFlowResult.payload', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\"\022\017Result payload.*\017GetPayloadClass'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='payload_type', full_name='ApiFlowResult.payload_type', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\026\022\024Type of the payload.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timestamp', full_name='ApiFlowResult.timestamp', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001N\n\013RDFDatetime\022?Timestamp indicating when result was written to the data store.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1581,
+  serialized_end=1834,
+)
+
+
+_APIGETFLOWARGS = _descriptor.Descriptor(
+  name='ApiGetFlowArgs',
+  full_name='ApiGetFlowArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetFlowArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiGetFlowArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1836,
+  serialized_end=1950,
+)
+
+
+_APICREATEFLOWARGS = _descriptor.Descriptor(
+  name='ApiCreateFlowArgs',
+  full_name='ApiCreateFlowArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiCreateFlowArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow', full_name='ApiCreateFlowArgs.flow', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1952,
+  serialized_end=2047,
+)
+
+
+_APICANCELFLOWARGS = _descriptor.Descriptor(
+  name='ApiCancelFlowArgs',
+  full_name='ApiCancelFlowArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiCancelFlowArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiCancelFlowArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2049,
+  serialized_end=2166,
+)
+
+
+_APILISTFLOWREQUESTSARGS = _descriptor.Descriptor(
+  name='ApiListFlowRequestsArgs',
+  full_name='ApiListFlowRequestsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiListFlowRequestsArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiListFlowRequestsArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiListFlowRequestsArgs.offset', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001 \022\036Results items starting offset.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='ApiListFlowRequestsArgs.count', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001!\022\037Max number of results to fetch.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2169,
+  serialized_end=2404,
+)
+
+
+_APILISTFLOWREQUESTSRESULT = _descriptor.Descriptor(
+  name='ApiListFlowRequestsResult',
+  full_name='ApiListFlowRequestsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListFlowRequestsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Flow\'s requests list.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2406,
+  serialized_end=2496,
+)
+
+
+_APILISTFLOWRESULTSARGS = _descriptor.Descriptor(
+  name='ApiListFlowResultsArgs',
+  full_name='ApiListFlowResultsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiListFlowResultsArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiListFlowResultsArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiListFlowResultsArgs.offset', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001 \022\036Results items starting offset.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='ApiListFlowResultsArgs.count', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001!\022\037Max number of results to fetch.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='ApiListFlowResultsArgs.filter', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001K\022IReturn only results whose string representation contains given substring.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2499,
+  serialized_end=2832,
+)
+
+
+_APILISTFLOWRESULTSRESULT = _descriptor.Descriptor(
+  name='ApiListFlowResultsResult',
+  full_name='ApiListFlowResultsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListFlowResultsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\023\022\021The flow results.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total_count', full_name='ApiListFlowResultsResult.total_count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Total count of items.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2835,
+  serialized_end=2971,
+)
+
+
+_APILISTFLOWLOGSARGS = _descriptor.Descriptor(
+  name='ApiListFlowLogsArgs',
+  full_name='ApiListFlowLogsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiListFlowLogsArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiListFlowLogsArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiListFlowLogsArgs.offset', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001 \022\036Results items starting offset.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='ApiListFlowLogsArgs.count', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001!\022\037Max number of results to fetch.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='ApiListFlowLogsArgs.filter', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001K\022IReturn only results whose string representation contains given substring.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2974,
+  serialized_end=3304,
+)
+
+
+_APILISTFLOWLOGSRESULT = _descriptor.Descriptor(
+  name='ApiListFlowLogsResult',
+  full_name='ApiListFlowLogsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListFlowLogsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\021\022\017The hunt errors'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total_count', full_name='ApiListFlowLogsResult.total_count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Total count of items.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3306,
+  serialized_end=3431,
+)
+
+
+_APIGETFLOWRESULTSEXPORTCOMMANDARGS = _descriptor.Descriptor(
+  name='ApiGetFlowResultsExportCommandArgs',
+  full_name='ApiGetFlowResultsExportCommandArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetFlowResultsExportCommandArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiGetFlowResultsExportCommandArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3434,
+  serialized_end=3568,
+)
+
+
+_APIGETFLOWRESULTSEXPORTCOMMANDRESULT = _descriptor.Descriptor(
+  name='ApiGetFlowResultsExportCommandResult',
+  full_name='ApiGetFlowResultsExportCommandResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='command', full_name='ApiGetFlowResultsExportCommandResult.command', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\"\022 Export command for flow results.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3570,
+  serialized_end=3667,
+)
+
+
+_APILISTFLOWOUTPUTPLUGINSARGS = _descriptor.Descriptor(
+  name='ApiListFlowOutputPluginsArgs',
+  full_name='ApiListFlowOutputPluginsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiListFlowOutputPluginsArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiListFlowOutputPluginsArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3670,
+  serialized_end=3798,
+)
+
+
+_APILISTFLOWOUTPUTPLUGINSRESULT = _descriptor.Descriptor(
+  name='ApiListFlowOutputPluginsResult',
+  full_name='ApiListFlowOutputPluginsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListFlowOutputPluginsResult.items', index=0,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3800,
+  serialized_end=3865,
+)
+
+
+_APILISTFLOWOUTPUTPLUGINLOGSARGS = _descriptor.Descriptor(
+  name='ApiListFlowOutputPluginLogsArgs',
+  full_name='ApiListFlowOutputPluginLogsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiListFlowOutputPluginLogsArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiListFlowOutputPluginLogsArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='plugin_id', full_name='ApiListFlowOutputPluginLogsArgs.plugin_id', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\023\022\021Output plugin id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiListFlowOutputPluginLogsArgs.offset', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Logs starting offset.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='ApiListFlowOutputPluginLogsArgs.count', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\034\022\032Max number of log entries.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=3868,
+  serialized_end=4143,
+)
+
+
+_APILISTFLOWOUTPUTPLUGINLOGSRESULT = _descriptor.Descriptor(
+  name='ApiListFlowOutputPluginLogsResult',
+  full_name='ApiListFlowOutputPluginLogsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListFlowOutputPluginLogsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\016\022\014Log entries.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total_count', full_name='ApiListFlowOutputPluginLogsResult.total_count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Total count of items.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4146,
+  serialized_end=4306,
+)
+
+
+_APILISTFLOWOUTPUTPLUGINERRORSARGS = _descriptor.Descriptor(
+  name='ApiListFlowOutputPluginErrorsArgs',
+  full_name='ApiListFlowOutputPluginErrorsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiListFlowOutputPluginErrorsArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiListFlowOutputPluginErrorsArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='plugin_id', full_name='ApiListFlowOutputPluginErrorsArgs.plugin_id', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\023\022\021Output plugin id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiListFlowOutputPluginErrorsArgs.offset', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\022\027Errors starting offset.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='ApiListFlowOutputPluginErrorsArgs.count', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Max number of errors.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4309,
+  serialized_end=4583,
+)
+
+
+_APILISTFLOWOUTPUTPLUGINERRORSRESULT = _descriptor.Descriptor(
+  name='ApiListFlowOutputPluginErrorsResult',
+  full_name='ApiListFlowOutputPluginErrorsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListFlowOutputPluginErrorsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\021\022\017Errors entries.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total_count', full_name='ApiListFlowOutputPluginErrorsResult.total_count', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Total count of items.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4586,
+  serialized_end=4751,
+)
+
+
+_APIGETFLOWFILESARCHIVEARGS = _descriptor.Descriptor(
+  name='ApiGetFlowFilesArchiveArgs',
+  full_name='ApiGetFlowFilesArchiveArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetFlowFilesArchiveArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiGetFlowFilesArchiveArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='archive_format', full_name='ApiGetFlowFilesArchiveArgs.archive_format', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APIGETFLOWFILESARCHIVEARGS_ARCHIVEFORMAT,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4754,
+  serialized_end=4985,
+)
+
+
+_APILISTFLOWDESCRIPTORSARGS = _descriptor.Descriptor(
+  name='ApiListFlowDescriptorsArgs',
+  full_name='ApiListFlowDescriptorsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='flow_type', full_name='ApiListFlowDescriptorsArgs.flow_type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001A\022?If specified, narrows the list to the given type of flows only.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _APILISTFLOWDESCRIPTORSARGS_FLOWTYPE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4988,
+  serialized_end=5183,
+)
+
+
+_APILISTFLOWDESCRIPTORSRESULT = _descriptor.Descriptor(
+  name='ApiListFlowDescriptorsResult',
+  full_name='ApiListFlowDescriptorsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListFlowDescriptorsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5185,
+  serialized_end=5250,
+)
+
+
+_APILISTFLOWSARGS = _descriptor.Descriptor(
+  name='ApiListFlowsArgs',
+  full_name='ApiListFlowsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiListFlowsArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='ApiListFlowsArgs.offset', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\022\022\020Starting offset.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='count', full_name='ApiListFlowsArgs.count', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035Max number of flows to fetch.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5253,
+  serialized_end=5419,
+)
+
+
+_APILISTFLOWSRESULT = _descriptor.Descriptor(
+  name='ApiListFlowsResult',
+  full_name='ApiListFlowsResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiListFlowsResult.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5421,
+  serialized_end=5466,
+)
+
+
+_APIGETEXPORTEDFLOWRESULTSARGS = _descriptor.Descriptor(
+  name='ApiGetExportedFlowResultsArgs',
+  full_name='ApiGetExportedFlowResultsArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='client_id', full_name='ApiGetExportedFlowResultsArgs.client_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\n\013ApiClientId\022\nClient id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='flow_id', full_name='ApiGetExportedFlowResultsArgs.flow_id', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\n\tApiFlowId\022\010Flow id.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='plugin_name', full_name='ApiGetExportedFlowResultsArgs.plugin_name', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\035\022\033Instant output plugin name.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5469,
+  serialized_end=5656,
+)
+
+
+_APISTARTROBOTGETFILESOPERATIONARGS = _descriptor.Descriptor(
+  name='ApiStartRobotGetFilesOperationArgs',
+  full_name='ApiStartRobotGetFilesOperationArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='hostname', full_name='ApiStartRobotGetFilesOperationArgs.hostname', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001(\022&Target host. Can be FQDN or client ID.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='paths', full_name='ApiStartRobotGetFilesOperationArgs.paths', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0010\n\016GlobExpression\022\036Fetch this number of elements.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max_file_size', full_name='ApiStartRobotGetFilesOperationArgs.max_file_size', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=True, default_value=20000000,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0012\n\010ByteSize\022&Maximum size of file we will download.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='action', full_name='ApiStartRobotGetFilesOperationArgs.action', index=3,
+      number=4, type=14, cpp_type=8, label=1,
+      has_default_value=True, default_value=2,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001 \022\036Action to apply to found files'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pathtype', full_name='ApiStartRobotGetFilesOperationArgs.pathtype', index=4,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=True, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Path type to glob in.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5659,
+  serialized_end=6088,
+)
+
+
+_APISTARTROBOTGETFILESOPERATIONRESULT = _descriptor.Descriptor(
+  name='ApiStartRobotGetFilesOperationResult',
+  full_name='ApiStartRobotGetFilesOperationResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='operation_id', full_name='ApiStartRobotGetFilesOperationResult.operation_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001&\022$The id of the \'get files\' operation.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6090,
+  serialized_end=6196,
+)
+
+
+_APIGETROBOTGETFILESOPERATIONSTATEARGS = _descriptor.Descriptor(
+  name='ApiGetRobotGetFilesOperationStateArgs',
+  full_name='ApiGetRobotGetFilesOperationStateArgs',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='operation_id', full_name='ApiGetRobotGetFilesOperationStateArgs.operation_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001&\022$The id of the \'get files\' operation.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6198,
+  serialized_end=6305,
+)
+
+
+_APIGETROBOTGETFILESOPERATIONSTATERESULT = _descriptor.Descriptor(
+  name='ApiGetRobotGetFilesOperationStateResult',
+  full_name='ApiGetRobotGetFilesOperationStateResult',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='state', full_name='ApiGetRobotGetFilesOperationStateResult.state', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001)\022\'The state of the \'get files\' operation.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='result_count', full_name='ApiGetRobotGetFilesOperationStateResult.result_count', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\'\022%Number of files found and downloaded.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6308,
+  serialized_end=6498,
+)
+
+_APIFLOWDESCRIPTOR.fields_by_name['default_args'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_APIFLOW.fields_by_name['args'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_APIFLOW.fields_by_name['runner_args'].message_type = grr_dot_proto_dot_flows__pb2._FLOWRUNNERARGS
+_APIFLOW.fields_by_name['state'].enum_type = _APIFLOW_STATE
+_APIFLOW.fields_by_name['state_data'].message_type = grr_dot_proto_dot_api__utils__pb2._APIDATAOBJECT
+_APIFLOW.fields_by_name['context'].message_type = grr_dot_proto_dot_flows__pb2._FLOWCONTEXT
+_APIFLOW.fields_by_name['nested_flows'].message_type = _APIFLOW
+_APIFLOW_STATE.containing_type = _APIFLOW
+_APIFLOWREQUEST.fields_by_name['request_state'].message_type = grr_dot_proto_dot_jobs__pb2._REQUESTSTATE
+_APIFLOWREQUEST.fields_by_name['responses'].message_type = grr_dot_proto_dot_jobs__pb2._GRRMESSAGE
+_APIFLOWRESULT.fields_by_name['payload'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_APICREATEFLOWARGS.fields_by_name['flow'].message_type = _APIFLOW
+_APILISTFLOWREQUESTSRESULT.fields_by_name['items'].message_type = _APIFLOWREQUEST
+_APILISTFLOWRESULTSRESULT.fields_by_name['items'].message_type = _APIFLOWRESULT
+_APILISTFLOWLOGSRESULT.fields_by_name['items'].message_type = grr_dot_proto_dot_jobs__pb2._FLOWLOG
+_APILISTFLOWOUTPUTPLUGINSRESULT.fields_by_name['items'].message_type = grr_dot_proto_dot_api_dot_output__plugin__pb2._APIOUTPUTPLUGIN
+_APILISTFLOWOUTPUTPLUGINLOGSRESULT.fields_by_name['items'].message_type = grr_dot_proto_dot_output__plugin__pb2._OUTPUTPLUGINBATCHPROCESSINGSTATUS
+_APILISTFLOWOUTPUTPLUGINERRORSRESULT.fields_by_name['items'].message_type = grr_dot_proto_dot_output__plugin__pb2._OUTPUTPLUGINBATCHPROCESSINGSTATUS
+_APIGETFLOWFILESARCHIVEARGS.fields_by_name['archive_format'].enum_type = _APIGETFLOWFILESARCHIVEARGS_ARCHIVEFORMAT
+_APIGETFLOWFILESARCHIVEARGS_ARCHIVEFORMAT.containing_type = _APIGETFLOWFILESARCHIVEARGS
+_APILISTFLOWDESCRIPTORSARGS.fields_by_name['flow_type'].enum_type = _APILISTFLOWDESCRIPTORSARGS_FLOWTYPE
+_APILISTFLOWDESCRIPTORSARGS_FLOWTYPE.containing_type = _APILISTFLOWDESCRIPTORSARGS
+_APILISTFLOWDESCRIPTORSRESULT.fields_by_name['items'].message_type = _APIFLOWDESCRIPTOR
+_APILISTFLOWSRESULT.fields_by_name['items'].message_type = _APIFLOW
+_APISTARTROBOTGETFILESOPERATIONARGS.fields_by_name['action'].enum_type = grr_dot_proto_dot_flows__pb2._FILEFINDERACTION_ACTION
+_APISTARTROBOTGETFILESOPERATIONARGS.fields_by_name['pathtype'].enum_type = grr_dot_proto_dot_jobs__pb2._PATHSPEC_PATHTYPE
+_APIGETROBOTGETFILESOPERATIONSTATERESULT.fields_by_name['state'].enum_type = _APIFLOW_STATE
+DESCRIPTOR.message_types_by_name['ApiFlowDescriptor'] = _APIFLOWDESCRIPTOR
+DESCRIPTOR.message_types_by_name['ApiFlow'] = _APIFLOW
+DESCRIPTOR.message_types_by_name['ApiFlowRequest'] = _APIFLOWREQUEST
+DESCRIPTOR.message_types_by_name['ApiFlowResult'] = _APIFLOWRESULT
+DESCRIPTOR.message_types_by_name['ApiGetFlowArgs'] = _APIGETFLOWARGS
+DESCRIPTOR.message_types_by_name['ApiCreateFlowArgs'] = _APICREATEFLOWARGS
+DESCRIPTOR.message_types_by_name['ApiCancelFlowArgs'] = _APICANCELFLOWARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowRequestsArgs'] = _APILISTFLOWREQUESTSARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowRequestsResult'] = _APILISTFLOWREQUESTSRESULT
+DESCRIPTOR.message_types_by_name['ApiListFlowResultsArgs'] = _APILISTFLOWRESULTSARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowResultsResult'] = _APILISTFLOWRESULTSRESULT
+DESCRIPTOR.message_types_by_name['ApiListFlowLogsArgs'] = _APILISTFLOWLOGSARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowLogsResult'] = _APILISTFLOWLOGSRESULT
+DESCRIPTOR.message_types_by_name['ApiGetFlowResultsExportCommandArgs'] = _APIGETFLOWRESULTSEXPORTCOMMANDARGS
+DESCRIPTOR.message_types_by_name['ApiGetFlowResultsExportCommandResult'] = _APIGETFLOWRESULTSEXPORTCOMMANDRESULT
+DESCRIPTOR.message_types_by_name['ApiListFlowOutputPluginsArgs'] = _APILISTFLOWOUTPUTPLUGINSARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowOutputPluginsResult'] = _APILISTFLOWOUTPUTPLUGINSRESULT
+DESCRIPTOR.message_types_by_name['ApiListFlowOutputPluginLogsArgs'] = _APILISTFLOWOUTPUTPLUGINLOGSARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowOutputPluginLogsResult'] = _APILISTFLOWOUTPUTPLUGINLOGSRESULT
+DESCRIPTOR.message_types_by_name['ApiListFlowOutputPluginErrorsArgs'] = _APILISTFLOWOUTPUTPLUGINERRORSARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowOutputPluginErrorsResult'] = _APILISTFLOWOUTPUTPLUGINERRORSRESULT
+DESCRIPTOR.message_types_by_name['ApiGetFlowFilesArchiveArgs'] = _APIGETFLOWFILESARCHIVEARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowDescriptorsArgs'] = _APILISTFLOWDESCRIPTORSARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowDescriptorsResult'] = _APILISTFLOWDESCRIPTORSRESULT
+DESCRIPTOR.message_types_by_name['ApiListFlowsArgs'] = _APILISTFLOWSARGS
+DESCRIPTOR.message_types_by_name['ApiListFlowsResult'] = _APILISTFLOWSRESULT
+DESCRIPTOR.message_types_by_name['ApiGetExportedFlowResultsArgs'] = _APIGETEXPORTEDFLOWRESULTSARGS
+DESCRIPTOR.message_types_by_name['ApiStartRobotGetFilesOperationArgs'] = _APISTARTROBOTGETFILESOPERATIONARGS
+DESCRIPTOR.message_types_by_name['ApiStartRobotGetFilesOperationResult'] = _APISTARTROBOTGETFILESOPERATIONRESULT
+DESCRIPTOR.message_types_by_name['ApiGetRobotGetFilesOperationStateArgs'] = _APIGETROBOTGETFILESOPERATIONSTATEARGS
+DESCRIPTOR.message_types_by_name['ApiGetRobotGetFilesOperationStateResult'] = _APIGETROBOTGETFILESOPERATIONSTATERESULT
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiFlowDescriptor = _reflection.GeneratedProtocolMessageType('ApiFlowDescriptor', (_message.Message,), {
+  'DESCRIPTOR' : _APIFLOWDESCRIPTOR,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiFlowDescriptor)
+  })
+_sym_db.RegisterMessage(ApiFlowDescriptor)
+
+ApiFlow = _reflection.GeneratedProtocolMessageType('ApiFlow', (_message.Message,), {
+  'DESCRIPTOR' : _APIFLOW,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiFlow)
+  })
+_sym_db.RegisterMessage(ApiFlow)
+
+ApiFlowRequest = _reflection.GeneratedProtocolMessageType('ApiFlowRequest', (_message.Message,), {
+  'DESCRIPTOR' : _APIFLOWREQUEST,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiFlowRequest)
+  })
+_sym_db.RegisterMessage(ApiFlowRequest)
+
+ApiFlowResult = _reflection.GeneratedProtocolMessageType('ApiFlowResult', (_message.Message,), {
+  'DESCRIPTOR' : _APIFLOWRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiFlowResult)
+  })
+_sym_db.RegisterMessage(ApiFlowResult)
+
+ApiGetFlowArgs = _reflection.GeneratedProtocolMessageType('ApiGetFlowArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETFLOWARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFlowArgs)
+  })
+_sym_db.RegisterMessage(ApiGetFlowArgs)
+
+ApiCreateFlowArgs = _reflection.GeneratedProtocolMessageType('ApiCreateFlowArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APICREATEFLOWARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiCreateFlowArgs)
+  })
+_sym_db.RegisterMessage(ApiCreateFlowArgs)
+
+ApiCancelFlowArgs = _reflection.GeneratedProtocolMessageType('ApiCancelFlowArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APICANCELFLOWARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiCancelFlowArgs)
+  })
+_sym_db.RegisterMessage(ApiCancelFlowArgs)
+
+ApiListFlowRequestsArgs = _reflection.GeneratedProtocolMessageType('ApiListFlowRequestsArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWREQUESTSARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowRequestsArgs)
+  })
+_sym_db.RegisterMessage(ApiListFlowRequestsArgs)
+
+ApiListFlowRequestsResult = _reflection.GeneratedProtocolMessageType('ApiListFlowRequestsResult', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWREQUESTSRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowRequestsResult)
+  })
+_sym_db.RegisterMessage(ApiListFlowRequestsResult)
+
+ApiListFlowResultsArgs = _reflection.GeneratedProtocolMessageType('ApiListFlowResultsArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWRESULTSARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowResultsArgs)
+  })
+_sym_db.RegisterMessage(ApiListFlowResultsArgs)
+
+ApiListFlowResultsResult = _reflection.GeneratedProtocolMessageType('ApiListFlowResultsResult', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWRESULTSRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowResultsResult)
+  })
+_sym_db.RegisterMessage(ApiListFlowResultsResult)
+
+ApiListFlowLogsArgs = _reflection.GeneratedProtocolMessageType('ApiListFlowLogsArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWLOGSARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowLogsArgs)
+  })
+_sym_db.RegisterMessage(ApiListFlowLogsArgs)
+
+ApiListFlowLogsResult = _reflection.GeneratedProtocolMessageType('ApiListFlowLogsResult', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWLOGSRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowLogsResult)
+  })
+_sym_db.RegisterMessage(ApiListFlowLogsResult)
+
+ApiGetFlowResultsExportCommandArgs = _reflection.GeneratedProtocolMessageType('ApiGetFlowResultsExportCommandArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETFLOWRESULTSEXPORTCOMMANDARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFlowResultsExportCommandArgs)
+  })
+_sym_db.RegisterMessage(ApiGetFlowResultsExportCommandArgs)
+
+ApiGetFlowResultsExportCommandResult = _reflection.GeneratedProtocolMessageType('ApiGetFlowResultsExportCommandResult', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETFLOWRESULTSEXPORTCOMMANDRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFlowResultsExportCommandResult)
+  })
+_sym_db.RegisterMessage(ApiGetFlowResultsExportCommandResult)
+
+ApiListFlowOutputPluginsArgs = _reflection.GeneratedProtocolMessageType('ApiListFlowOutputPluginsArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWOUTPUTPLUGINSARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowOutputPluginsArgs)
+  })
+_sym_db.RegisterMessage(ApiListFlowOutputPluginsArgs)
+
+ApiListFlowOutputPluginsResult = _reflection.GeneratedProtocolMessageType('ApiListFlowOutputPluginsResult', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWOUTPUTPLUGINSRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowOutputPluginsResult)
+  })
+_sym_db.RegisterMessage(ApiListFlowOutputPluginsResult)
+
+ApiListFlowOutputPluginLogsArgs = _reflection.GeneratedProtocolMessageType('ApiListFlowOutputPluginLogsArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWOUTPUTPLUGINLOGSARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowOutputPluginLogsArgs)
+  })
+_sym_db.RegisterMessage(ApiListFlowOutputPluginLogsArgs)
+
+ApiListFlowOutputPluginLogsResult = _reflection.GeneratedProtocolMessageType('ApiListFlowOutputPluginLogsResult', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWOUTPUTPLUGINLOGSRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowOutputPluginLogsResult)
+  })
+_sym_db.RegisterMessage(ApiListFlowOutputPluginLogsResult)
+
+ApiListFlowOutputPluginErrorsArgs = _reflection.GeneratedProtocolMessageType('ApiListFlowOutputPluginErrorsArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWOUTPUTPLUGINERRORSARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowOutputPluginErrorsArgs)
+  })
+_sym_db.RegisterMessage(ApiListFlowOutputPluginErrorsArgs)
+
+ApiListFlowOutputPluginErrorsResult = _reflection.GeneratedProtocolMessageType('ApiListFlowOutputPluginErrorsResult', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWOUTPUTPLUGINERRORSRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowOutputPluginErrorsResult)
+  })
+_sym_db.RegisterMessage(ApiListFlowOutputPluginErrorsResult)
+
+ApiGetFlowFilesArchiveArgs = _reflection.GeneratedProtocolMessageType('ApiGetFlowFilesArchiveArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETFLOWFILESARCHIVEARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetFlowFilesArchiveArgs)
+  })
+_sym_db.RegisterMessage(ApiGetFlowFilesArchiveArgs)
+
+ApiListFlowDescriptorsArgs = _reflection.GeneratedProtocolMessageType('ApiListFlowDescriptorsArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWDESCRIPTORSARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowDescriptorsArgs)
+  })
+_sym_db.RegisterMessage(ApiListFlowDescriptorsArgs)
+
+ApiListFlowDescriptorsResult = _reflection.GeneratedProtocolMessageType('ApiListFlowDescriptorsResult', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWDESCRIPTORSRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowDescriptorsResult)
+  })
+_sym_db.RegisterMessage(ApiListFlowDescriptorsResult)
+
+ApiListFlowsArgs = _reflection.GeneratedProtocolMessageType('ApiListFlowsArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWSARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowsArgs)
+  })
+_sym_db.RegisterMessage(ApiListFlowsArgs)
+
+ApiListFlowsResult = _reflection.GeneratedProtocolMessageType('ApiListFlowsResult', (_message.Message,), {
+  'DESCRIPTOR' : _APILISTFLOWSRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiListFlowsResult)
+  })
+_sym_db.RegisterMessage(ApiListFlowsResult)
+
+ApiGetExportedFlowResultsArgs = _reflection.GeneratedProtocolMessageType('ApiGetExportedFlowResultsArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETEXPORTEDFLOWRESULTSARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetExportedFlowResultsArgs)
+  })
+_sym_db.RegisterMessage(ApiGetExportedFlowResultsArgs)
+
+ApiStartRobotGetFilesOperationArgs = _reflection.GeneratedProtocolMessageType('ApiStartRobotGetFilesOperationArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APISTARTROBOTGETFILESOPERATIONARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiStartRobotGetFilesOperationArgs)
+  })
+_sym_db.RegisterMessage(ApiStartRobotGetFilesOperationArgs)
+
+ApiStartRobotGetFilesOperationResult = _reflection.GeneratedProtocolMessageType('ApiStartRobotGetFilesOperationResult', (_message.Message,), {
+  'DESCRIPTOR' : _APISTARTROBOTGETFILESOPERATIONRESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiStartRobotGetFilesOperationResult)
+  })
+_sym_db.RegisterMessage(ApiStartRobotGetFilesOperationResult)
+
+ApiGetRobotGetFilesOperationStateArgs = _reflection.GeneratedProtocolMessageType('ApiGetRobotGetFilesOperationStateArgs', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETROBOTGETFILESOPERATIONSTATEARGS,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetRobotGetFilesOperationStateArgs)
+  })
+_sym_db.RegisterMessage(ApiGetRobotGetFilesOperationStateArgs)
+
+ApiGetRobotGetFilesOperationStateResult = _reflection.GeneratedProtocolMessageType('ApiGetRobotGetFilesOperationStateResult', (_message.Message,), {
+  'DESCRIPTOR' : _APIGETROBOTGETFILESOPERATIONSTATERESULT,
+  '__module__' : 'grr.proto.api.flow_pb2'
+  # @@protoc_insertion_point(class_scope:ApiGetRobotGetFilesOperationStateResult)
+  })
+_sym_db.RegisterMessage(ApiGetRobotGetFilesOperationStateResult)
+
+
+_APIFLOWDESCRIPTOR.fields_by_name['name']._options = None
+_APIFLOWDESCRIPTOR.fields_by_name['friendly_name']._options = None
+_APIFLOWDESCRIPTOR.fields_by_name['category']._options = None
+_APIFLOWDESCRIPTOR.fields_by_name['doc']._options = None
+_APIFLOWDESCRIPTOR.fields_by_name['args_type']._options = None
+_APIFLOWDESCRIPTOR.fields_by_name['default_args']._options = None
+_APIFLOWDESCRIPTOR.fields_by_name['behaviours']._options = None
+_APIFLOW.fields_by_name['urn']._options = None
+_APIFLOW.fields_by_name['flow_id']._options = None
+_APIFLOW.fields_by_name['name']._options = None
+_APIFLOW.fields_by_name['args']._options = None
+_APIFLOW.fields_by_name['runner_args']._options = None
+_APIFLOW.fields_by_name['state']._options = None
+_APIFLOW.fields_by_name['started_at']._options = None
+_APIFLOW.fields_by_name['last_active_at']._options = None
+_APIFLOW.fields_by_name['creator']._options = None
+_APIFLOW.fields_by_name['state_data']._options = None
+_APIFLOW.fields_by_name['context']._options = None
+_APIFLOW.fields_by_name['nested_flows']._options = None
+_APIFLOWRESULT.fields_by_name['payload']._options = None
+_APIFLOWRESULT.fields_by_name['payload_type']._options = None
+_APIFLOWRESULT.fields_by_name['timestamp']._options = None
+_APIGETFLOWARGS.fields_by_name['client_id']._options = None
+_APIGETFLOWARGS.fields_by_name['flow_id']._options = None
+_APICREATEFLOWARGS.fields_by_name['client_id']._options = None
+_APICANCELFLOWARGS.fields_by_name['client_id']._options = None
+_APICANCELFLOWARGS.fields_by_name['flow_id']._options = None
+_APILISTFLOWREQUESTSARGS.fields_by_name['client_id']._options = None
+_APILISTFLOWREQUESTSARGS.fields_by_name['flow_id']._options = None
+_APILISTFLOWREQUESTSARGS.fields_by_name['offset']._options = None
+_APILISTFLOWREQUESTSARGS.fields_by_name['count']._options = None
+_APILISTFLOWREQUESTSRESULT.fields_by_name['items']._options = None
+_APILISTFLOWRESULTSARGS.fields_by_name['client_id']._options = None
+_APILISTFLOWRESULTSARGS.fields_by_name['flow_id']._options = None
+_APILISTFLOWRESULTSARGS.fields_by_name['offset']._options = None
+_APILISTFLOWRESULTSARGS.fields_by_name['count']._options = None
+_APILISTFLOWRESULTSARGS.fields_by_name['filter']._options = None
+_APILISTFLOWRESULTSRESULT.fields_by_name['items']._options = None
+_APILISTFLOWRESULTSRESULT.fields_by_name['total_count']._options = None
+_APILISTFLOWLOGSARGS.fields_by_name['client_id']._options = None
+_APILISTFLOWLOGSARGS.fields_by_name['flow_id']._options = None
+_APILISTFLOWLOGSARGS.fields_by_name['offset']._options = None
+_APILISTFLOWLOGSARGS.fields_by_name['count']._options = None
+_APILISTFLOWLOGSARGS.fields_by_name['filter']._options = None
+_APILISTFLOWLOGSRESULT.fields_by_name['items']._options = None
+_APILISTFLOWLOGSRESULT.fields_by_name['total_count']._options = None
+_APIGETFLOWRESULTSEXPORTCOMMANDARGS.fields_by_name['client_id']._options = None
+_APIGETFLOWRESULTSEXPORTCOMMANDARGS.fields_by_name['flow_id']._options = None
+_APIGETFLOWRESULTSEXPORTCOMMANDRESULT.fields_by_name['command']._options = None
+_APILISTFLOWOUTPUTPLUGINSARGS.fields_by_name['client_id']._options = None
+_APILISTFLOWOUTPUTPLUGINSARGS.fields_by_name['flow_id']._options = None
+_APILISTFLOWOUTPUTPLUGINLOGSARGS.fields_by_name['client_id']._options = None
+_APILISTFLOWOUTPUTPLUGINLOGSARGS.fields_by_name['flow_id']._options = None
+_APILISTFLOWOUTPUTPLUGINLOGSARGS.fields_by_name['plugin_id']._options = None
+_APILISTFLOWOUTPUTPLUGINLOGSARGS.fields_by_name['offset']._options = None
+_APILISTFLOWOUTPUTPLUGINLOGSARGS.fields_by_name['count']._options = None
+_APILISTFLOWOUTPUTPLUGINLOGSRESULT.fields_by_name['items']._options = None
+_APILISTFLOWOUTPUTPLUGINLOGSRESULT.fields_by_name['total_count']._options = None
+_APILISTFLOWOUTPUTPLUGINERRORSARGS.fields_by_name['client_id']._options = None
+_APILISTFLOWOUTPUTPLUGINERRORSARGS.fields_by_name['flow_id']._options = None
+_APILISTFLOWOUTPUTPLUGINERRORSARGS.fields_by_name['plugin_id']._options = None
+_APILISTFLOWOUTPUTPLUGINERRORSARGS.fields_by_name['offset']._options = None
+_APILISTFLOWOUTPUTPLUGINERRORSARGS.fields_by_name['count']._options = None
+_APILISTFLOWOUTPUTPLUGINERRORSRESULT.fields_by_name['items']._options = None
+_APILISTFLOWOUTPUTPLUGINERRORSRESULT.fields_by_name['total_count']._options = None
+_APIGETFLOWFILESARCHIVEARGS.fields_by_name['client_id']._options = None
+_APIGETFLOWFILESARCHIVEARGS.fields_by_name['flow_id']._options = None
+_APILISTFLOWDESCRIPTORSARGS.fields_by_name['flow_type']._options = None
+_APILISTFLOWSARGS.fields_by_name['client_id']._options = None
+_APILISTFLOWSARGS.fields_by_name['offset']._options = None
+_APILISTFLOWSARGS.fields_by_name['count']._options = None
+_APIGETEXPORTEDFLOWRESULTSARGS.fields_by_name['client_id']._options = None
+_APIGETEXPORTEDFLOWRESULTSARGS.fields_by_name['flow_id']._options = None
+_APIGETEXPORTEDFLOWRESULTSARGS.fields_by_name['plugin_name']._options = None
+_APISTARTROBOTGETFILESOPERATIONARGS.fields_by_name['hostname']._options = None
+_APISTARTROBOTGETFILESOPERATIONARGS.fields_by_name['paths']._options = None
+_APISTARTROBOTGETFILESOPERATIONARGS.fields_by_name['max_file_size']._options = None
+_APISTARTROBOTGETFILESOPERATIONARGS.fields_by_name['action']._options = None
+_APISTARTROBOTGETFILESOPERATIONARGS.fields_by_name['pathtype']._options = None
+_APISTARTROBOTGETFILESOPERATIONRESULT.fields_by_name['operation_id']._options = None
+_APIGETROBOTGETFILESOPERATIONSTATEARGS.fields_by_name['operation_id']._options = None
+_APIGETROBOTGETFILESOPERATIONSTATERESULT.fields_by_name['state']._options = None
+_APIGETROBOTGETFILESOPERATIONSTATERESULT.fields_by_name['result_count']._options = None
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr/proto/api_utils.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
+from grr.proto import semantic_pb2 as grr_dot_proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr/proto/api_utils.proto',
+  package='',
+  syntax='proto2',
+  serialized_options=None,
+  serialized_pb=_b('\n\x19grr/proto/api_utils.proto\x1a\x19google/protobuf/any.proto\x1a\x18grr/proto/semantic.proto\"a\n\rApiDataObject\x12P\n\x05items\x18\x01 \x03(\x0b\x32\x1a.ApiDataObjectKeyValuePairB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dThe items of the data object.\"\xa7\x02\n\x19\x41piDataObjectKeyValuePair\x12\x1d\n\x03key\x18\x01 \x01(\tB\x10\xe2\xfc\xe3\xc4\x01\n\x12\x08The key.\x12J\n\x05value\x18\x02 \x01(\x0b\x32\x14.google.protobuf.AnyB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x0f\x46low arguments.*\x0cGetArgsClass\x12q\n\x07invalid\x18\x03 \x01(\x08\x42`\xe2\xfc\xe3\xc4\x01Z\x12XWhether the value could be successfully serialized to the protobuf serialization format.\x12,\n\x04type\x18\x04 \x01(\tB\x1e\xe2\xfc\xe3\xc4\x01\x18\x12\x16The type of the value.')
+  ,
+  dependencies=[google_dot_protobuf_dot_any__pb2.DESCRIPTOR,grr_dot_proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+
+_APIDATAOBJECT = _descriptor.Descriptor(
+  name='ApiDataObject',
+  full_name='ApiDataObject',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='ApiDataObject.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035The items of the data object.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=82,
+  serialized_end=179,
+)
+
+
+_APIDATAOBJECTKEYVALUEPAIR = _descriptor.Descriptor(
+  name='ApiDataObjectKeyValuePair',
+  full_name='ApiDataObjectKeyValuePair',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='ApiDataObjectKeyValuePair.key', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\n\022\010The key.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='ApiDataObjectKeyValuePair.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\017Flow arguments.*\014GetArgsClass'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='invalid', full_name='ApiDataObjectKeyValuePair.invalid', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001Z\022XWhether the value could be successfully serialized to the protobuf serialization format.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='ApiDataObjectKeyValuePair.type', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\030\022\026The type of the value.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=182,
+  serialized_end=477,
+)
+
+_APIDATAOBJECT.fields_by_name['items'].message_type = _APIDATAOBJECTKEYVALUEPAIR
+_APIDATAOBJECTKEYVALUEPAIR.fields_by_name['value'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+DESCRIPTOR.message_types_by_name['ApiDataObject'] = _APIDATAOBJECT
+DESCRIPTOR.message_types_by_name['ApiDataObjectKeyValuePair'] = _APIDATAOBJECTKEYVALUEPAIR
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+ApiDataObject = _reflection.GeneratedProtocolMessageType('ApiDataObject', (_message.Message,), {
+  'DESCRIPTOR' : _APIDATAOBJECT,
+  '__module__' : 'grr.proto.api_utils_pb2'
+  # @@protoc_insertion_point(class_scope:ApiDataObject)
+  })
+_sym_db.RegisterMessage(ApiDataObject)
+
+ApiDataObjectKeyValuePair = _reflection.GeneratedProtocolMessageType('ApiDataObjectKeyValuePair', (_message.Message,), {
+  'DESCRIPTOR' : _APIDATAOBJECTKEYVALUEPAIR,
+  '__module__' : 'grr.proto.api_utils_pb2'
+  # @@protoc_insertion_point(class_scope:ApiDataObjectKeyValuePair)
+  })
+_sym_db.RegisterMessage(ApiDataObjectKeyValuePair)
+
+
+_APIDATAOBJECT.fields_by_name['items']._options = None
+_APIDATAOBJECTKEYVALUEPAIR.fields_by_name['key']._options = None
+_APIDATAOBJECTKEYVALUEPAIR.fields_by_name['value']._options = None
+_APIDATAOBJECTKEYVALUEPAIR.fields_by_name['invalid']._options = None
+_APIDATAOBJECTKEYVALUEPAIR.fields_by_name['type']._options = None
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,908 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr/proto/config_file.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr.proto import jobs_pb2 as grr_dot_proto_dot_jobs__pb2
+from grr.proto import semantic_pb2 as grr_dot_proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr/proto/config_file.proto',
+  package='',
+  syntax='proto2',
+  serialized_options=None,
+  serialized_pb=_b('\n\x1bgrr/proto/config_file.proto\x1a\x14grr/proto/jobs.proto\x1a\x18grr/proto/semantic.proto\"\xa0\x03\n\tLogTarget\x12@\n\x08\x66\x61\x63ility\x18\x01 \x01(\tB.\xe2\xfc\xe3\xc4\x01(\x12&What log types this target applies to.\x12\x45\n\x08priority\x18\x02 \x01(\tB3\xe2\xfc\xe3\xc4\x01-\x12+What log priorities this target applies to.\x12W\n\ttransport\x18\x03 \x01(\x0e\x32\x17.LogTarget.LogTransportB+\xe2\xfc\xe3\xc4\x01%\x12#How logs are sent to a destination.\x12\x34\n\x0b\x64\x65stination\x18\x04 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\x12\x17Where logs are sent to.\"{\n\x0cLogTransport\x12\x19\n\x15UNKNOWN_LOG_TRANSPORT\x10\x00\x12\x08\n\x04NONE\x10\x01\x12\x08\n\x04\x46ILE\x10\x02\x12\x07\n\x03UDP\x10\x03\x12\x07\n\x03TCP\x10\x04\x12\x08\n\x04PIPE\x10\x05\x12\n\n\x06SCRIPT\x10\x06\x12\n\n\x06MODULE\x10\x07\x12\x08\n\x04WALL\x10\x08\"B\n\tLogConfig\x12\x35\n\x07targets\x18\x01 \x03(\x0b\x32\n.LogTargetB\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10Logging targets.\"*\n\tNfsClient\x12\x0c\n\x04host\x18\x01 \x01(\t\x12\x0f\n\x07options\x18\x02 \x03(\t\"I\n\tNfsExport\x12\r\n\x05share\x18\x01 \x01(\t\x12\x10\n\x08\x64\x65\x66\x61ults\x18\x02 \x03(\t\x12\x1b\n\x07\x63lients\x18\x03 \x03(\x0b\x32\n.NfsClient\"\xa1\x01\n\x0eSshdMatchBlock\x12?\n\tcriterion\x18\x01 \x01(\tB,\xe2\xfc\xe3\xc4\x01&\x12$Criteria that trigger a match block.\x12N\n\x06\x63onfig\x18\x02 \x01(\x0b\x32\x0f.AttributedDictB-\xe2\xfc\xe3\xc4\x01\'\x12%The configuration of the match block.\"\x94\x01\n\nSshdConfig\x12\x45\n\x06\x63onfig\x18\x01 \x01(\x0b\x32\x0f.AttributedDictB$\xe2\xfc\xe3\xc4\x01\x1e\x12\x1cThe main sshd configuration.\x12?\n\x07matches\x18\x02 \x03(\x0b\x32\x0f.SshdMatchBlockB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Match block sections.\"\xe0\x04\n\tNtpConfig\x12\x44\n\x06\x63onfig\x18\x01 \x01(\x0b\x32\x0f.AttributedDictB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1bThe main ntp configuration.\x12G\n\x06server\x18\x02 \x03(\x0b\x32\x0f.AttributedDictB&\xe2\xfc\xe3\xc4\x01 \x12\x1eserver keyword configurations.\x12K\n\x08restrict\x18\x03 \x03(\x0b\x32\x0f.AttributedDictB(\xe2\xfc\xe3\xc4\x01\"\x12 restrict keyword configurations.\x12\x45\n\x05\x66udge\x18\x04 \x03(\x0b\x32\x0f.AttributedDictB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1d\x66udge keyword configurations.\x12\x43\n\x04trap\x18\x05 \x03(\x0b\x32\x0f.AttributedDictB$\xe2\xfc\xe3\xc4\x01\x1e\x12\x1ctrap keyword configurations.\x12\x43\n\x04peer\x18\x06 \x03(\x0b\x32\x0f.AttributedDictB$\xe2\xfc\xe3\xc4\x01\x1e\x12\x1cpeer keyword configurations.\x12M\n\tbroadcast\x18\x07 \x03(\x0b\x32\x0f.AttributedDictB)\xe2\xfc\xe3\xc4\x01#\x12!broadcast keyword configurations.\x12W\n\x0emanycastclient\x18\x08 \x03(\x0b\x32\x0f.AttributedDictB.\xe2\xfc\xe3\xc4\x01(\x12&manycastclient keyword configurations.\"\xbc\x02\n\x0ePamConfigEntry\x12?\n\x07service\x18\x01 \x01(\tB.\xe2\xfc\xe3\xc4\x01(\x12&The service name the entry belongs to.\x12.\n\x04type\x18\x02 \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18The type for this entry.\x12<\n\x07\x63ontrol\x18\x03 \x01(\tB+\xe2\xfc\xe3\xc4\x01%\x12#The behavior of PAM for this entry.\x12<\n\x0bmodule_path\x18\x04 \x01(\tB\'\xe2\xfc\xe3\xc4\x01!\x12\x1fThe filepath to the PAM module.\x12=\n\x0bmodule_args\x18\x05 \x01(\tB(\xe2\xfc\xe3\xc4\x01\"\x12 The arguments to the PAM module.\"\xbc\x01\n\tPamConfig\x12]\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\x0f.PamConfigEntryB;\xe2\xfc\xe3\xc4\x01\x35\x12\x33\x41 list of the enumerated PAM configuration entries.\x12P\n\x0f\x65xternal_config\x18\x02 \x03(\tB7\xe2\xfc\xe3\xc4\x01\x31\x12/Details of references to external config files.\"\xeb\x02\n\x0cSudoersAlias\x12\x35\n\x04type\x18\x01 \x01(\x0e\x32\x12.SudoersAlias.TypeB\x13\xe2\xfc\xe3\xc4\x01\r\x12\x0b\x41lias type.\x12!\n\x04name\x18\x02 \x01(\tB\x13\xe2\xfc\xe3\xc4\x01\r\x12\x0b\x41lias name.\x12\x32\n\x05users\x18\x03 \x03(\tB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1bUser list, if type is USER.\x12\x34\n\x05runas\x18\x04 \x03(\tB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dRunas list, if type is RUNAS.\x12\x32\n\x05hosts\x18\x05 \x03(\tB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1bHost list, if type is HOST.\x12\x33\n\x04\x63mds\x18\x06 \x03(\tB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1d\x43ommand list, if type is CMD.\".\n\x04Type\x12\x08\n\x04USER\x10\x00\x12\t\n\x05RUNAS\x10\x01\x12\x08\n\x04HOST\x10\x02\x12\x07\n\x03\x43MD\x10\x03\"\xd0\x01\n\x0eSudoersDefault\x12:\n\x05scope\x18\x01 \x01(\tB+\xe2\xfc\xe3\xc4\x01%\x12#Scope for this default (eg, >root).\x12\x44\n\x04name\x18\x02 \x01(\tB6\xe2\xfc\xe3\xc4\x01\x30\x12.Name for the default, including negations (!).\x12<\n\x05value\x18\x03 \x01(\tB-\xe2\xfc\xe3\xc4\x01\'\x12%Value for the default, if one exists.\"\xca\x01\n\x0cSudoersEntry\x12\x32\n\x05users\x18\x01 \x03(\tB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1bUsers this rule applies to.\x12=\n\x05hosts\x18\x02 \x03(\tB.\xe2\xfc\xe3\xc4\x01(\x12&Hosts this rule applies to (optional).\x12G\n\x07\x63mdspec\x18\x03 \x03(\tB6\xe2\xfc\xe3\xc4\x01\x30\x12.All content after the \'=\' in the sudoers rule.\"\xbc\x02\n\rSudoersConfig\x12`\n\x08\x64\x65\x66\x61ults\x18\x01 \x03(\x0b\x32\x0f.SudoersDefaultB=\xe2\xfc\xe3\xc4\x01\x37\x12\x35\x44\x65\x66\x61ult settings (binary options or key/value pairs).\x12\x46\n\x07\x61liases\x18\x02 \x03(\x0b\x32\r.SudoersAliasB&\xe2\xfc\xe3\xc4\x01 \x12\x1e\x41liases within a sudoers file.\x12\x46\n\x07\x65ntries\x18\x03 \x03(\x0b\x32\r.SudoersEntryB&\xe2\xfc\xe3\xc4\x01 \x12\x1e\x45ntries within a sudoers file.\x12\x39\n\x08includes\x18\x04 \x03(\tB\'\xe2\xfc\xe3\xc4\x01!\x12\x1fIncludes within a sudoers file.')
+  ,
+  dependencies=[grr_dot_proto_dot_jobs__pb2.DESCRIPTOR,grr_dot_proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_LOGTARGET_LOGTRANSPORT = _descriptor.EnumDescriptor(
+  name='LogTransport',
+  full_name='LogTarget.LogTransport',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNKNOWN_LOG_TRANSPORT', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NONE', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UDP', index=3, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TCP', index=4, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PIPE', index=5, number=5,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SCRIPT', index=6, number=6,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MODULE', index=7, number=7,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='WALL', index=8, number=8,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=373,
+  serialized_end=496,
+)
+_sym_db.RegisterEnumDescriptor(_LOGTARGET_LOGTRANSPORT)
+
+_SUDOERSALIAS_TYPE = _descriptor.EnumDescriptor(
+  name='Type',
+  full_name='SudoersAlias.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='USER', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='RUNAS', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='HOST', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CMD', index=3, number=3,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2439,
+  serialized_end=2485,
+)
+_sym_db.RegisterEnumDescriptor(_SUDOERSALIAS_TYPE)
+
+
+_LOGTARGET = _descriptor.Descriptor(
+  name='LogTarget',
+  full_name='LogTarget',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='facility', full_name='LogTarget.facility', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001(\022&What log types this target applies to.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='priority', full_name='LogTarget.priority', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001-\022+What log priorities this target applies to.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='transport', full_name='LogTarget.transport', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#How logs are sent to a destination.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='destination', full_name='LogTarget.destination', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\022\027Where logs are sent to.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _LOGTARGET_LOGTRANSPORT,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=80,
+  serialized_end=496,
+)
+
+
+_LOGCONFIG = _descriptor.Descriptor(
+  name='LogConfig',
+  full_name='LogConfig',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='targets', full_name='LogConfig.targets', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\022\022\020Logging targets.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=498,
+  serialized_end=564,
+)
+
+
+_NFSCLIENT = _descriptor.Descriptor(
+  name='NfsClient',
+  full_name='NfsClient',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='host', full_name='NfsClient.host', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='options', full_name='NfsClient.options', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=566,
+  serialized_end=608,
+)
+
+
+_NFSEXPORT = _descriptor.Descriptor(
+  name='NfsExport',
+  full_name='NfsExport',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='share', full_name='NfsExport.share', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='defaults', full_name='NfsExport.defaults', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='clients', full_name='NfsExport.clients', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=610,
+  serialized_end=683,
+)
+
+
+_SSHDMATCHBLOCK = _descriptor.Descriptor(
+  name='SshdMatchBlock',
+  full_name='SshdMatchBlock',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='criterion', full_name='SshdMatchBlock.criterion', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001&\022$Criteria that trigger a match block.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config', full_name='SshdMatchBlock.config', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\'\022%The configuration of the match block.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=686,
+  serialized_end=847,
+)
+
+
+_SSHDCONFIG = _descriptor.Descriptor(
+  name='SshdConfig',
+  full_name='SshdConfig',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='config', full_name='SshdConfig.config', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\036\022\034The main sshd configuration.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='matches', full_name='SshdConfig.matches', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Match block sections.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=850,
+  serialized_end=998,
+)
+
+
+_NTPCONFIG = _descriptor.Descriptor(
+  name='NtpConfig',
+  full_name='NtpConfig',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='config', full_name='NtpConfig.config', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\035\022\033The main ntp configuration.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='server', full_name='NtpConfig.server', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001 \022\036server keyword configurations.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='restrict', full_name='NtpConfig.restrict', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\"\022 restrict keyword configurations.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fudge', full_name='NtpConfig.fudge', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035fudge keyword configurations.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='trap', full_name='NtpConfig.trap', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\036\022\034trap keyword configurations.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='peer', full_name='NtpConfig.peer', index=5,
+      number=6, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\036\022\034peer keyword configurations.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='broadcast', full_name='NtpConfig.broadcast', index=6,
+      number=7, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001#\022!broadcast keyword configurations.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='manycastclient', full_name='NtpConfig.manycastclient', index=7,
+      number=8, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001(\022&manycastclient keyword configurations.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1001,
+  serialized_end=1609,
+)
+
+
+_PAMCONFIGENTRY = _descriptor.Descriptor(
+  name='PamConfigEntry',
+  full_name='PamConfigEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='service', full_name='PamConfigEntry.service', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001(\022&The service name the entry belongs to.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='PamConfigEntry.type', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030The type for this entry.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='control', full_name='PamConfigEntry.control', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#The behavior of PAM for this entry.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='module_path', full_name='PamConfigEntry.module_path', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001!\022\037The filepath to the PAM module.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='module_args', full_name='PamConfigEntry.module_args', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\"\022 The arguments to the PAM module.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1612,
+  serialized_end=1928,
+)
+
+
+_PAMCONFIG = _descriptor.Descriptor(
+  name='PamConfig',
+  full_name='PamConfig',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='entries', full_name='PamConfig.entries', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0015\0223A list of the enumerated PAM configuration entries.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='external_config', full_name='PamConfig.external_config', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0011\022/Details of references to external config files.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1931,
+  serialized_end=2119,
+)
+
+
+_SUDOERSALIAS = _descriptor.Descriptor(
+  name='SudoersAlias',
+  full_name='SudoersAlias',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='type', full_name='SudoersAlias.type', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\r\022\013Alias type.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='SudoersAlias.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\r\022\013Alias name.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='users', full_name='SudoersAlias.users', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\035\022\033User list, if type is USER.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='runas', full_name='SudoersAlias.runas', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035Runas list, if type is RUNAS.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hosts', full_name='SudoersAlias.hosts', index=4,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\035\022\033Host list, if type is HOST.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cmds', full_name='SudoersAlias.cmds', index=5,
+      number=6, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035Command list, if type is CMD.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _SUDOERSALIAS_TYPE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2122,
+  serialized_end=2485,
+)
+
+
+_SUDOERSDEFAULT = _descriptor.Descriptor(
+  name='SudoersDefault',
+  full_name='SudoersDefault',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='scope', full_name='SudoersDefault.scope', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#Scope for this default (eg, >root).'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='SudoersDefault.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0010\022.Name for the default, including negations (!).'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='SudoersDefault.value', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\'\022%Value for the default, if one exists.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2488,
+  serialized_end=2696,
+)
+
+
+_SUDOERSENTRY = _descriptor.Descriptor(
+  name='SudoersEntry',
+  full_name='SudoersEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='users', full_name='SudoersEntry.users', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\035\022\033Users this rule applies to.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hosts', full_name='SudoersEntry.hosts', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001(\022&Hosts this rule applies to (optional).'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cmdspec', full_name='SudoersEntry.cmdspec', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0010\022.All content after the \'=\' in the sudoers rule.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2699,
+  serialized_end=2901,
+)
+
+
+_SUDOERSCONFIG = _descriptor.Descriptor(
+  name='SudoersConfig',
+  full_name='SudoersConfig',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='defaults', full_name='SudoersConfig.defaults', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0017\0225Default settings (binary options or key/value pairs).'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='aliases', full_name='SudoersConfig.aliases', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001 \022\036Aliases within a sudoers file.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='entries', full_name='SudoersConfig.entries', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001 \022\036Entries within a sudoers file.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='includes', full_name='SudoersConfig.includes', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001!\022\037Includes within a sudoers file.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2904,
+  serialized_end=3220,
+)
+
+_LOGTARGET.fields_by_name['transport'].enum_type = _LOGTARGET_LOGTRANSPORT
+_LOGTARGET_LOGTRANSPORT.containing_type = _LOGTARGET
+_LOGCONFIG.fields_by_name['targets'].message_type = _LOGTARGET
+_NFSEXPORT.fields_by_name['clients'].message_type = _NFSCLIENT
+_SSHDMATCHBLOCK.fields_by_name['config'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_SSHDCONFIG.fields_by_name['config'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_SSHDCONFIG.fields_by_name['matches'].message_type = _SSHDMATCHBLOCK
+_NTPCONFIG.fields_by_name['config'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_NTPCONFIG.fields_by_name['server'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_NTPCONFIG.fields_by_name['restrict'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_NTPCONFIG.fields_by_name['fudge'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_NTPCONFIG.fields_by_name['trap'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_NTPCONFIG.fields_by_name['peer'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_NTPCONFIG.fields_by_name['broadcast'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_NTPCONFIG.fields_by_name['manycastclient'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_PAMCONFIG.fields_by_name['entries'].message_type = _PAMCONFIGENTRY
+_SUDOERSALIAS.fields_by_name['type'].enum_type = _SUDOERSALIAS_TYPE
+_SUDOERSALIAS_TYPE.containing_type = _SUDOERSALIAS
+_SUDOERSCONFIG.fields_by_name['defaults'].message_type = _SUDOERSDEFAULT
+_SUDOERSCONFIG.fields_by_name['aliases'].message_type = _SUDOERSALIAS
+_SUDOERSCONFIG.fields_by_name['entries'].message_type = _SUDOERSENTRY
+DESCRIPTOR.message_types_by_name['LogTarget'] = _LOGTARGET
+DESCRIPTOR.message_types_by_name['LogConfig'] = _LOGCONFIG
+DESCRIPTOR.message_types_by_name['NfsClient'] = _NFSCLIENT
+DESCRIPTOR.message_types_by_name['NfsExport'] = _NFSEXPORT
+DESCRIPTOR.message_types_by_name['SshdMatchBlock'] = _SSHDMATCHBLOCK
+DESCRIPTOR.message_types_by_name['SshdConfig'] = _SSHDCONFIG
+DESCRIPTOR.message_types_by_name['NtpConfig'] = _NTPCONFIG
+DESCRIPTOR.message_types_by_name['PamConfigEntry'] = _PAMCONFIGENTRY
+DESCRIPTOR.message_types_by_name['PamConfig'] = _PAMCONFIG
+DESCRIPTOR.message_types_by_name['SudoersAlias'] = _SUDOERSALIAS
+DESCRIPTOR.message_types_by_name['SudoersDefault'] = _SUDOERSDEFAULT
+DESCRIPTOR.message_types_by_name['SudoersEntry'] = _SUDOERSENTRY
+DESCRIPTOR.message_types_by_name['SudoersConfig'] = _SUDOERSCONFIG
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+LogTarget = _reflection.GeneratedProtocolMessageType('LogTarget', (_message.Message,), {
+  'DESCRIPTOR' : _LOGTARGET,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:LogTarget)
+  })
+_sym_db.RegisterMessage(LogTarget)
+
+LogConfig = _reflection.GeneratedProtocolMessageType('LogConfig', (_message.Message,), {
+  'DESCRIPTOR' : _LOGCONFIG,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:LogConfig)
+  })
+_sym_db.RegisterMessage(LogConfig)
+
+NfsClient = _reflection.GeneratedProtocolMessageType('NfsClient', (_message.Message,), {
+  'DESCRIPTOR' : _NFSCLIENT,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:NfsClient)
+  })
+_sym_db.RegisterMessage(NfsClient)
+
+NfsExport = _reflection.GeneratedProtocolMessageType('NfsExport', (_message.Message,), {
+  'DESCRIPTOR' : _NFSEXPORT,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:NfsExport)
+  })
+_sym_db.RegisterMessage(NfsExport)
+
+SshdMatchBlock = _reflection.GeneratedProtocolMessageType('SshdMatchBlock', (_message.Message,), {
+  'DESCRIPTOR' : _SSHDMATCHBLOCK,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:SshdMatchBlock)
+  })
+_sym_db.RegisterMessage(SshdMatchBlock)
+
+SshdConfig = _reflection.GeneratedProtocolMessageType('SshdConfig', (_message.Message,), {
+  'DESCRIPTOR' : _SSHDCONFIG,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:SshdConfig)
+  })
+_sym_db.RegisterMessage(SshdConfig)
+
+NtpConfig = _reflection.GeneratedProtocolMessageType('NtpConfig', (_message.Message,), {
+  'DESCRIPTOR' : _NTPCONFIG,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:NtpConfig)
+  })
+_sym_db.RegisterMessage(NtpConfig)
+
+PamConfigEntry = _reflection.GeneratedProtocolMessageType('PamConfigEntry', (_message.Message,), {
+  'DESCRIPTOR' : _PAMCONFIGENTRY,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:PamConfigEntry)
+  })
+_sym_db.RegisterMessage(PamConfigEntry)
+
+PamConfig = _reflection.GeneratedProtocolMessageType('PamConfig', (_message.Message,), {
+  'DESCRIPTOR' : _PAMCONFIG,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:PamConfig)
+  })
+_sym_db.RegisterMessage(PamConfig)
+
+SudoersAlias = _reflection.GeneratedProtocolMessageType('SudoersAlias', (_message.Message,), {
+  'DESCRIPTOR' : _SUDOERSALIAS,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:SudoersAlias)
+  })
+_sym_db.RegisterMessage(SudoersAlias)
+
+SudoersDefault = _reflection.GeneratedProtocolMessageType('SudoersDefault', (_message.Message,), {
+  'DESCRIPTOR' : _SUDOERSDEFAULT,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:SudoersDefault)
+  })
+_sym_db.RegisterMessage(SudoersDefault)
+
+SudoersEntry = _reflection.GeneratedProtocolMessageType('SudoersEntry', (_message.Message,), {
+  'DESCRIPTOR' : _SUDOERSENTRY,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:SudoersEntry)
+  })
+_sym_db.RegisterMessage(SudoersEntry)
+
+SudoersConfig = _reflection.GeneratedProtocolMessageType('SudoersConfig', (_message.Message,), {
+  'DESCRIPTOR' : _SUDOERSCONFIG,
+  '__module__' : 'grr.proto.config_file_pb2'
+  # @@protoc_insertion_point(class_scope:SudoersConfig)
+  })
+_sym_db.RegisterMessage(SudoersConfig)
+
+
+_LOGTARGET.fields_by_name['facility']._options = None
+_LOGTARGET.fields_by_name['priority']._options = None
+_LOGTARGET.fields_by_name['transport']._options = None
+_LOGTARGET.fields_by_name['destination']._options = None
+_LOGCONFIG.fields_by_name['targets']._options = None
+_SSHDMATCHBLOCK.fields_by_name['criterion']._options = None
+_SSHDMATCHBLOCK.fields_by_name['config']._options = None
+_SSHDCONFIG.fields_by_name['config']._options = None
+_SSHDCONFIG.fields_by_name['matches']._options = None
+_NTPCONFIG.fields_by_name['config']._options = None
+_NTPCONFIG.fields_by_name['server']._options = None
+_NTPCONFIG.fields_by_name['restrict']._options = None
+_NTPCONFIG.fields_by_name['fudge']._options = None
+_NTPCONFIG.fields_by_name['trap']._options = None
+_NTPCONFIG.fields_by_name['peer']._options = None
+_NTPCONFIG.fields_by_name['broadcast']._options = None
+_NTPCONFIG.fields_by_name['manycastclient']._options = None
+_PAMCONFIGENTRY.fields_by_name['service']._options = None
+_PAMCONFIGENTRY.fields_by_name['type']._options = None
+_PAMCONFIGENTRY.fields_by_name['control']._options = None
+_PAMCONFIGENTRY.fields_by_name['module_path']._options = None
+_PAMCONFIGENTRY.fields_by_name['module_args']._options = None
+_PAMCONFIG.fields_by_name['entries']._options = None
+_PAMCONFIG.fields_by_name['external_config']._options = None
+_SUDOERSALIAS.fields_by_name['type']._options = None
+_SUDOERSALIAS.fields_by_name['name']._options = None
+_SUDOERSALIAS.fields_by_name['users']._options = None
+_SUDOERSALIAS.fields_by_name['runas']._options = None
+_SUDOERSALIAS.fields_by_name['hosts']._options = None
+_SUDOERSALIAS.fields_by_name['cmds']._options = None
+_SUDOERSDEFAULT.fields_by_name['scope']._options = None
+_SUDOERSDEFAULT.fields_by_name['name']._options = None
+_SUDOERSDEFAULT.fields_by_name['value']._options = None
+_SUDOERSENTRY.fields_by_name['users']._options = None
+_SUDOERSENTRY.fields_by_name['hosts']._options = None
+_SUDOERSENTRY.fields_by_name['cmdspec']._options = None
+_SUDOERSCONFIG.fields_by_name['defaults']._options = None
+_SUDOERSCONFIG.fields_by_name['aliases']._options = None
+_SUDOERSCONFIG.fields_by_name['entries']._options = None
+_SUDOERSCONFIG.fields_by_name['includes']._options = None
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,764 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr/proto/data_server.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr.proto import data_store_pb2 as grr_dot_proto_dot_data__store__pb2
+from grr.proto import semantic_pb2 as grr_dot_proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr/proto/data_server.proto',
+  package='',
+  syntax='proto2',
+  serialized_options=None,
+  serialized_pb=_b('\n\x1bgrr/proto/data_server.proto\x1a\x1agrr/proto/data_store.proto\x1a\x18grr/proto/semantic.proto\"\xa4\x02\n\x10\x44\x61taStoreCommand\x12*\n\x07\x63ommand\x18\x01 \x01(\x0e\x32\x19.DataStoreCommand.Command\x12\"\n\x07request\x18\x02 \x01(\x0b\x32\x11.DataStoreRequest\"\xbf\x01\n\x07\x43ommand\x12\r\n\tMULTI_SET\x10\x00\x12\x11\n\rRESOLVE_MULTI\x10\x02\x12\x12\n\x0e\x44\x45LETE_SUBJECT\x10\x03\x12\x15\n\x11\x44\x45LETE_ATTRIBUTES\x10\x04\x12\x10\n\x0cLOCK_SUBJECT\x10\x06\x12\x12\n\x0eUNLOCK_SUBJECT\x10\x07\x12\x12\n\x0e\x45XTEND_SUBJECT\x10\x08\x12\x18\n\x14MULTI_RESOLVE_PREFIX\x10\t\x12\x13\n\x0fSCAN_ATTRIBUTES\x10\n\"0\n\x12\x44\x61taServerInterval\x12\r\n\x05start\x18\x01 \x01(\x04\x12\x0b\n\x03\x65nd\x18\x02 \x01(\x04\"\xab\x01\n\x0f\x44\x61taServerState\x12\'\n\x06status\x18\x01 \x01(\x0e\x32\x17.DataServerState.Status\x12\x0c\n\x04load\x18\x02 \x01(\x04\x12\x0c\n\x04size\x18\x03 \x01(\x04\x12\x16\n\x0enum_components\x18\x04 \x01(\x04\x12\x15\n\ravg_component\x18\x05 \x01(\x04\"$\n\x06Status\x12\r\n\tAVAILABLE\x10\x00\x12\x0b\n\x07OFFLINE\x10\x01\"\x8d\x01\n\x15\x44\x61taServerInformation\x12\r\n\x05index\x18\x01 \x01(\x04\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x0c\n\x04port\x18\x03 \x01(\x04\x12\x1f\n\x05state\x18\x04 \x01(\x0b\x32\x10.DataServerState\x12%\n\x08interval\x18\x05 \x01(\x0b\x32\x13.DataServerInterval\"s\n\x11\x44\x61taServerMapping\x12\x0f\n\x07version\x18\x01 \x01(\x04\x12\x13\n\x0bnum_servers\x18\x02 \x01(\x04\x12\'\n\x07servers\x18\x03 \x03(\x0b\x32\x16.DataServerInformation\x12\x0f\n\x07pathing\x18\x04 \x03(\t\"V\n\x1b\x44\x61taServerClientInformation\x12\x10\n\x08username\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x13\n\x0bpermissions\x18\x03 \x01(\t\"\xaf\x01\n\x18\x44\x61taServerEncryptedCreds\x12&\n\x0binit_vector\x18\x01 \x01(\x0c\x42\x11\xe2\xfc\xe3\xc4\x01\x0b\n\tAES128Key\x12\x12\n\nciphertext\x18\x02 \x01(\x0c\x12W\n\x06sha256\x18\x03 \x01(\x0c\x42G\xe2\xfc\xe3\xc4\x01\x41\x12?The sha256 of the plain text encrypted in the ciphertext field.\"J\n\x1b\x44\x61taServerClientCredentials\x12+\n\x05users\x18\x01 \x03(\x0b\x32\x1c.DataServerClientInformation\"V\n\x13\x44\x61taServerRebalance\x12\n\n\x02id\x18\x01 \x01(\t\x12#\n\x07mapping\x18\x02 \x01(\x0b\x32\x12.DataServerMapping\x12\x0e\n\x06moving\x18\x03 \x03(\x04\"]\n\x12\x44\x61taServerFileCopy\x12\x14\n\x0crebalance_id\x18\x01 \x01(\t\x12\x11\n\tdirectory\x18\x02 \x01(\t\x12\x10\n\x08\x66ilename\x18\x03 \x01(\t\x12\x0c\n\x04size\x18\x04 \x01(\x04\"C\n\x12\x44\x61taStoreAuthToken\x12\x10\n\x08username\x18\x01 \x01(\t\x12\r\n\x05nonce\x18\x02 \x01(\t\x12\x0c\n\x04hash\x18\x03 \x01(\t\"P\n\x1c\x44\x61taStoreRegistrationRequest\x12\x0c\n\x04port\x18\x01 \x01(\r\x12\"\n\x05token\x18\x02 \x01(\x0b\x32\x13.DataStoreAuthToken')
+  ,
+  dependencies=[grr_dot_proto_dot_data__store__pb2.DESCRIPTOR,grr_dot_proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_DATASTORECOMMAND_COMMAND = _descriptor.EnumDescriptor(
+  name='Command',
+  full_name='DataStoreCommand.Command',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='MULTI_SET', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='RESOLVE_MULTI', index=1, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DELETE_SUBJECT', index=2, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DELETE_ATTRIBUTES', index=3, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LOCK_SUBJECT', index=4, number=6,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UNLOCK_SUBJECT', index=5, number=7,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EXTEND_SUBJECT', index=6, number=8,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MULTI_RESOLVE_PREFIX', index=7, number=9,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SCAN_ATTRIBUTES', index=8, number=10,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=187,
+  serialized_end=378,
+)
+_sym_db.RegisterEnumDescriptor(_DATASTORECOMMAND_COMMAND)
+
+_DATASERVERSTATE_STATUS = _descriptor.EnumDescriptor(
+  name='Status',
+  full_name='DataServerState.Status',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='AVAILABLE', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='OFFLINE', index=1, number=1,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=566,
+  serialized_end=602,
+)
+_sym_db.RegisterEnumDescriptor(_DATASERVERSTATE_STATUS)
+
+
+_DATASTORECOMMAND = _descriptor.Descriptor(
+  name='DataStoreCommand',
+  full_name='DataStoreCommand',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='command', full_name='DataStoreCommand.command', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='request', full_name='DataStoreCommand.request', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _DATASTORECOMMAND_COMMAND,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=86,
+  serialized_end=378,
+)
+
+
+_DATASERVERINTERVAL = _descriptor.Descriptor(
+  name='DataServerInterval',
+  full_name='DataServerInterval',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='start', full_name='DataServerInterval.start', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='end', full_name='DataServerInterval.end', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=380,
+  serialized_end=428,
+)
+
+
+_DATASERVERSTATE = _descriptor.Descriptor(
+  name='DataServerState',
+  full_name='DataServerState',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='status', full_name='DataServerState.status', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='load', full_name='DataServerState.load', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='DataServerState.size', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_components', full_name='DataServerState.num_components', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='avg_component', full_name='DataServerState.avg_component', index=4,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _DATASERVERSTATE_STATUS,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=431,
+  serialized_end=602,
+)
+
+
+_DATASERVERINFORMATION = _descriptor.Descriptor(
+  name='DataServerInformation',
+  full_name='DataServerInformation',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='index', full_name='DataServerInformation.index', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='address', full_name='DataServerInformation.address', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='port', full_name='DataServerInformation.port', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='DataServerInformation.state', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='interval', full_name='DataServerInformation.interval', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=605,
+  serialized_end=746,
+)
+
+
+_DATASERVERMAPPING = _descriptor.Descriptor(
+  name='DataServerMapping',
+  full_name='DataServerMapping',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='version', full_name='DataServerMapping.version', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_servers', full_name='DataServerMapping.num_servers', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='servers', full_name='DataServerMapping.servers', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pathing', full_name='DataServerMapping.pathing', index=3,
+      number=4, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=748,
+  serialized_end=863,
+)
+
+
+_DATASERVERCLIENTINFORMATION = _descriptor.Descriptor(
+  name='DataServerClientInformation',
+  full_name='DataServerClientInformation',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='DataServerClientInformation.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='password', full_name='DataServerClientInformation.password', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='permissions', full_name='DataServerClientInformation.permissions', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=865,
+  serialized_end=951,
+)
+
+
+_DATASERVERENCRYPTEDCREDS = _descriptor.Descriptor(
+  name='DataServerEncryptedCreds',
+  full_name='DataServerEncryptedCreds',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='init_vector', full_name='DataServerEncryptedCreds.init_vector', index=0,
+      number=1, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\013\n\tAES128Key'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ciphertext', full_name='DataServerEncryptedCreds.ciphertext', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sha256', full_name='DataServerEncryptedCreds.sha256', index=2,
+      number=3, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001A\022?The sha256 of the plain text encrypted in the ciphertext field.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=954,
+  serialized_end=1129,
+)
+
+
+_DATASERVERCLIENTCREDENTIALS = _descriptor.Descriptor(
+  name='DataServerClientCredentials',
+  full_name='DataServerClientCredentials',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='users', full_name='DataServerClientCredentials.users', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1131,
+  serialized_end=1205,
+)
+
+
+_DATASERVERREBALANCE = _descriptor.Descriptor(
+  name='DataServerRebalance',
+  full_name='DataServerRebalance',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='DataServerRebalance.id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mapping', full_name='DataServerRebalance.mapping', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='moving', full_name='DataServerRebalance.moving', index=2,
+      number=3, type=4, cpp_type=4, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1207,
+  serialized_end=1293,
+)
+
+
+_DATASERVERFILECOPY = _descriptor.Descriptor(
+  name='DataServerFileCopy',
+  full_name='DataServerFileCopy',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rebalance_id', full_name='DataServerFileCopy.rebalance_id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='directory', full_name='DataServerFileCopy.directory', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filename', full_name='DataServerFileCopy.filename', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='DataServerFileCopy.size', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1295,
+  serialized_end=1388,
+)
+
+
+_DATASTOREAUTHTOKEN = _descriptor.Descriptor(
+  name='DataStoreAuthToken',
+  full_name='DataStoreAuthToken',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='DataStoreAuthToken.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nonce', full_name='DataStoreAuthToken.nonce', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hash', full_name='DataStoreAuthToken.hash', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1390,
+  serialized_end=1457,
+)
+
+
+_DATASTOREREGISTRATIONREQUEST = _descriptor.Descriptor(
+  name='DataStoreRegistrationRequest',
+  full_name='DataStoreRegistrationRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='port', full_name='DataStoreRegistrationRequest.port', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='token', full_name='DataStoreRegistrationRequest.token', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1459,
+  serialized_end=1539,
+)
+
+_DATASTORECOMMAND.fields_by_name['command'].enum_type = _DATASTORECOMMAND_COMMAND
+_DATASTORECOMMAND.fields_by_name['request'].message_type = grr_dot_proto_dot_data__store__pb2._DATASTOREREQUEST
+_DATASTORECOMMAND_COMMAND.containing_type = _DATASTORECOMMAND
+_DATASERVERSTATE.fields_by_name['status'].enum_type = _DATASERVERSTATE_STATUS
+_DATASERVERSTATE_STATUS.containing_type = _DATASERVERSTATE
+_DATASERVERINFORMATION.fields_by_name['state'].message_type = _DATASERVERSTATE
+_DATASERVERINFORMATION.fields_by_name['interval'].message_type = _DATASERVERINTERVAL
+_DATASERVERMAPPING.fields_by_name['servers'].message_type = _DATASERVERINFORMATION
+_DATASERVERCLIENTCREDENTIALS.fields_by_name['users'].message_type = _DATASERVERCLIENTINFORMATION
+_DATASERVERREBALANCE.fields_by_name['mapping'].message_type = _DATASERVERMAPPING
+_DATASTOREREGISTRATIONREQUEST.fields_by_name['token'].message_type = _DATASTOREAUTHTOKEN
+DESCRIPTOR.message_types_by_name['DataStoreCommand'] = _DATASTORECOMMAND
+DESCRIPTOR.message_types_by_name['DataServerInterval'] = _DATASERVERINTERVAL
+DESCRIPTOR.message_types_by_name['DataServerState'] = _DATASERVERSTATE
+DESCRIPTOR.message_types_by_name['DataServerInformation'] = _DATASERVERINFORMATION
+DESCRIPTOR.message_types_by_name['DataServerMapping'] = _DATASERVERMAPPING
+DESCRIPTOR.message_types_by_name['DataServerClientInformation'] = _DATASERVERCLIENTINFORMATION
+DESCRIPTOR.message_types_by_name['DataServerEncryptedCreds'] = _DATASERVERENCRYPTEDCREDS
+DESCRIPTOR.message_types_by_name['DataServerClientCredentials'] = _DATASERVERCLIENTCREDENTIALS
+DESCRIPTOR.message_types_by_name['DataServerRebalance'] = _DATASERVERREBALANCE
+DESCRIPTOR.message_types_by_name['DataServerFileCopy'] = _DATASERVERFILECOPY
+DESCRIPTOR.message_types_by_name['DataStoreAuthToken'] = _DATASTOREAUTHTOKEN
+DESCRIPTOR.message_types_by_name['DataStoreRegistrationRequest'] = _DATASTOREREGISTRATIONREQUEST
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+DataStoreCommand = _reflection.GeneratedProtocolMessageType('DataStoreCommand', (_message.Message,), {
+  'DESCRIPTOR' : _DATASTORECOMMAND,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataStoreCommand)
+  })
+_sym_db.RegisterMessage(DataStoreCommand)
+
+DataServerInterval = _reflection.GeneratedProtocolMessageType('DataServerInterval', (_message.Message,), {
+  'DESCRIPTOR' : _DATASERVERINTERVAL,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataServerInterval)
+  })
+_sym_db.RegisterMessage(DataServerInterval)
+
+DataServerState = _reflection.GeneratedProtocolMessageType('DataServerState', (_message.Message,), {
+  'DESCRIPTOR' : _DATASERVERSTATE,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataServerState)
+  })
+_sym_db.RegisterMessage(DataServerState)
+
+DataServerInformation = _reflection.GeneratedProtocolMessageType('DataServerInformation', (_message.Message,), {
+  'DESCRIPTOR' : _DATASERVERINFORMATION,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataServerInformation)
+  })
+_sym_db.RegisterMessage(DataServerInformation)
+
+DataServerMapping = _reflection.GeneratedProtocolMessageType('DataServerMapping', (_message.Message,), {
+  'DESCRIPTOR' : _DATASERVERMAPPING,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataServerMapping)
+  })
+_sym_db.RegisterMessage(DataServerMapping)
+
+DataServerClientInformation = _reflection.GeneratedProtocolMessageType('DataServerClientInformation', (_message.Message,), {
+  'DESCRIPTOR' : _DATASERVERCLIENTINFORMATION,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataServerClientInformation)
+  })
+_sym_db.RegisterMessage(DataServerClientInformation)
+
+DataServerEncryptedCreds = _reflection.GeneratedProtocolMessageType('DataServerEncryptedCreds', (_message.Message,), {
+  'DESCRIPTOR' : _DATASERVERENCRYPTEDCREDS,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataServerEncryptedCreds)
+  })
+_sym_db.RegisterMessage(DataServerEncryptedCreds)
+
+DataServerClientCredentials = _reflection.GeneratedProtocolMessageType('DataServerClientCredentials', (_message.Message,), {
+  'DESCRIPTOR' : _DATASERVERCLIENTCREDENTIALS,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataServerClientCredentials)
+  })
+_sym_db.RegisterMessage(DataServerClientCredentials)
+
+DataServerRebalance = _reflection.GeneratedProtocolMessageType('DataServerRebalance', (_message.Message,), {
+  'DESCRIPTOR' : _DATASERVERREBALANCE,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataServerRebalance)
+  })
+_sym_db.RegisterMessage(DataServerRebalance)
+
+DataServerFileCopy = _reflection.GeneratedProtocolMessageType('DataServerFileCopy', (_message.Message,), {
+  'DESCRIPTOR' : _DATASERVERFILECOPY,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataServerFileCopy)
+  })
+_sym_db.RegisterMessage(DataServerFileCopy)
+
+DataStoreAuthToken = _reflection.GeneratedProtocolMessageType('DataStoreAuthToken', (_message.Message,), {
+  'DESCRIPTOR' : _DATASTOREAUTHTOKEN,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataStoreAuthToken)
+  })
+_sym_db.RegisterMessage(DataStoreAuthToken)
+
+DataStoreRegistrationRequest = _reflection.GeneratedProtocolMessageType('DataStoreRegistrationRequest', (_message.Message,), {
+  'DESCRIPTOR' : _DATASTOREREGISTRATIONREQUEST,
+  '__module__' : 'grr.proto.data_server_pb2'
+  # @@protoc_insertion_point(class_scope:DataStoreRegistrationRequest)
+  })
+_sym_db.RegisterMessage(DataStoreRegistrationRequest)
+
+
+_DATASERVERENCRYPTEDCREDS.fields_by_name['init_vector']._options = None
+_DATASERVERENCRYPTEDCREDS.fields_by_name['sha256']._options = None
+# @@protoc_insertion_point(module_scope)
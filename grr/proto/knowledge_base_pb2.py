@@ -0,0 +1,656 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr/proto/knowledge_base.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr.proto import semantic_pb2 as grr_dot_proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr/proto/knowledge_base.proto',
+  package='',
+  syntax='proto2',
+  serialized_options=None,
+  serialized_pb=_b('\n\x1egrr/proto/knowledge_base.proto\x1a\x18grr/proto/semantic.proto\"\xda\x03\n\x07PwEntry\x12T\n\x05store\x18\x01 \x01(\x0e\x32\x10.PwEntry.PwStore:\x07UNKNOWNB*\xe2\xfc\xe3\xc4\x01$\x12\"Where the user password is stored.\x12G\n\thash_type\x18\x02 \x01(\x0e\x32\x0f.PwEntry.PwHashB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1bHow the password is hashed.\x12.\n\x03\x61ge\x18\x03 \x01(\rB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19The password age in days.\x12:\n\x07max_age\x18\x04 \x01(\rB)\xe2\xfc\xe3\xc4\x01#\x12!The maximum password age in days.\"F\n\x07PwStore\x12\x0b\n\x07UNKNOWN\x10\x00\x12\n\n\x06PASSWD\x10\x01\x12\n\n\x06SHADOW\x10\x02\x12\t\n\x05GROUP\x10\x03\x12\x0b\n\x07GSHADOW\x10\x04\"|\n\x06PwHash\x12\x07\n\x03\x44\x45S\x10\x00\x12\x07\n\x03MD5\x10\x01\x12\x0c\n\x08\x42LOWFISH\x10\x02\x12\n\n\x06NTHASH\x10\x03\x12\n\n\x06UNUSED\x10\x04\x12\n\n\x06SHA256\x10\x05\x12\n\n\x06SHA512\x10\x06\x12\t\n\x05UNSET\x10\r\x12\x0c\n\x08\x44ISABLED\x10\x0e\x12\t\n\x05\x45MPTY\x10\x0f\"\x90\x02\n\x05Group\x12-\n\x04name\x18\x01 \x01(\tB\x1f\xe2\xfc\xe3\xc4\x01\x19\x12\x17The name of the group. \x12\x41\n\x07members\x18\x02 \x03(\tB0\xe2\xfc\xe3\xc4\x01*\x12(The members of the group, as usernames. \x12:\n\x03gid\x18\x03 \x01(\rB-\xe2\xfc\xe3\xc4\x01\'\x12%The gid of the the group, e.g.: 1001.\x12Y\n\x08pw_entry\x18\x04 \x01(\x0b\x32\x08.PwEntryB=\xe2\xfc\xe3\xc4\x01\x37\x12\x35The password state of the group, e.g.: shadow+sha512.\"\xc3\x10\n\x04User\x12/\n\x08username\x18\x01 \x01(\tB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15The name of the user.\x12\x37\n\x04temp\x18\x02 \x01(\tB)\xe2\xfc\xe3\xc4\x01#\x12!Temporary directory for the user.\x12\x66\n\x07\x64\x65sktop\x18\x04 \x01(\tBU\xe2\xfc\xe3\xc4\x01O\x12MThe desktop directory of the user. E.g. c:\\Documents and Settings\\foo\\Desktop\x12K\n\nlast_logon\x18\x05 \x01(\x04\x42\x37\xe2\xfc\xe3\xc4\x01\x31\n\x0bRDFDatetime\x12\"The last logon time for this user.\x12\x31\n\tfull_name\x18\x06 \x01(\tB\x1e\xe2\xfc\xe3\xc4\x01\x18\x12\x16\x46ull name of the user.\x12H\n\nuserdomain\x18\n \x01(\tB4\xe2\xfc\xe3\xc4\x01.\x12,The domain name of the user. E.g. MICROSOFT.\x12\x85\x01\n\x03sid\x18\x0c \x01(\tBx\xe2\xfc\xe3\xc4\x01r\x12pThe SID of the user as reported by the system. E.g. S-1-5-80-859482183-879914841-863379149-1145462774-2388618682\x12\x62\n\x0buserprofile\x18\r \x01(\tBM\xe2\xfc\xe3\xc4\x01G\x12\x45The profile directory of the user. E.g.c:\\Documents and Settings\\foo.\x12\x8a\x01\n\x07\x61ppdata\x18\x0e \x01(\tBy\xe2\xfc\xe3\xc4\x01s\x12qThe %APPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Roaming\x12\x92\x01\n\x0clocalappdata\x18\x0f \x01(\tB|\xe2\xfc\xe3\xc4\x01v\x12tThe %LOCALAPPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Local\x12\x8b\x01\n\x0einternet_cache\x18\x10 \x01(\tBs\xe2\xfc\xe3\xc4\x01m\x12kThe cache directory of the user. E.g. c:\\Documents and Settings\\foo\\AppData\\Local\\Temporary Internet Files.\x12\x66\n\x07\x63ookies\x18\x11 \x01(\tBU\xe2\xfc\xe3\xc4\x01O\x12MThe cookies directory of the user. E.g. c:\\Documents and Settings\\foo\\Cookies\x12\x64\n\x06recent\x18\x12 \x01(\tBT\xe2\xfc\xe3\xc4\x01N\x12LThe recent directory of the user. E.g. c:\\Documents and Settings\\foo\\Recent.\x12k\n\x08personal\x18\x13 \x01(\tBY\xe2\xfc\xe3\xc4\x01S\x12QThe Personal directory of the user. E.g. c:\\Documents and Settings\\foo\\Documents.\x12g\n\x07startup\x18\x15 \x01(\tBV\xe2\xfc\xe3\xc4\x01P\x12NThe Startup directory of the user. E.g. c:\\Documents and Settings\\foo\\Startup.\x12\xae\x01\n\x10localappdata_low\x18\x16 \x01(\tB\x93\x01\xe2\xfc\xe3\xc4\x01\x8c\x01\x12\x89\x01The LocalLow application data directory for data that doesn\'t roam with the user.  E.g. %USERPROFILE%\\AppData\\LocalLow.  Vista and above.\x12Z\n\x07homedir\x18\x1e \x01(\tBI\xe2\xfc\xe3\xc4\x01\x43\x12\x41The homedir of the user as reported by the system. E.g. /home/foo\x12\x38\n\x03uid\x18\x1f \x01(\rB+\xe2\xfc\xe3\xc4\x01%\x12#The uid of the of the user. E.g. 0.\x12\x38\n\x03gid\x18  \x01(\rB+\xe2\xfc\xe3\xc4\x01%\x12#The gid of the the user. E.g. 5001.\x12?\n\x05shell\x18! \x01(\tB0\xe2\xfc\xe3\xc4\x01*\x12(The shell of the the user. E.g. /bin/sh.\x12X\n\x08pw_entry\x18\" \x01(\x0b\x32\x08.PwEntryB<\xe2\xfc\xe3\xc4\x01\x36\x12\x34The password state of the user, e.g.: shadow+sha512.\x12\x43\n\x04gids\x18# \x03(\rB5\xe2\xfc\xe3\xc4\x01/\x12-Additional group ids the user is a member of.\"\xd9\x0f\n\rKnowledgeBase\x12\x14\n\x05users\x18  \x03(\x0b\x32\x05.User\x12\x63\n\x08hostname\x18\x02 \x01(\tBQ\xe2\xfc\xe3\xc4\x01K\x12IThe fully qualified domain name reported by the OS. E.g. host1.ad.foo.com\x12y\n\ttime_zone\x18\x03 \x01(\tBf\xe2\xfc\xe3\xc4\x01`\x12^The timezone in Olson format E.g. Pacific/Galapagos. http://en.wikipedia.org/wiki/Tz_database.\x12w\n\x02os\x18\x04 \x01(\tBk\xe2\xfc\xe3\xc4\x01\x65\x12\x63The operating system. Case is important, must be one of Windows Linux Darwin FreeBSD OpenBSD NetBSD\x12\x45\n\x10os_major_version\x18\x05 \x01(\rB+\xe2\xfc\xe3\xc4\x01%\x12#The major version of the OS, e.g. 7\x12\x45\n\x10os_minor_version\x18\x06 \x01(\rB+\xe2\xfc\xe3\xc4\x01%\x12#The minor version of the OS, e.g. 7\x12\x42\n\x0c\x65nviron_path\x18\x07 \x01(\tB,\xe2\xfc\xe3\xc4\x01&\x12$The system configured path variable.\x12=\n\x0c\x65nviron_temp\x18\x08 \x01(\tB\'\xe2\xfc\xe3\xc4\x01!\x12\x1fThe system temporary directory.\x12\x34\n\nos_release\x18\t \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18Linux distribution name.\x12\\\n\x12\x65nviron_systemroot\x18\x14 \x01(\tB@\xe2\xfc\xe3\xc4\x01:\x12\x38The value of the %SystemRoot% parameter, E.g. c:\\Windows\x12g\n\x0e\x65nviron_windir\x18\x15 \x01(\tBO\xe2\xfc\xe3\xc4\x01I\x12GThe value of the %WINDIR% parameter. As returned by the system, e.g. C:\x12\x80\x01\n\x14\x65nviron_programfiles\x18\x16 \x01(\tBb\xe2\xfc\xe3\xc4\x01\\\x12ZThe value of the %PROGRAMFILES% parameter as returned by the system, e.g. C:\\Program Files\x12\x8e\x01\n\x17\x65nviron_programfilesx86\x18\x17 \x01(\tBm\xe2\xfc\xe3\xc4\x01g\x12\x65The value of the %PROGRAMFILES(X86)% parameter as returned by the system, e.g. C:\\Program Files (x86)\x12q\n\x13\x65nviron_systemdrive\x18\x18 \x01(\tBT\xe2\xfc\xe3\xc4\x01N\x12LThe value of the %SystemDrive% parameter. As returned by the system, e.g. C:\x12\x9a\x01\n\x17\x65nviron_allusersprofile\x18\x1a \x01(\tBy\xe2\xfc\xe3\xc4\x01s\x12qThe value of the %AllUsersProfile% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users\x12\xaf\x01\n\x17\x65nviron_allusersappdata\x18\x1b \x01(\tB\x8d\x01\xe2\xfc\xe3\xc4\x01\x86\x01\x12\x83\x01The value of the %AllUsersAppData% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users\\Application Data.\x12\x83\x01\n\x13\x63urrent_control_set\x18\x1c \x01(\tBf\xe2\xfc\xe3\xc4\x01`\x12^The current value of the system CurrentControlSet e.g. HKEY_LOCAL_MACHINE\\SYSTEM\\ControlSet001\x12\x83\x01\n\tcode_page\x18\x1e \x01(\tBp\xe2\xfc\xe3\xc4\x01j\x12hThe current code page of the system. Comes from HKLM\\CurrentControlSet\\Control\\Nls\\CodePage e.g. cp1252.\x12O\n\x06\x64omain\x18\x1f \x01(\tB?\xe2\xfc\xe3\xc4\x01\x39\x12\x37The domain the machine is connected to. E.g. MICROSOFT.\x12\x18\n\x10\x44\x45PRECATED_users\x18\x01 \x03(\x0c')
+  ,
+  dependencies=[grr_dot_proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_PWENTRY_PWSTORE = _descriptor.EnumDescriptor(
+  name='PwStore',
+  full_name='PwEntry.PwStore',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNKNOWN', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PASSWD', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SHADOW', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GROUP', index=3, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='GSHADOW', index=4, number=4,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=339,
+  serialized_end=409,
+)
+_sym_db.RegisterEnumDescriptor(_PWENTRY_PWSTORE)
+
+_PWENTRY_PWHASH = _descriptor.EnumDescriptor(
+  name='PwHash',
+  full_name='PwEntry.PwHash',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='DES', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='MD5', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='BLOWFISH', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NTHASH', index=3, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UNUSED', index=4, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SHA256', index=5, number=5,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SHA512', index=6, number=6,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UNSET', index=7, number=13,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DISABLED', index=8, number=14,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='EMPTY', index=9, number=15,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=411,
+  serialized_end=535,
+)
+_sym_db.RegisterEnumDescriptor(_PWENTRY_PWHASH)
+
+
+_PWENTRY = _descriptor.Descriptor(
+  name='PwEntry',
+  full_name='PwEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='store', full_name='PwEntry.store', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=True, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001$\022\"Where the user password is stored.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hash_type', full_name='PwEntry.hash_type', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\035\022\033How the password is hashed.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='age', full_name='PwEntry.age', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\033\022\031The password age in days.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='max_age', full_name='PwEntry.max_age', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001#\022!The maximum password age in days.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _PWENTRY_PWSTORE,
+    _PWENTRY_PWHASH,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=61,
+  serialized_end=535,
+)
+
+
+_GROUP = _descriptor.Descriptor(
+  name='Group',
+  full_name='Group',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='Group.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\031\022\027The name of the group. '), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='members', full_name='Group.members', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001*\022(The members of the group, as usernames. '), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='gid', full_name='Group.gid', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\'\022%The gid of the the group, e.g.: 1001.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pw_entry', full_name='Group.pw_entry', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0017\0225The password state of the group, e.g.: shadow+sha512.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=538,
+  serialized_end=810,
+)
+
+
+_USER = _descriptor.Descriptor(
+  name='User',
+  full_name='User',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='username', full_name='User.username', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025The name of the user.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='temp', full_name='User.temp', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001#\022!Temporary directory for the user.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='desktop', full_name='User.desktop', index=2,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001O\022MThe desktop directory of the user. E.g. c:\\Documents and Settings\\foo\\Desktop'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='last_logon', full_name='User.last_logon', index=3,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0011\n\013RDFDatetime\022\"The last logon time for this user.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='full_name', full_name='User.full_name', index=4,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\030\022\026Full name of the user.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='userdomain', full_name='User.userdomain', index=5,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001.\022,The domain name of the user. E.g. MICROSOFT.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sid', full_name='User.sid', index=6,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001r\022pThe SID of the user as reported by the system. E.g. S-1-5-80-859482183-879914841-863379149-1145462774-2388618682'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='userprofile', full_name='User.userprofile', index=7,
+      number=13, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001G\022EThe profile directory of the user. E.g.c:\\Documents and Settings\\foo.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='appdata', full_name='User.appdata', index=8,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001s\022qThe %APPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Roaming'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='localappdata', full_name='User.localappdata', index=9,
+      number=15, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001v\022tThe %LOCALAPPDATA% directory of the user as reported by the system. E.g. c:\\Documents and Settings\\foo\\AppData\\Local'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='internet_cache', full_name='User.internet_cache', index=10,
+      number=16, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001m\022kThe cache directory of the user. E.g. c:\\Documents and Settings\\foo\\AppData\\Local\\Temporary Internet Files.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cookies', full_name='User.cookies', index=11,
+      number=17, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001O\022MThe cookies directory of the user. E.g. c:\\Documents and Settings\\foo\\Cookies'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='recent', full_name='User.recent', index=12,
+      number=18, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001N\022LThe recent directory of the user. E.g. c:\\Documents and Settings\\foo\\Recent.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='personal', full_name='User.personal', index=13,
+      number=19, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001S\022QThe Personal directory of the user. E.g. c:\\Documents and Settings\\foo\\Documents.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='startup', full_name='User.startup', index=14,
+      number=21, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001P\022NThe Startup directory of the user. E.g. c:\\Documents and Settings\\foo\\Startup.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='localappdata_low', full_name='User.localappdata_low', index=15,
+      number=22, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\214\001\022\211\001The LocalLow application data directory for data that doesn\'t roam with the user.  E.g. %USERPROFILE%\\AppData\\LocalLow.  Vista and above.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='homedir', full_name='User.homedir', index=16,
+      number=30, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001C\022AThe homedir of the user as reported by the system. E.g. /home/foo'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='uid', full_name='User.uid', index=17,
+      number=31, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#The uid of the of the user. E.g. 0.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='gid', full_name='User.gid', index=18,
+      number=32, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#The gid of the the user. E.g. 5001.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='shell', full_name='User.shell', index=19,
+      number=33, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001*\022(The shell of the the user. E.g. /bin/sh.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pw_entry', full_name='User.pw_entry', index=20,
+      number=34, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0016\0224The password state of the user, e.g.: shadow+sha512.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='gids', full_name='User.gids', index=21,
+      number=35, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001/\022-Additional group ids the user is a member of.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=813,
+  serialized_end=2928,
+)
+
+
+_KNOWLEDGEBASE = _descriptor.Descriptor(
+  name='KnowledgeBase',
+  full_name='KnowledgeBase',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='users', full_name='KnowledgeBase.users', index=0,
+      number=32, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hostname', full_name='KnowledgeBase.hostname', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001K\022IThe fully qualified domain name reported by the OS. E.g. host1.ad.foo.com'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='time_zone', full_name='KnowledgeBase.time_zone', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001`\022^The timezone in Olson format E.g. Pacific/Galapagos. http://en.wikipedia.org/wiki/Tz_database.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='os', full_name='KnowledgeBase.os', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001e\022cThe operating system. Case is important, must be one of Windows Linux Darwin FreeBSD OpenBSD NetBSD'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='os_major_version', full_name='KnowledgeBase.os_major_version', index=4,
+      number=5, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#The major version of the OS, e.g. 7'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='os_minor_version', full_name='KnowledgeBase.os_minor_version', index=5,
+      number=6, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#The minor version of the OS, e.g. 7'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environ_path', full_name='KnowledgeBase.environ_path', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001&\022$The system configured path variable.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environ_temp', full_name='KnowledgeBase.environ_temp', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001!\022\037The system temporary directory.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='os_release', full_name='KnowledgeBase.os_release', index=8,
+      number=9, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030Linux distribution name.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environ_systemroot', full_name='KnowledgeBase.environ_systemroot', index=9,
+      number=20, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001:\0228The value of the %SystemRoot% parameter, E.g. c:\\Windows'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environ_windir', full_name='KnowledgeBase.environ_windir', index=10,
+      number=21, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001I\022GThe value of the %WINDIR% parameter. As returned by the system, e.g. C:'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environ_programfiles', full_name='KnowledgeBase.environ_programfiles', index=11,
+      number=22, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\\\022ZThe value of the %PROGRAMFILES% parameter as returned by the system, e.g. C:\\Program Files'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environ_programfilesx86', full_name='KnowledgeBase.environ_programfilesx86', index=12,
+      number=23, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001g\022eThe value of the %PROGRAMFILES(X86)% parameter as returned by the system, e.g. C:\\Program Files (x86)'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environ_systemdrive', full_name='KnowledgeBase.environ_systemdrive', index=13,
+      number=24, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001N\022LThe value of the %SystemDrive% parameter. As returned by the system, e.g. C:'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environ_allusersprofile', full_name='KnowledgeBase.environ_allusersprofile', index=14,
+      number=26, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001s\022qThe value of the %AllUsersProfile% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='environ_allusersappdata', full_name='KnowledgeBase.environ_allusersappdata', index=15,
+      number=27, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\206\001\022\203\001The value of the %AllUsersAppData% parameter. As returned by the system, e.g. c:\\Documents and Settings\\All Users\\Application Data.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='current_control_set', full_name='KnowledgeBase.current_control_set', index=16,
+      number=28, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001`\022^The current value of the system CurrentControlSet e.g. HKEY_LOCAL_MACHINE\\SYSTEM\\ControlSet001'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='code_page', full_name='KnowledgeBase.code_page', index=17,
+      number=30, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001j\022hThe current code page of the system. Comes from HKLM\\CurrentControlSet\\Control\\Nls\\CodePage e.g. cp1252.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='domain', full_name='KnowledgeBase.domain', index=18,
+      number=31, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0019\0227The domain the machine is connected to. E.g. MICROSOFT.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='DEPRECATED_users', full_name='KnowledgeBase.DEPRECATED_users', index=19,
+      number=1, type=12, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2931,
+  serialized_end=4940,
+)
+
+_PWENTRY.fields_by_name['store'].enum_type = _PWENTRY_PWSTORE
+_PWENTRY.fields_by_name['hash_type'].enum_type = _PWENTRY_PWHASH
+_PWENTRY_PWSTORE.containing_type = _PWENTRY
+_PWENTRY_PWHASH.containing_type = _PWENTRY
+_GROUP.fields_by_name['pw_entry'].message_type = _PWENTRY
+_USER.fields_by_name['pw_entry'].message_type = _PWENTRY
+_KNOWLEDGEBASE.fields_by_name['users'].message_type = _USER
+DESCRIPTOR.message_types_by_name['PwEntry'] = _PWENTRY
+DESCRIPTOR.message_types_by_name['Group'] = _GROUP
+DESCRIPTOR.message_types_by_name['User'] = _USER
+DESCRIPTOR.message_types_by_name['KnowledgeBase'] = _KNOWLEDGEBASE
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+PwEntry = _reflection.GeneratedProtocolMessageType('PwEntry', (_message.Message,), {
+  'DESCRIPTOR' : _PWENTRY,
+  '__module__' : 'grr.proto.knowledge_base_pb2'
+  # @@protoc_insertion_point(class_scope:PwEntry)
+  })
+_sym_db.RegisterMessage(PwEntry)
+
+Group = _reflection.GeneratedProtocolMessageType('Group', (_message.Message,), {
+  'DESCRIPTOR' : _GROUP,
+  '__module__' : 'grr.proto.knowledge_base_pb2'
+  # @@protoc_insertion_point(class_scope:Group)
+  })
+_sym_db.RegisterMessage(Group)
+
+User = _reflection.GeneratedProtocolMessageType('User', (_message.Message,), {
+  'DESCRIPTOR' : _USER,
+  '__module__' : 'grr.proto.knowledge_base_pb2'
+  # @@protoc_insertion_point(class_scope:User)
+  })
+_sym_db.RegisterMessage(User)
+
+KnowledgeBase = _reflection.GeneratedProtocolMessageType('KnowledgeBase', (_message.Message,), {
+  'DESCRIPTOR' : _KNOWLEDGEBASE,
+  '__module__' : 'grr.proto.knowledge_base_pb2'
+  # @@protoc_insertion_point(class_scope:KnowledgeBase)
+  })
+_sym_db.RegisterMessage(KnowledgeBase)
+
+
+_PWENTRY.fields_by_name['store']._options = None
+_PWENTRY.fields_by_name['hash_type']._options = None
+_PWENTRY.fields_by_name['age']._options = None
+_PWENTRY.fields_by_name['max_age']._options = None
+_GROUP.fields_by_name['name']._options = None
+_GROUP.fields_by_name['members']._options = None
+_GROUP.fields_by_name['gid']._options = None
+_GROUP.fields_by_name['pw_entry']._options = None
+_USER.fields_by_name['username']._options = None
+_USER.fields_by_name['temp']._options = None
+_USER.fields_by_name['desktop']._options = None
+_USER.fields_by_name['last_logon']._options = None
+_USER.fields_by_name['full_name']._options = None
+_USER.fields_by_name['userdomain']._options = None
+_USER.fields_by_name['sid']._options = None
+_USER.fields_by_name['userprofile']._options = None
+_USER.fields_by_name['appdata']._options = None
+_USER.fields_by_name['localappdata']._options = None
+_USER.fields_by_name['internet_cache']._options = None
+_USER.fields_by_name['cookies']._options = None
+_USER.fields_by_name['recent']._options = None
+_USER.fields_by_name['personal']._options = None
+_USER.fields_by_name['startup']._options = None
+_USER.fields_by_name['localappdata_low']._options = None
+_USER.fields_by_name['homedir']._options = None
+_USER.fields_by_name['uid']._options = None
+_USER.fields_by_name['gid']._options = None
+_USER.fields_by_name['shell']._options = None
+_USER.fields_by_name['pw_entry']._options = None
+_USER.fields_by_name['gids']._options = None
+_KNOWLEDGEBASE.fields_by_name['hostname']._options = None
+_KNOWLEDGEBASE.fields_by_name['time_zone']._options = None
+_KNOWLEDGEBASE.fields_by_name['os']._options = None
+_KNOWLEDGEBASE.fields_by_name['os_major_version']._options = None
+_KNOWLEDGEBASE.fields_by_name['os_minor_version']._options = None
+_KNOWLEDGEBASE.fields_by_name['environ_path']._options = None
+_KNOWLEDGEBASE.fields_by_name['environ_temp']._options = None
+_KNOWLEDGEBASE.fields_by_name['os_release']._options = None
+_KNOWLEDGEBASE.fields_by_name['environ_systemroot']._options = None
+_KNOWLEDGEBASE.fields_by_name['environ_windir']._options = None
+_KNOWLEDGEBASE.fields_by_name['environ_programfiles']._options = None
+_KNOWLEDGEBASE.fields_by_name['environ_programfilesx86']._options = None
+_KNOWLEDGEBASE.fields_by_name['environ_systemdrive']._options = None
+_KNOWLEDGEBASE.fields_by_name['environ_allusersprofile']._options = None
+_KNOWLEDGEBASE.fields_by_name['environ_allusersappdata']._options = None
+_KNOWLEDGEBASE.fields_by_name['current_control_set']._options = None
+_KNOWLEDGEBASE.fields_by_name['code_page']._options = None
+_KNOWLEDGEBASE.fields_by_name['domain']._options = None
+# @@protoc_insertion_point(module_scope)
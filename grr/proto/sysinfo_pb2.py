@@ -0,0 +1,3425 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: grr/proto/sysinfo.proto
+
+import sys
+_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import reflection as _reflection
+from google.protobuf import symbol_database as _symbol_database
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from grr.proto import jobs_pb2 as grr_dot_proto_dot_jobs__pb2
+from grr.proto import semantic_pb2 as grr_dot_proto_dot_semantic__pb2
+
+
+DESCRIPTOR = _descriptor.FileDescriptor(
+  name='grr/proto/sysinfo.proto',
+  package='',
+  syntax='proto2',
+  serialized_options=None,
+  serialized_pb=_b('\n\x17grr/proto/sysinfo.proto\x1a\x14grr/proto/jobs.proto\x1a\x18grr/proto/semantic.proto\"\xfe\x03\n\x11PackageRepository\x12;\n\x02id\x18\x01 \x01(\tB/\xe2\xfc\xe3\xc4\x01)\x12\'Repository id (as referenced by client)\x12;\n\x04name\x18\x02 \x01(\tB-\xe2\xfc\xe3\xc4\x01\'\x12%Repository name (human readable name)\x12\x43\n\x08revision\x18\x03 \x01(\tB1\xe2\xfc\xe3\xc4\x01+\x12)Repository revision (typically timestamp)\x12@\n\x0blast_update\x18\x04 \x01(\tB+\xe2\xfc\xe3\xc4\x01%\x12#Repository last updated date & time\x12>\n\x0cnum_packages\x18\x05 \x01(\tB(\xe2\xfc\xe3\xc4\x01\"\x12 Number of packages in repository\x12:\n\x04size\x18\x06 \x01(\tB,\xe2\xfc\xe3\xc4\x01&\x12$Repository size (arbitrary SI units)\x12+\n\x07\x62\x61seurl\x18\x07 \x01(\tB\x1a\xe2\xfc\xe3\xc4\x01\x14\x12\x12Repository baseurl\x12?\n\x07timeout\x18\x08 \x01(\tB.\xe2\xfc\xe3\xc4\x01(\x12&Repository metadata expiration timeout\"\xa2\x01\n\x0fManagementAgent\x12\x39\n\x04name\x18\x01 \x01(\tB+\xe2\xfc\xe3\xc4\x01%\x12#Management agent name (puppet etc).\x12T\n\x0clast_success\x18\x02 \x01(\x04\x42>\xe2\xfc\xe3\xc4\x01\x38\n\x0bRDFDatetime\x12)Time of most recent successful agent run.\"\xaf\x04\n\tPCIDevice\x12\x35\n\x06\x64omain\x18\x01 \x01(\rB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dPCI domain this device is in.\x12\x35\n\x03\x62us\x18\x02 \x01(\rB(\xe2\xfc\xe3\xc4\x01\"\x12 8 bit PCI bus this device is on.\x12\x39\n\x06\x64\x65vice\x18\x03 \x01(\rB)\xe2\xfc\xe3\xc4\x01#\x12!5 bit device location on the bus.\x12\x45\n\x08\x66unction\x18\x04 \x01(\rB3\xe2\xfc\xe3\xc4\x01-\x12+3 bit device function that has been mapped.\x12N\n\x08\x63lass_id\x18\x05 \x01(\tB<\xe2\xfc\xe3\xc4\x01\x36\x12\x34Hex string of 24 bit device class ID (e.g. Display).\x12>\n\x06vendor\x18\x06 \x01(\tB.\xe2\xfc\xe3\xc4\x01(\x12&Hex string of 16 bit device vendor ID.\x12V\n\x10vendor_device_id\x18\x07 \x01(\tB<\xe2\xfc\xe3\xc4\x01\x36\x12\x34Hex string of 16 bit device ID as set by the vendor.\x12J\n\x06\x63onfig\x18\x08 \x01(\x0c\x42:\xe2\xfc\xe3\xc4\x01\x34\x12\x32\x36\x34 to 256 bytes of PCI configuration space header.\"\x97\x04\n\x07Process\x12\x0b\n\x03pid\x18\x01 \x01(\r\x12\x0c\n\x04ppid\x18\x02 \x01(\r\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x0b\n\x03\x65xe\x18\x04 \x01(\t\x12\x0f\n\x07\x63mdline\x18\x05 \x03(\t\x12\r\n\x05\x63time\x18\x06 \x01(\x04\x12\x10\n\x08real_uid\x18\x07 \x01(\r\x12\x15\n\reffective_uid\x18\x08 \x01(\r\x12\x11\n\tsaved_uid\x18\t \x01(\r\x12\x10\n\x08real_gid\x18\n \x01(\r\x12\x15\n\reffective_gid\x18\x0b \x01(\r\x12\x11\n\tsaved_gid\x18\x0c \x01(\r\x12\x10\n\x08username\x18\r \x01(\t\x12\x10\n\x08terminal\x18\x0e \x01(\t\x12\x0e\n\x06status\x18\x0f \x01(\t\x12\x0c\n\x04nice\x18\x10 \x01(\x05\x12\x0b\n\x03\x63wd\x18\x11 \x01(\t\x12\x13\n\x0bnum_threads\x18\x12 \x01(\r\x12\x15\n\ruser_cpu_time\x18\x13 \x01(\x02\x12\x17\n\x0fsystem_cpu_time\x18\x14 \x01(\x02\x12\x13\n\x0b\x63pu_percent\x18\x15 \x01(\x02\x12\x10\n\x08RSS_size\x18\x16 \x01(\x04\x12\x10\n\x08VMS_size\x18\x17 \x01(\x04\x12\x16\n\x0ememory_percent\x18\x18 \x01(\x02\x12\x12\n\nopen_files\x18\x19 \x03(\t\x12\'\n\x0b\x63onnections\x18\x1a \x03(\x0b\x32\x12.NetworkConnection:\x1c\xda\xfc\xe3\xc4\x01\x16\n\x14Process information.\"+\n\x0fNetworkEndpoint\x12\n\n\x02ip\x18\x01 \x01(\t\x12\x0c\n\x04port\x18\x02 \x01(\x05\"\xe9\x04\n\x11NetworkConnection\x12)\n\x06\x66\x61mily\x18\x01 \x01(\x0e\x32\x19.NetworkConnection.Family\x12\x35\n\x04type\x18\x02 \x01(\x0e\x32\x17.NetworkConnection.Type:\x0eUNKNOWN_SOCKET\x12\'\n\rlocal_address\x18\x03 \x01(\x0b\x32\x10.NetworkEndpoint\x12(\n\x0eremote_address\x18\x04 \x01(\x0b\x32\x10.NetworkEndpoint\x12\x30\n\x05state\x18\x05 \x01(\x0e\x32\x18.NetworkConnection.State:\x07UNKNOWN\x12\x0b\n\x03pid\x18\x06 \x01(\r\x12\r\n\x05\x63time\x18\x07 \x01(\x04\";\n\x06\x46\x61mily\x12\x08\n\x04INET\x10\x02\x12\t\n\x05INET6\x10\n\x12\r\n\tINET6_WIN\x10\x17\x12\r\n\tINET6_OSX\x10\x1e\";\n\x04Type\x12\x12\n\x0eUNKNOWN_SOCKET\x10\x00\x12\x0f\n\x0bSOCK_STREAM\x10\x01\x12\x0e\n\nSOCK_DGRAM\x10\x02\"\xd6\x01\n\x05State\x12\x0b\n\x07UNKNOWN\x10\x00\x12\n\n\x06\x43LOSED\x10\x01\x12\n\n\x06LISTEN\x10\x02\x12\x0c\n\x08SYN_SENT\x10\x03\x12\x0c\n\x08SYN_RECV\x10\x04\x12\x0f\n\x0b\x45STABLISHED\x10\x05\x12\r\n\tFIN_WAIT1\x10\x06\x12\r\n\tFIN_WAIT2\x10\x07\x12\x0e\n\nCLOSE_WAIT\x10\x08\x12\x0b\n\x07\x43LOSING\x10\t\x12\x0c\n\x08LAST_ACK\x10\n\x12\r\n\tTIME_WAIT\x10\x0b\x12\x0e\n\nDELETE_TCB\x10\x0c\x12\x08\n\x04NONE\x10\r\x12\t\n\x05\x43LOSE\x10\x0e\"p\n\nFilesystem\x12\x0e\n\x06\x64\x65vice\x18\x01 \x01(\t\x12\x13\n\x0bmount_point\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\r\n\x05label\x18\x04 \x01(\t\x12 \n\x07options\x18\x05 \x01(\x0b\x32\x0f.AttributedDict\"C\n\x06RunKey\x12\x0f\n\x07keyname\x18\x01 \x01(\t\x12\x10\n\x08\x66ilepath\x18\x02 \x01(\t\x12\x16\n\x0blastwritten\x18\x03 \x01(\x04:\x01\x30\"\x8e\x0e\n\x19WindowsServiceInformation\x12.\n\x04name\x18\x01 \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18The name of the service.\x12\x43\n\x0b\x64\x65scription\x18\x02 \x01(\tB.\xe2\xfc\xe3\xc4\x01(\x12&The description string of the service.\x12\x84\x01\n\x06\x62inary\x18\x03 \x01(\x0b\x32\n.StatEntryBh\xe2\xfc\xe3\xc4\x01\x62\x12`The binary on the client. This may also contain an AFF4 urn to the server copy of the same file.\x12\x34\n\x05state\x18\x04 \x01(\tB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1d\x43urrent state of the service.\x12U\n\x0fwmi_information\x18\x05 \x01(\x0b\x32\x05.DictB5\xe2\xfc\xe3\xc4\x01/\x12-Additional information available through WMI.\x12T\n\x0c\x64isplay_name\x18\x06 \x01(\tB>\xe2\xfc\xe3\xc4\x01\x38\x12\x36\x44isplayed name of the service in Windows GUI controls.\x12\x44\n\x11\x64river_package_id\x18\x07 \x01(\tB)\xe2\xfc\xe3\xc4\x01#\x12!Driver Package ID of the service.\x12~\n\rerror_control\x18\x08 \x01(\x0e\x32\'.WindowsServiceInformation.ErrorControlB>\xe2\xfc\xe3\xc4\x01\x38\x12\x36\x42\x65haviour of the service on failure to load/initialize\x12\x35\n\nimage_path\x18\t \x01(\tB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19ImagePath of the service.\x12\x37\n\x0bobject_name\x18\n \x01(\tB\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1aObjectName of the service.\x12[\n\x0cstartup_type\x18\x0b \x01(\x0e\x32&.WindowsServiceInformation.ServiceModeB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Service start options\x12Z\n\x0cservice_type\x18\x0c \x01(\x0e\x32&.WindowsServiceInformation.ServiceTypeB\x1c\xe2\xfc\xe3\xc4\x01\x16\x12\x14Type of the service.\x12l\n\ngroup_name\x18\r \x01(\tBX\xe2\xfc\xe3\xc4\x01R\x12PSpecifies the name of the load ordering group of which this service is a member.\x12I\n\x0bservice_dll\x18\x0e \x01(\tB4\xe2\xfc\xe3\xc4\x01.\x12,Name of the DLL instantiated in the service.\x12\x37\n\x0cregistry_key\x18\x0f \x01(\tB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19The service registry key.\"@\n\x0c\x45rrorControl\x12\x0c\n\x08\x43RITICAL\x10\x03\x12\n\n\x06SEVERE\x10\x02\x12\n\n\x06NORMAL\x10\x01\x12\n\n\x06IGNORE\x10\x00\"\x87\x01\n\x0bServiceMode\x12\x16\n\x12SERVICE_BOOT_START\x10\x00\x12\x18\n\x14SERVICE_SYSTEM_START\x10\x01\x12\x16\n\x12SERVICE_AUTO_START\x10\x02\x12\x18\n\x14SERVICE_DEMAND_START\x10\x03\x12\x14\n\x10SERVICE_DISABLED\x10\x04\"\xa2\x01\n\x0bServiceType\x12\x19\n\x15SERVICE_KERNEL_DRIVER\x10\x01\x12\x1e\n\x1aSERVICE_FILE_SYSTEM_DRIVER\x10\x02\x12\x18\n\x14SERVICE_ADAPTER_ARGS\x10\x04\x12\x1d\n\x19SERVICE_WIN32_OWN_PROCESS\x10\x10\x12\x1f\n\x1bSERVICE_WIN32_SHARE_PROCESS\x10 :\xbf\x01\xda\xfc\xe3\xc4\x01\xb8\x01\n\xb5\x01\x44\x65scribe a windows service or driver. Field names follow the cybox naming scheme where possible: http://cybox.mitre.org/language/version2.0.1/xsddocs/objects/Win_Service_Object.html\"\xce\x06\n\x15OSXServiceInformation\x12%\n\x05label\x18\x01 \x01(\tB\x16\xe2\xfc\xe3\xc4\x01\x10\x12\x0eService label.\x12\x39\n\x07program\x18\x02 \x01(\tB(\xe2\xfc\xe3\xc4\x01\"\x12 Program path run by the service.\x12W\n\x04\x61rgs\x18\x03 \x03(\tBI\xe2\xfc\xe3\xc4\x01\x43\x12\x41Program args.  May also include executable if Program is not set.\x12(\n\x03pid\x18\x04 \x01(\x04\x42\x1b\xe2\xfc\xe3\xc4\x01\x15\x12\x13\x43urrent service PID\x12P\n\x0bsessiontype\x18\x05 \x01(\tB;\xe2\xfc\xe3\xc4\x01\x35\x12\x33SessionType: Aqua|StandardIO|Background|LoginWindow\x12\x41\n\x0elastexitstatus\x18\x06 \x01(\x04\x42)\xe2\xfc\xe3\xc4\x01#\x12!Last exit return code of service.\x12)\n\x07timeout\x18\x07 \x01(\x04\x42\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10Service timeout.\x12\x44\n\x08ondemand\x18\x08 \x01(\x08\x42\x32\xe2\xfc\xe3\xc4\x01,\x12*True if the service should start ondemand.\x12\x45\n\x0bmachservice\x18\t \x03(\tB0\xe2\xfc\xe3\xc4\x01*\x12(Machservices advertised by this service.\x12K\n\x11perjobmachservice\x18\n \x03(\tB0\xe2\xfc\xe3\xc4\x01*\x12(Machservices advertised by this service.\x12\x35\n\x06socket\x18\x0b \x03(\tB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dSockets used by this service.\x12G\n\x05plist\x18\x0f \x01(\tB8\xe2\xfc\xe3\xc4\x01\x32\n\x06RDFURN\x12(The AFF4 location for the service plist.:6\xda\xfc\xe3\xc4\x01\x30\n.Describe an OS X service (launchagent/daemon).\"\xbd\x08\n\x17LinuxServiceInformation\x12.\n\x04name\x18\x01 \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18The name of the service.\x12\x43\n\x0b\x64\x65scription\x18\x02 \x01(\tB.\xe2\xfc\xe3\xc4\x01(\x12&The description string of the service.\x12\x84\x01\n\x06\x62inary\x18\x03 \x01(\x0b\x32\n.StatEntryBh\xe2\xfc\xe3\xc4\x01\x62\x12`The binary on the client. This may also contain an AFF4 urn to the server copy of the same file.\x12W\n\x08software\x18\x04 \x01(\x0b\x32\x10.SoftwarePackageB3\xe2\xfc\xe3\xc4\x01-\x12+Software package that deployed the service.\x12U\n\nstart_mode\x18\x05 \x01(\x0e\x32\".LinuxServiceInformation.StartModeB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Service start options\x12J\n\x08start_on\x18\x06 \x03(\rB8\xe2\xfc\xe3\xc4\x01\x32\x12\x30Specifies the runlevels where this service runs.\x12O\n\x07stop_on\x18\x07 \x03(\rB>\xe2\xfc\xe3\xc4\x01\x38\x12\x36Specifies the runlevels where this service is stopped.\x12R\n\x0bstart_after\x18\x08 \x03(\tB=\xe2\xfc\xe3\xc4\x01\x37\x12\x35Specifies services required before this service runs.\x12V\n\nstop_after\x18\t \x03(\tBB\xe2\xfc\xe3\xc4\x01<\x12:Specifies service required before this service is stopped.\x12J\n\x06\x63onfig\x18\n \x01(\x0b\x32\x0f.AttributedDictB)\xe2\xfc\xe3\xc4\x01#\x12!The configuration of the service.\x12Q\n\x06starts\x18\x0b \x01(\x08\x42\x41\xe2\xfc\xe3\xc4\x01;\x12\x39The service is configured to start up through some means.\"S\n\tStartMode\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x08\n\x04INIT\x10\x01\x12\x0b\n\x07UPSTART\x10\x02\x12\x0b\n\x07SYSTEMD\x10\x03\x12\t\n\x05INETD\x10\x04\x12\n\n\x06XINETD\x10\x05:9\xda\xfc\xe3\xc4\x01\x33\n1Describe an Linux service (init/upstart/systemd).\"\xa3\x02\n\x0fSoftwarePackage\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12\x14\n\x0c\x61rchitecture\x18\x03 \x01(\t\x12\x11\n\tpublisher\x18\x04 \x01(\t\x12=\n\rinstall_state\x18\x05 \x01(\x0e\x32\x1d.SoftwarePackage.InstallState:\x07UNKNOWN\x12\x13\n\x0b\x64\x65scription\x18\x06 \x01(\t\x12\x14\n\x0cinstalled_on\x18\x07 \x01(\x04\x12\x14\n\x0cinstalled_by\x18\x08 \x01(\t\"H\n\x0cInstallState\x12\r\n\tINSTALLED\x10\x00\x12\x0b\n\x07PENDING\x10\x01\x12\x0f\n\x0bUNINSTALLED\x10\x02\x12\x0b\n\x07UNKNOWN\x10\x03\"\x93\x04\n\x12\x42rowserHistoryItem\x12%\n\x03url\x18\x01 \x01(\tB\x18\xe2\xfc\xe3\xc4\x01\x12\x12\x10The URL visited.\x12-\n\x06\x64omain\x18\x02 \x01(\tB\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15\x44omain name accessed.\x12\x44\n\x0b\x61\x63\x63\x65ss_time\x18\x03 \x01(\x04\x42/\xe2\xfc\xe3\xc4\x01)\n\x0bRDFDatetime\x12\x1aTime the URL was accessed.\x12\x36\n\x08referrer\x18\x04 \x01(\tB$\xe2\xfc\xe3\xc4\x01\x1e\x12\x1cReferrer used for the access\x12@\n\x05title\x18\x05 \x01(\tB1\xe2\xfc\xe3\xc4\x01+\x12)Title attribute of the page if available.\x12X\n\x0cprogram_name\x18\x06 \x01(\tBB\xe2\xfc\xe3\xc4\x01<\x12:Name of the program that generated the entry, e.g. Chrome.\x12T\n\nsource_urn\x18\x07 \x01(\tB@\xe2\xfc\xe3\xc4\x01:\n\x06RDFURN\x12\x30Location of object that this entry was found in.\x12\x37\n\rdownload_path\x18\x08 \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18Path of downloaded file.\"\xc4\r\n\x06Volume\x12\x39\n\nis_mounted\x18\x01 \x01(\x08\x42%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dTrue if the volume is mounted\x12,\n\x04name\x18\x02 \x01(\tB\x1e\xe2\xfc\xe3\xc4\x01\x18\x12\x16The name of the volume\x12^\n\x0b\x64\x65vice_path\x18\x03 \x01(\tBI\xe2\xfc\xe3\xc4\x01\x43\x12\x41\x46ull path to the volume, including the device on which it resides\x12K\n\x10\x66ile_system_type\x18\x04 \x01(\tB1\xe2\xfc\xe3\xc4\x01+\x12)Name of the filesystem used on the volume\x12`\n\x16total_allocation_units\x18\x05 \x01(\x04\x42@\xe2\xfc\xe3\xc4\x01:\x12\x38Total number of allocation units available on the volume\x12\\\n\x1bsectors_per_allocation_unit\x18\x06 \x01(\x04\x42\x37\xe2\xfc\xe3\xc4\x01\x31\x12/Number of disk sectors for each allocation unit\x12Q\n\x10\x62ytes_per_sector\x18\x07 \x01(\x04\x42\x37\xe2\xfc\xe3\xc4\x01\x31\x12/Number of disk sectors for each allocation unit\x12\x65\n!actual_available_allocation_units\x18\x08 \x01(\x04\x42:\xe2\xfc\xe3\xc4\x01\x34\x12\x32Number of allocation units available on the volume\x12M\n\rcreation_time\x18\t \x01(\x04\x42\x36\xe2\xfc\xe3\xc4\x01\x30\n\x0bRDFDatetime\x12!Creation timestamp for the volume\x12\x61\n\x15\x66ile_system_flag_list\x18\n \x03(\x0e\x32 .Volume.VolumeFileSystemFlagEnumB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18\x46lags set for the volume\x12:\n\rserial_number\x18\x0b \x01(\tB#\xe2\xfc\xe3\xc4\x01\x1d\x12\x1bSerial number of the volume\x12Q\n\rwindowsvolume\x18\x0c \x01(\x0b\x32\x0e.WindowsVolumeB*\xe2\xfc\xe3\xc4\x01$\x12\"Windows specific volume attributes\x12H\n\nunixvolume\x18\r \x01(\x0b\x32\x0b.UnixVolumeB\'\xe2\xfc\xe3\xc4\x01!\x12\x1fUnix specific volume attributes\"\x9e\x05\n\x18VolumeFileSystemFlagEnum\x12\x1e\n\x1a\x46ILE_CASE_SENSITIVE_SEARCH\x10\x01\x12\x1d\n\x19\x46ILE_CASE_PRESERVED_NAMES\x10\x02\x12\x18\n\x14\x46ILE_UNICODE_ON_DISK\x10\x03\x12\x18\n\x14\x46ILE_PERSISTENT_ACLS\x10\x04\x12\x19\n\x15\x46ILE_FILE_COMPRESSION\x10\x05\x12\x16\n\x12\x46ILE_VOLUME_QUOTAS\x10\x06\x12\x1e\n\x1a\x46ILE_SUPPORTS_SPARSE_FILES\x10\x07\x12 \n\x1c\x46ILE_SUPPORTS_REPARSE_POINTS\x10\x08\x12 \n\x1c\x46ILE_SUPPORTS_REMOTE_STORAGE\x10\t\x12\x1d\n\x19\x46ILE_VOLUME_IS_COMPRESSED\x10\n\x12\x1c\n\x18\x46ILE_SUPPORTS_OBJECT_IDS\x10\x0b\x12\x1c\n\x18\x46ILE_SUPPORTS_ENCRYPTION\x10\x0c\x12\x16\n\x12\x46ILE_NAMED_STREAMS\x10\r\x12\x19\n\x15\x46ILE_READ_ONLY_VOLUME\x10\x0e\x12\x1e\n\x1a\x46ILE_SEQUENTIAL_WRITE_ONCE\x10\x0f\x12\x1e\n\x1a\x46ILE_SUPPORTS_TRANSACTIONS\x10\x10\x12\x1c\n\x18\x46ILE_SUPPORTS_HARD_LINKS\x10\x11\x12%\n!FILE_SUPPORTS_EXTENDED_ATTRIBUTES\x10\x12\x12!\n\x1d\x46ILE_SUPPORTS_OPEN_BY_FILE_ID\x10\x13\x12\x1d\n\x19\x46ILE_SUPPORTS_USN_JOURNAL\x10\x14\x12#\n\x1f\x46ILE_SUPPORTS_INTEGRITY_STREAMS\x10\x15\"\x81\x04\n\rWindowsVolume\x12\x64\n\x0f\x61ttributes_list\x18\x01 \x03(\x0e\x32).WindowsVolume.WindowsVolumeAttributeEnumB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18\x41ttributes of the volume\x12\x32\n\x0c\x64rive_letter\x18\x02 \x01(\tB\x1c\xe2\xfc\xe3\xc4\x01\x16\x12\x14Windows drive letter\x12U\n\ndrive_type\x18\x03 \x01(\x0e\x32#.WindowsVolume.WindowsDriveTypeEnumB\x1c\xe2\xfc\xe3\xc4\x01\x16\x12\x14Windows drive letter\"`\n\x1aWindowsVolumeAttributeEnum\x12\x0c\n\x08READONLY\x10\x00\x12\n\n\x06HIDDEN\x10\x01\x12\x18\n\x14NODEFAULTDRIVELETTER\x10\x02\x12\x0e\n\nSHADOWCOPY\x10\x03\"\x9c\x01\n\x14WindowsDriveTypeEnum\x12\x11\n\rDRIVE_UNKNOWN\x10\x00\x12\x15\n\x11\x44RIVE_NO_ROOT_DIR\x10\x01\x12\x13\n\x0f\x44RIVE_REMOVABLE\x10\x02\x12\x0f\n\x0b\x44RIVE_FIXED\x10\x03\x12\x10\n\x0c\x44RIVE_REMOTE\x10\x04\x12\x0f\n\x0b\x44RIVE_CDROM\x10\x05\x12\x11\n\rDRIVE_RAMDISK\x10\x06\"v\n\nUnixVolume\x12(\n\x0bmount_point\x18\x01 \x01(\tB\x13\xe2\xfc\xe3\xc4\x01\r\x12\x0bMount point\x12>\n\x07options\x18\x02 \x01(\tB-\xe2\xfc\xe3\xc4\x01\'\x12%Options used when mounting the volume\"\xd3\x01\n\tDiskUsage\x12\x33\n\x04path\x18\x01 \x01(\tB%\xe2\xfc\xe3\xc4\x01\x1f\x12\x1dPath this information is for.\x12\x37\n\x05total\x18\x02 \x01(\x04\x42(\xe2\xfc\xe3\xc4\x01\"\x12 Total number of bytes available.\x12+\n\x04used\x18\x03 \x01(\x04\x42\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Number of bytes used.\x12+\n\x04\x66ree\x18\x04 \x01(\x04\x42\x1d\xe2\xfc\xe3\xc4\x01\x17\x12\x15Number of free bytes.\"\xde\x01\n\x16\x44NSClientConfiguration\x12I\n\ndns_server\x18\x01 \x03(\tB5\xe2\xfc\xe3\xc4\x01/\x12-List of DNS servers appended in search order.\x12J\n\ndns_suffix\x18\x02 \x03(\tB6\xe2\xfc\xe3\xc4\x01\x30\x12.List of DNS suffixes appended in search order.:-\xda\xfc\xe3\xc4\x01\'\n%DNS client configuration information.\"\xf1\x04\n\x0cHardwareInfo\x12\x39\n\rserial_number\x18\x01 \x01(\tB\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1aIdentifying/Serial Number.\x12\x39\n\x13system_manufacturer\x18\x02 \x01(\tB\x1c\xe2\xfc\xe3\xc4\x01\x16\x12\x14System Manufacturer.\x12\x39\n\x13system_product_name\x18\x03 \x01(\tB\x1c\xe2\xfc\xe3\xc4\x01\x16\x12\x14System Product Name.\x12)\n\x0bsystem_uuid\x18\x04 \x01(\tB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0cSystem UUID.\x12\x35\n\x11system_sku_number\x18\x05 \x01(\tB\x1a\xe2\xfc\xe3\xc4\x01\x14\x12\x12System SKU Number.\x12-\n\rsystem_family\x18\x06 \x01(\tB\x16\xe2\xfc\xe3\xc4\x01\x10\x12\x0eSystem Family.\x12)\n\x0b\x62ios_vendor\x18\x07 \x01(\tB\x14\xe2\xfc\xe3\xc4\x01\x0e\x12\x0c\x42IOS Vendor.\x12+\n\x0c\x62ios_version\x18\x08 \x01(\tB\x15\xe2\xfc\xe3\xc4\x01\x0f\x12\rBIOS Version.\x12\x35\n\x11\x62ios_release_date\x18\t \x01(\tB\x1a\xe2\xfc\xe3\xc4\x01\x14\x12\x12\x42IOS Release Date.\x12-\n\rbios_rom_size\x18\n \x01(\tB\x16\xe2\xfc\xe3\xc4\x01\x10\x12\x0e\x42IOS ROM Size.\x12-\n\rbios_revision\x18\x0b \x01(\tB\x16\xe2\xfc\xe3\xc4\x01\x10\x12\x0e\x42IOS Revision.\x12\x32\n\x0fsystem_assettag\x18\x0c \x01(\tB\x19\xe2\xfc\xe3\xc4\x01\x13\x12\x11System Asset tag.\"3\n\x14PlistStringDictEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t\"1\n\x12PlistBoolDictEntry\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x08\"n\n!LaunchdStartCalendarIntervalEntry\x12\x0e\n\x06Minute\x18\x01 \x01(\x05\x12\x0c\n\x04Hour\x18\x02 \x01(\x05\x12\x0b\n\x03\x44\x61y\x18\x03 \x01(\x05\x12\x0f\n\x07Weekday\x18\x04 \x01(\x05\x12\r\n\x05Month\x18\x05 \x01(\x05\"\x96\x01\n\x10LaunchdKeepAlive\x12\x16\n\x0eSuccessfulExit\x18\x01 \x01(\x08\x12\x14\n\x0cNetworkState\x18\x02 \x01(\x08\x12&\n\tPathState\x18\x03 \x03(\x0b\x32\x13.PlistBoolDictEntry\x12,\n\x0fOtherJobEnabled\x18\x04 \x03(\x0b\x32\x13.PlistBoolDictEntry\"\xee\x08\n\x0cLaunchdPlist\x12N\n\x08\x61\x66\x66\x34path\x18\x01 \x01(\tB<\xe2\xfc\xe3\xc4\x01\x36\n\x06RDFURN\x12,The location of this file in the AFF4 space.\x12\r\n\x05Label\x18\x02 \x01(\t\x12\x10\n\x08\x44isabled\x18\x03 \x01(\x08\x12\x10\n\x08UserName\x18\x04 \x01(\t\x12\x11\n\tGroupName\x18\x05 \x01(\t\x12\x0f\n\x07Program\x18\x06 \x01(\t\x12\x18\n\x10ProgramArguments\x18\x07 \x03(\t\x12\x15\n\rRootDirectory\x18\x08 \x01(\t\x12\x18\n\x10WorkingDirectory\x18\t \x01(\t\x12\x10\n\x08OnDemand\x18\n \x01(\x08\x12\x11\n\tRunAtLoad\x18\x0b \x01(\x08\x12\x41\n\x15StartCalendarInterval\x18\x0c \x03(\x0b\x32\".LaunchdStartCalendarIntervalEntry\x12\x33\n\x14\x45nvironmentVariables\x18\r \x03(\x0b\x32\x15.PlistStringDictEntry\x12\x11\n\tKeepAlive\x18\x0e \x01(\x08\x12(\n\rKeepAliveDict\x18\x0f \x01(\x0b\x32\x11.LaunchdKeepAlive\x12\x16\n\x0eStandardInPath\x18\x10 \x01(\t\x12\x17\n\x0fStandardOutPath\x18\x11 \x01(\t\x12\x19\n\x11StandardErrorPath\x18\x12 \x01(\t\x12\x18\n\x10LimitLoadToHosts\x18\x13 \x03(\t\x12\x1a\n\x12LimitLoadFromHosts\x18\x14 \x03(\t\x12\x1e\n\x16LimitLoadToSessionType\x18\x15 \x03(\t\x12\x16\n\x0e\x45nableGlobbing\x18\x16 \x01(\x08\x12\x1a\n\x12\x45nableTransactions\x18\x17 \x01(\x08\x12\r\n\x05Umask\x18\x18 \x01(\x05\x12\x0f\n\x07TimeOut\x18\x19 \x01(\x05\x12\x13\n\x0b\x45xitTimeOut\x18\x1a \x01(\x05\x12\x18\n\x10ThrottleInterval\x18\x1b \x01(\x05\x12\x12\n\nInitGroups\x18\x1c \x01(\x08\x12\x12\n\nWatchPaths\x18\x1d \x03(\t\x12\x18\n\x10QueueDirectories\x18\x1e \x03(\t\x12\x14\n\x0cStartOnMount\x18\x1f \x01(\x08\x12\x15\n\rStartInterval\x18  \x01(\x05\x12\r\n\x05\x44\x65\x62ug\x18! \x01(\x08\x12\x17\n\x0fWaitForDebugger\x18\" \x01(\x08\x12\x0c\n\x04Nice\x18# \x01(\x05\x12\x13\n\x0bProcessType\x18$ \x01(\t\x12\x1b\n\x13\x41\x62\x61ndonProcessGroup\x18% \x01(\x08\x12\x15\n\rLowPriorityIO\x18& \x01(\x08\x12\x16\n\x0eLaunchOnlyOnce\x18\' \x01(\x08\x12\x1e\n\x16inetdCompatabilityWait\x18( \x01(\x08\x12\x1a\n\x12SoftResourceLimits\x18) \x01(\x08\x12\x1a\n\x12HardResourceLimits\x18* \x01(\x08\x12\x0f\n\x07Sockets\x18+ \x01(\x08\"\x84\x01\n\x0c\x43ronTabEntry\x12\x0e\n\x06minute\x18\x01 \x01(\t\x12\x0c\n\x04hour\x18\x02 \x01(\t\x12\x12\n\ndayofmonth\x18\x03 \x01(\t\x12\r\n\x05month\x18\x04 \x01(\t\x12\x11\n\tdayofweek\x18\x05 \x01(\t\x12\x0f\n\x07\x63ommand\x18\x06 \x01(\t\x12\x0f\n\x07\x63omment\x18\x07 \x01(\t\"z\n\x0b\x43ronTabFile\x12N\n\x08\x61\x66\x66\x34path\x18\x01 \x01(\tB<\xe2\xfc\xe3\xc4\x01\x36\n\x06RDFURN\x12,The location of this file in the AFF4 space.\x12\x1b\n\x04jobs\x18\x02 \x03(\x0b\x32\r.CronTabEntry\"\xb0\x02\n\x03URI\x12\x46\n\ttransport\x18\x01 \x01(\tB3\xe2\xfc\xe3\xc4\x01-\x12+Transport such http, ftp, mailto, file etc.\x12G\n\x04host\x18\x02 \x01(\tB9\xe2\xfc\xe3\xc4\x01\x33\x12\x31Host/Port portion of the URI. e.g. google.com:80.\x12.\n\x04path\x18\x03 \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18Path portion of the URI.\x12\x30\n\x05query\x18\x04 \x01(\tB!\xe2\xfc\xe3\xc4\x01\x1b\x12\x19Query portion of the URI.\x12\x36\n\x08\x66ragment\x18\x05 \x01(\tB$\xe2\xfc\xe3\xc4\x01\x1e\x12\x1c\x46ragment portion of the URI.\"\x9e\x06\n\x1cWMIActiveScriptEventConsumer\x12\x34\n\nCreatorSID\x18\x01 \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18SID of the event creator\x12Z\n\x0bKillTimeout\x18\x02 \x01(\x04\x42\x45\xe2\xfc\xe3\xc4\x01?\x12=Seconds the script is allowed to run. Default is 0, no limit.\x12L\n\x0bMachineName\x18\x03 \x01(\tB7\xe2\xfc\xe3\xc4\x01\x31\x12/Name of the computer to which WMI sends events.\x12O\n\x10MaximumQueueSize\x18\x04 \x01(\x04\x42\x35\xe2\xfc\xe3\xc4\x01/\x12-Maximum queue size in bytes for the consumer.\x12?\n\x04Name\x18\x05 \x01(\tB1\xe2\xfc\xe3\xc4\x01+\x12)Unique identifier for the event consumer.\x12T\n\x0eScriptFilename\x18\x06 \x01(\tB<\xe2\xfc\xe3\xc4\x01\x36\x12\x34Name of the file from which the script text is read.\x12|\n\x0fScriptingEngine\x18\x07 \x01(\tBc\xe2\xfc\xe3\xc4\x01]\x12[Name of the scripting engine to use, for example, \'VBScript\'. This property cannot be NULL.\x12\xb7\x01\n\nScriptText\x18\x08 \x01(\tB\xa2\x01\xe2\xfc\xe3\xc4\x01\x9b\x01\x12\x98\x01Text of the script that is expressed in a language known to the scripting engine. This property must be NULL if the ScriptFileName property is not NULL.\"\x95\'\n\x1bWMICommandLineEventConsumer\x12\x34\n\nCreatorSID\x18\x01 \x01(\tB \xe2\xfc\xe3\xc4\x01\x1a\x12\x18SID of the event creator\x12\xc2\x01\n\x13\x43ommandLineTemplate\x18\x02 \x01(\tB\xa4\x01\xe2\xfc\xe3\xc4\x01\x9d\x01\x12\x9a\x01Standard string template that specifies the process to be started. This property can be NULL, and the ExecutablePath property is used as the command line.\x12t\n\x10\x43reateNewConsole\x18\x03 \x01(\x08\x42Z\xe2\xfc\xe3\xc4\x01T\x12RNot used. If a value is assigned to this property, a tracing message is generated.\x12\x9a\x02\n\x15\x43reateNewProcessGroup\x18\x04 \x01(\x08\x42\xfa\x01\xe2\xfc\xe3\xc4\x01\xf3\x01\x12\xf0\x01If True, the new process is the root process of a new process group. The process group includes all processes that are descendants of this root process. The process identifier of the new process group is the same as this process identifier.\x12\xc3\x02\n\x14\x43reateSeparateWowVdm\x18\x05 \x01(\x08\x42\xa4\x02\xe2\xfc\xe3\xc4\x01\x9d\x02\x12\x9a\x02If True, the new process runs in a private Virtual DOS Machine (VDM). This is only valid when starting an application running on a 16-bit Windows operating system. If set to False, all applications running on a 16-bit Windows operating system run as threads in a single, shared VDM.\x12\xf1\x01\n\x12\x43reateSharedWowVdm\x18\x06 \x01(\x08\x42\xd4\x01\xe2\xfc\xe3\xc4\x01\xcd\x01\x12\xca\x01If True, the CreateProcess method runs the new process in the shared Virtual DOS Machine (VDM). This property can override the DefaultSeparateVDM switch in the Windows section of Win.ini if set to True.\x12n\n\x0b\x44\x65sktopName\x18\x07 \x01(\tBY\xe2\xfc\xe3\xc4\x01S\x12QNot used. If a value is assigned to this property a tracing message is generated.\x12\xb6\x04\n\x0e\x45xecutablePath\x18\x08 \x01(\tB\x9d\x04\xe2\xfc\xe3\xc4\x01\x96\x04\x12\x93\x04Module to execute. The string can specify the full path and file name of the module to execute, or it can specify a partial name. If a partial name is specified, the current drive and current directory are assumed. The ExecutablePath property can be NULL. In that case, the module name must be the first white space-delimited token in the CommandLineTemplate property value. If using a long file name that contains a space, use quoted strings to indicate where the file name ends and the arguments begin\xe2\x80\x94to clarify the file name.\x12\x8b\x01\n\rFillAttribute\x18\t \x01(\rBt\xe2\xfc\xe3\xc4\x01n\x12lSpecifies the initial text and background colors if a new console window is created in a console application\x12\xb2\x01\n\x0e\x46illAttributes\x18\n \x01(\rB\x99\x01\xe2\xfc\xe3\xc4\x01\x92\x01\x12\x8f\x01Initial text and background colors, if a new console window is created in a console application. This property is ignored in a GUI application.\x12\x8b\x01\n\x10\x46orceOffFeedback\x18\x0b \x01(\x08\x42q\xe2\xfc\xe3\xc4\x01k\x12iIf True, the feedback cursor is forced off while the process is starting. The normal cursor is displayed.\x12\xfd\x02\n\x0f\x46orceOnFeedback\x18\x0c \x01(\x08\x42\xe3\x02\xe2\xfc\xe3\xc4\x01\xdc\x02\x12\xd9\x02If True, the cursor is in feedback mode for two seconds after CreateProcess is called. During those two seconds, if the process makes the first GUI call, the system gives five more seconds to the process. During those five seconds, if the process shows a window, the system gives another five seconds to the process to finish drawing the window.\x12\xdb\x01\n\x0bKillTimeout\x18\r \x01(\rB\xc5\x01\xe2\xfc\xe3\xc4\x01\xbe\x01\x12\xbb\x01Number, in seconds, that the WMI service waits before killing a process - 0 (zero) indicates a process is not to be killed. Killing a process prevents a process from running indefinitely.\x12\x30\n\x04Name\x18\x0e \x01(\tB\"\xe2\xfc\xe3\xc4\x01\x1c\x12\x1aUnique name of a consumer.\x12\x84\x01\n\x08Priority\x18\x0f \x01(\x05\x42r\xe2\xfc\xe3\xc4\x01l\x12jScheduling priority level of the process threads. The following table lists the priority levels available.\x12\xa3\x04\n\x10RunInteractively\x18\x10 \x01(\x08\x42\x88\x04\xe2\xfc\xe3\xc4\x01\x81\x04\x12\xfe\x03If True, the process is launched in the interactive WinStation. If False, the process is launched in the default service WinStation. This property overrides the DesktopName property. This property is only used locally, and only if the interactive user is the same user who set up the consumer. Starting with Windows Vista, the process running the CommandLineEventConsumer instance is started under the LocalSystem account and is in session 0. Services which run in session 0 cannot interact with user sessions.\x12\x35\n\x11ShowWindowCommand\x18\x11 \x01(\rB\x1a\xe2\xfc\xe3\xc4\x01\x14\x12\x12Window show state.\x12M\n\x13UseDefaultErrorMode\x18\x12 \x01(\x08\x42\x30\xe2\xfc\xe3\xc4\x01*\x12(If True, the default error mode is used.\x12\x7f\n\x0bWindowTitle\x18\x13 \x01(\tBj\xe2\xfc\xe3\xc4\x01\x64\x12\x62Title that appears on the title bar of the process. This property is ignored for GUI applications.\x12\x45\n\x10WorkingDirectory\x18\x14 \x01(\tB+\xe2\xfc\xe3\xc4\x01%\x12#Working directory for this process.\x12\x8e\x01\n\x0bXCoordinate\x18\x15 \x01(\rBy\xe2\xfc\xe3\xc4\x01s\x12qX-offset, in pixels, from the left edge of the screen to the left edge of the window, if a new window is created.\x12\x9a\x01\n\x0eXNumCharacters\x18\x16 \x01(\rB\x81\x01\xe2\xfc\xe3\xc4\x01{\x12yScreen buffer width, in character columns, if a new console window is created. This property is ignored in a GUI process.\x12U\n\x05XSize\x18\x17 \x01(\rBF\xe2\xfc\xe3\xc4\x01@\x12>Width, in pixels, of a new window, if a new window is created.\x12\x8c\x01\n\x0bYCoordinate\x18\x18 \x01(\rBw\xe2\xfc\xe3\xc4\x01q\x12oY-offset, in pixels, from the top edge of the screen to the top edge of the window, if a new window is created.\x12\x97\x01\n\x0eYNumCharacters\x18\x19 \x01(\rB\x7f\xe2\xfc\xe3\xc4\x01y\x12wScreen buffer height, in character rows, if a new console window is created. This property is ignored in a GUI process.\x12X\n\x05YSize\x18\x1a \x01(\rBI\xe2\xfc\xe3\xc4\x01\x43\x12\x41Height, in pixels, of the new window, if a new window is created.\x12R\n\x10MaximumQueueSize\x18\x1b \x01(\x04\x42\x38\xe2\xfc\xe3\xc4\x01\x32\x12\x30Maximum queue for a specific consumer, in bytes.\x12M\n\x0bMachineName\x18\x1c \x01(\x04\x42\x38\xe2\xfc\xe3\xc4\x01\x32\x12\x30Maximum queue for a specific consumer, in bytes.')
+  ,
+  dependencies=[grr_dot_proto_dot_jobs__pb2.DESCRIPTOR,grr_dot_proto_dot_semantic__pb2.DESCRIPTOR,])
+
+
+
+_NETWORKCONNECTION_FAMILY = _descriptor.EnumDescriptor(
+  name='Family',
+  full_name='NetworkConnection.Family',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='INET', index=0, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='INET6', index=1, number=10,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='INET6_WIN', index=2, number=23,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='INET6_OSX', index=3, number=30,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2179,
+  serialized_end=2238,
+)
+_sym_db.RegisterEnumDescriptor(_NETWORKCONNECTION_FAMILY)
+
+_NETWORKCONNECTION_TYPE = _descriptor.EnumDescriptor(
+  name='Type',
+  full_name='NetworkConnection.Type',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNKNOWN_SOCKET', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SOCK_STREAM', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SOCK_DGRAM', index=2, number=2,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2240,
+  serialized_end=2299,
+)
+_sym_db.RegisterEnumDescriptor(_NETWORKCONNECTION_TYPE)
+
+_NETWORKCONNECTION_STATE = _descriptor.EnumDescriptor(
+  name='State',
+  full_name='NetworkConnection.State',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNKNOWN', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CLOSED', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LISTEN', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SYN_SENT', index=3, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SYN_RECV', index=4, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='ESTABLISHED', index=5, number=5,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FIN_WAIT1', index=6, number=6,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FIN_WAIT2', index=7, number=7,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CLOSE_WAIT', index=8, number=8,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CLOSING', index=9, number=9,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='LAST_ACK', index=10, number=10,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='TIME_WAIT', index=11, number=11,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DELETE_TCB', index=12, number=12,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NONE', index=13, number=13,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='CLOSE', index=14, number=14,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=2302,
+  serialized_end=2516,
+)
+_sym_db.RegisterEnumDescriptor(_NETWORKCONNECTION_STATE)
+
+_WINDOWSSERVICEINFORMATION_ERRORCONTROL = _descriptor.EnumDescriptor(
+  name='ErrorControl',
+  full_name='WindowsServiceInformation.ErrorControl',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='CRITICAL', index=0, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SEVERE', index=1, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NORMAL', index=2, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='IGNORE', index=3, number=0,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=3947,
+  serialized_end=4011,
+)
+_sym_db.RegisterEnumDescriptor(_WINDOWSSERVICEINFORMATION_ERRORCONTROL)
+
+_WINDOWSSERVICEINFORMATION_SERVICEMODE = _descriptor.EnumDescriptor(
+  name='ServiceMode',
+  full_name='WindowsServiceInformation.ServiceMode',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_BOOT_START', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_SYSTEM_START', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_AUTO_START', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_DEMAND_START', index=3, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_DISABLED', index=4, number=4,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=4014,
+  serialized_end=4149,
+)
+_sym_db.RegisterEnumDescriptor(_WINDOWSSERVICEINFORMATION_SERVICEMODE)
+
+_WINDOWSSERVICEINFORMATION_SERVICETYPE = _descriptor.EnumDescriptor(
+  name='ServiceType',
+  full_name='WindowsServiceInformation.ServiceType',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_KERNEL_DRIVER', index=0, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_FILE_SYSTEM_DRIVER', index=1, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_ADAPTER_ARGS', index=2, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_WIN32_OWN_PROCESS', index=3, number=16,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SERVICE_WIN32_SHARE_PROCESS', index=4, number=32,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=4152,
+  serialized_end=4314,
+)
+_sym_db.RegisterEnumDescriptor(_WINDOWSSERVICEINFORMATION_SERVICETYPE)
+
+_LINUXSERVICEINFORMATION_STARTMODE = _descriptor.EnumDescriptor(
+  name='StartMode',
+  full_name='LinuxServiceInformation.StartMode',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='UNKNOWN', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='INIT', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UPSTART', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SYSTEMD', index=3, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='INETD', index=4, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='XINETD', index=5, number=5,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=6303,
+  serialized_end=6386,
+)
+_sym_db.RegisterEnumDescriptor(_LINUXSERVICEINFORMATION_STARTMODE)
+
+_SOFTWAREPACKAGE_INSTALLSTATE = _descriptor.EnumDescriptor(
+  name='InstallState',
+  full_name='SoftwarePackage.InstallState',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='INSTALLED', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='PENDING', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UNINSTALLED', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='UNKNOWN', index=3, number=3,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=6667,
+  serialized_end=6739,
+)
+_sym_db.RegisterEnumDescriptor(_SOFTWAREPACKAGE_INSTALLSTATE)
+
+_VOLUME_VOLUMEFILESYSTEMFLAGENUM = _descriptor.EnumDescriptor(
+  name='VolumeFileSystemFlagEnum',
+  full_name='Volume.VolumeFileSystemFlagEnum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='FILE_CASE_SENSITIVE_SEARCH', index=0, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_CASE_PRESERVED_NAMES', index=1, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_UNICODE_ON_DISK', index=2, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_PERSISTENT_ACLS', index=3, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_FILE_COMPRESSION', index=4, number=5,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_VOLUME_QUOTAS', index=5, number=6,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_SPARSE_FILES', index=6, number=7,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_REPARSE_POINTS', index=7, number=8,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_REMOTE_STORAGE', index=8, number=9,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_VOLUME_IS_COMPRESSED', index=9, number=10,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_OBJECT_IDS', index=10, number=11,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_ENCRYPTION', index=11, number=12,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_NAMED_STREAMS', index=12, number=13,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_READ_ONLY_VOLUME', index=13, number=14,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SEQUENTIAL_WRITE_ONCE', index=14, number=15,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_TRANSACTIONS', index=15, number=16,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_HARD_LINKS', index=16, number=17,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_EXTENDED_ATTRIBUTES', index=17, number=18,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_OPEN_BY_FILE_ID', index=18, number=19,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_USN_JOURNAL', index=19, number=20,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='FILE_SUPPORTS_INTEGRITY_STREAMS', index=20, number=21,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=8338,
+  serialized_end=9008,
+)
+_sym_db.RegisterEnumDescriptor(_VOLUME_VOLUMEFILESYSTEMFLAGENUM)
+
+_WINDOWSVOLUME_WINDOWSVOLUMEATTRIBUTEENUM = _descriptor.EnumDescriptor(
+  name='WindowsVolumeAttributeEnum',
+  full_name='WindowsVolume.WindowsVolumeAttributeEnum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='READONLY', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='HIDDEN', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='NODEFAULTDRIVELETTER', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='SHADOWCOPY', index=3, number=3,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=9269,
+  serialized_end=9365,
+)
+_sym_db.RegisterEnumDescriptor(_WINDOWSVOLUME_WINDOWSVOLUMEATTRIBUTEENUM)
+
+_WINDOWSVOLUME_WINDOWSDRIVETYPEENUM = _descriptor.EnumDescriptor(
+  name='WindowsDriveTypeEnum',
+  full_name='WindowsVolume.WindowsDriveTypeEnum',
+  filename=None,
+  file=DESCRIPTOR,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='DRIVE_UNKNOWN', index=0, number=0,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DRIVE_NO_ROOT_DIR', index=1, number=1,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DRIVE_REMOVABLE', index=2, number=2,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DRIVE_FIXED', index=3, number=3,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DRIVE_REMOTE', index=4, number=4,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DRIVE_CDROM', index=5, number=5,
+      serialized_options=None,
+      type=None),
+    _descriptor.EnumValueDescriptor(
+      name='DRIVE_RAMDISK', index=6, number=6,
+      serialized_options=None,
+      type=None),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=9368,
+  serialized_end=9524,
+)
+_sym_db.RegisterEnumDescriptor(_WINDOWSVOLUME_WINDOWSDRIVETYPEENUM)
+
+
+_PACKAGEREPOSITORY = _descriptor.Descriptor(
+  name='PackageRepository',
+  full_name='PackageRepository',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='id', full_name='PackageRepository.id', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001)\022\'Repository id (as referenced by client)'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='PackageRepository.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\'\022%Repository name (human readable name)'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='revision', full_name='PackageRepository.revision', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001+\022)Repository revision (typically timestamp)'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='last_update', full_name='PackageRepository.last_update', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#Repository last updated date & time'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_packages', full_name='PackageRepository.num_packages', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\"\022 Number of packages in repository'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='PackageRepository.size', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001&\022$Repository size (arbitrary SI units)'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='baseurl', full_name='PackageRepository.baseurl', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\024\022\022Repository baseurl'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timeout', full_name='PackageRepository.timeout', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001(\022&Repository metadata expiration timeout'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=76,
+  serialized_end=586,
+)
+
+
+_MANAGEMENTAGENT = _descriptor.Descriptor(
+  name='ManagementAgent',
+  full_name='ManagementAgent',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='ManagementAgent.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#Management agent name (puppet etc).'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='last_success', full_name='ManagementAgent.last_success', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0018\n\013RDFDatetime\022)Time of most recent successful agent run.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=589,
+  serialized_end=751,
+)
+
+
+_PCIDEVICE = _descriptor.Descriptor(
+  name='PCIDevice',
+  full_name='PCIDevice',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='domain', full_name='PCIDevice.domain', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035PCI domain this device is in.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bus', full_name='PCIDevice.bus', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\"\022 8 bit PCI bus this device is on.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='device', full_name='PCIDevice.device', index=2,
+      number=3, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001#\022!5 bit device location on the bus.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='function', full_name='PCIDevice.function', index=3,
+      number=4, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001-\022+3 bit device function that has been mapped.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='class_id', full_name='PCIDevice.class_id', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0016\0224Hex string of 24 bit device class ID (e.g. Display).'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='vendor', full_name='PCIDevice.vendor', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001(\022&Hex string of 16 bit device vendor ID.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='vendor_device_id', full_name='PCIDevice.vendor_device_id', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0016\0224Hex string of 16 bit device ID as set by the vendor.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config', full_name='PCIDevice.config', index=7,
+      number=8, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b(""),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0014\022264 to 256 bytes of PCI configuration space header.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=754,
+  serialized_end=1313,
+)
+
+
+_PROCESS = _descriptor.Descriptor(
+  name='Process',
+  full_name='Process',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='pid', full_name='Process.pid', index=0,
+      number=1, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ppid', full_name='Process.ppid', index=1,
+      number=2, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='Process.name', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='exe', full_name='Process.exe', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cmdline', full_name='Process.cmdline', index=4,
+      number=5, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ctime', full_name='Process.ctime', index=5,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='real_uid', full_name='Process.real_uid', index=6,
+      number=7, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='effective_uid', full_name='Process.effective_uid', index=7,
+      number=8, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='saved_uid', full_name='Process.saved_uid', index=8,
+      number=9, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='real_gid', full_name='Process.real_gid', index=9,
+      number=10, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='effective_gid', full_name='Process.effective_gid', index=10,
+      number=11, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='saved_gid', full_name='Process.saved_gid', index=11,
+      number=12, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='username', full_name='Process.username', index=12,
+      number=13, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='terminal', full_name='Process.terminal', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='Process.status', index=14,
+      number=15, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='nice', full_name='Process.nice', index=15,
+      number=16, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cwd', full_name='Process.cwd', index=16,
+      number=17, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='num_threads', full_name='Process.num_threads', index=17,
+      number=18, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='user_cpu_time', full_name='Process.user_cpu_time', index=18,
+      number=19, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='system_cpu_time', full_name='Process.system_cpu_time', index=19,
+      number=20, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='cpu_percent', full_name='Process.cpu_percent', index=20,
+      number=21, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='RSS_size', full_name='Process.RSS_size', index=21,
+      number=22, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='VMS_size', full_name='Process.VMS_size', index=22,
+      number=23, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='memory_percent', full_name='Process.memory_percent', index=23,
+      number=24, type=2, cpp_type=6, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='open_files', full_name='Process.open_files', index=24,
+      number=25, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='connections', full_name='Process.connections', index=25,
+      number=26, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=_b('\332\374\343\304\001\026\n\024Process information.'),
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1316,
+  serialized_end=1851,
+)
+
+
+_NETWORKENDPOINT = _descriptor.Descriptor(
+  name='NetworkEndpoint',
+  full_name='NetworkEndpoint',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='ip', full_name='NetworkEndpoint.ip', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='port', full_name='NetworkEndpoint.port', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1853,
+  serialized_end=1896,
+)
+
+
+_NETWORKCONNECTION = _descriptor.Descriptor(
+  name='NetworkConnection',
+  full_name='NetworkConnection',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='family', full_name='NetworkConnection.family', index=0,
+      number=1, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=2,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='NetworkConnection.type', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=True, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='local_address', full_name='NetworkConnection.local_address', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='remote_address', full_name='NetworkConnection.remote_address', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='NetworkConnection.state', index=4,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=True, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pid', full_name='NetworkConnection.pid', index=5,
+      number=6, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ctime', full_name='NetworkConnection.ctime', index=6,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _NETWORKCONNECTION_FAMILY,
+    _NETWORKCONNECTION_TYPE,
+    _NETWORKCONNECTION_STATE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=1899,
+  serialized_end=2516,
+)
+
+
+_FILESYSTEM = _descriptor.Descriptor(
+  name='Filesystem',
+  full_name='Filesystem',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='device', full_name='Filesystem.device', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='mount_point', full_name='Filesystem.mount_point', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='Filesystem.type', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='label', full_name='Filesystem.label', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='options', full_name='Filesystem.options', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2518,
+  serialized_end=2630,
+)
+
+
+_RUNKEY = _descriptor.Descriptor(
+  name='RunKey',
+  full_name='RunKey',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='keyname', full_name='RunKey.keyname', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='filepath', full_name='RunKey.filepath', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='lastwritten', full_name='RunKey.lastwritten', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=True, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2632,
+  serialized_end=2699,
+)
+
+
+_WINDOWSSERVICEINFORMATION = _descriptor.Descriptor(
+  name='WindowsServiceInformation',
+  full_name='WindowsServiceInformation',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='WindowsServiceInformation.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030The name of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='WindowsServiceInformation.description', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001(\022&The description string of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='binary', full_name='WindowsServiceInformation.binary', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001b\022`The binary on the client. This may also contain an AFF4 urn to the server copy of the same file.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='state', full_name='WindowsServiceInformation.state', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035Current state of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='wmi_information', full_name='WindowsServiceInformation.wmi_information', index=4,
+      number=5, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001/\022-Additional information available through WMI.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='display_name', full_name='WindowsServiceInformation.display_name', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0018\0226Displayed name of the service in Windows GUI controls.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='driver_package_id', full_name='WindowsServiceInformation.driver_package_id', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001#\022!Driver Package ID of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='error_control', full_name='WindowsServiceInformation.error_control', index=7,
+      number=8, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=3,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0018\0226Behaviour of the service on failure to load/initialize'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='image_path', full_name='WindowsServiceInformation.image_path', index=8,
+      number=9, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\033\022\031ImagePath of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='object_name', full_name='WindowsServiceInformation.object_name', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\034\022\032ObjectName of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='startup_type', full_name='WindowsServiceInformation.startup_type', index=10,
+      number=11, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Service start options'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='service_type', full_name='WindowsServiceInformation.service_type', index=11,
+      number=12, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=1,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\026\022\024Type of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='group_name', full_name='WindowsServiceInformation.group_name', index=12,
+      number=13, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001R\022PSpecifies the name of the load ordering group of which this service is a member.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='service_dll', full_name='WindowsServiceInformation.service_dll', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001.\022,Name of the DLL instantiated in the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='registry_key', full_name='WindowsServiceInformation.registry_key', index=14,
+      number=15, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\033\022\031The service registry key.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _WINDOWSSERVICEINFORMATION_ERRORCONTROL,
+    _WINDOWSSERVICEINFORMATION_SERVICEMODE,
+    _WINDOWSSERVICEINFORMATION_SERVICETYPE,
+  ],
+  serialized_options=_b('\332\374\343\304\001\270\001\n\265\001Describe a windows service or driver. Field names follow the cybox naming scheme where possible: http://cybox.mitre.org/language/version2.0.1/xsddocs/objects/Win_Service_Object.html'),
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2702,
+  serialized_end=4508,
+)
+
+
+_OSXSERVICEINFORMATION = _descriptor.Descriptor(
+  name='OSXServiceInformation',
+  full_name='OSXServiceInformation',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='label', full_name='OSXServiceInformation.label', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\020\022\016Service label.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='program', full_name='OSXServiceInformation.program', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\"\022 Program path run by the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='args', full_name='OSXServiceInformation.args', index=2,
+      number=3, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001C\022AProgram args.  May also include executable if Program is not set.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='pid', full_name='OSXServiceInformation.pid', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\025\022\023Current service PID'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sessiontype', full_name='OSXServiceInformation.sessiontype', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0015\0223SessionType: Aqua|StandardIO|Background|LoginWindow'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='lastexitstatus', full_name='OSXServiceInformation.lastexitstatus', index=5,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001#\022!Last exit return code of service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='timeout', full_name='OSXServiceInformation.timeout', index=6,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\022\022\020Service timeout.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ondemand', full_name='OSXServiceInformation.ondemand', index=7,
+      number=8, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001,\022*True if the service should start ondemand.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='machservice', full_name='OSXServiceInformation.machservice', index=8,
+      number=9, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001*\022(Machservices advertised by this service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='perjobmachservice', full_name='OSXServiceInformation.perjobmachservice', index=9,
+      number=10, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001*\022(Machservices advertised by this service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='socket', full_name='OSXServiceInformation.socket', index=10,
+      number=11, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035Sockets used by this service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='plist', full_name='OSXServiceInformation.plist', index=11,
+      number=15, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0012\n\006RDFURN\022(The AFF4 location for the service plist.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=_b('\332\374\343\304\0010\n.Describe an OS X service (launchagent/daemon).'),
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=4511,
+  serialized_end=5357,
+)
+
+
+_LINUXSERVICEINFORMATION = _descriptor.Descriptor(
+  name='LinuxServiceInformation',
+  full_name='LinuxServiceInformation',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='LinuxServiceInformation.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030The name of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='LinuxServiceInformation.description', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001(\022&The description string of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='binary', full_name='LinuxServiceInformation.binary', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001b\022`The binary on the client. This may also contain an AFF4 urn to the server copy of the same file.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='software', full_name='LinuxServiceInformation.software', index=3,
+      number=4, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001-\022+Software package that deployed the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='start_mode', full_name='LinuxServiceInformation.start_mode', index=4,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Service start options'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='start_on', full_name='LinuxServiceInformation.start_on', index=5,
+      number=6, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0012\0220Specifies the runlevels where this service runs.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='stop_on', full_name='LinuxServiceInformation.stop_on', index=6,
+      number=7, type=13, cpp_type=3, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0018\0226Specifies the runlevels where this service is stopped.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='start_after', full_name='LinuxServiceInformation.start_after', index=7,
+      number=8, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0017\0225Specifies services required before this service runs.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='stop_after', full_name='LinuxServiceInformation.stop_after', index=8,
+      number=9, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001<\022:Specifies service required before this service is stopped.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='config', full_name='LinuxServiceInformation.config', index=9,
+      number=10, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001#\022!The configuration of the service.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='starts', full_name='LinuxServiceInformation.starts', index=10,
+      number=11, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001;\0229The service is configured to start up through some means.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _LINUXSERVICEINFORMATION_STARTMODE,
+  ],
+  serialized_options=_b('\332\374\343\304\0013\n1Describe an Linux service (init/upstart/systemd).'),
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=5360,
+  serialized_end=6445,
+)
+
+
+_SOFTWAREPACKAGE = _descriptor.Descriptor(
+  name='SoftwarePackage',
+  full_name='SoftwarePackage',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='SoftwarePackage.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='SoftwarePackage.version', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='architecture', full_name='SoftwarePackage.architecture', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='publisher', full_name='SoftwarePackage.publisher', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='install_state', full_name='SoftwarePackage.install_state', index=4,
+      number=5, type=14, cpp_type=8, label=1,
+      has_default_value=True, default_value=3,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='description', full_name='SoftwarePackage.description', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='installed_on', full_name='SoftwarePackage.installed_on', index=6,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='installed_by', full_name='SoftwarePackage.installed_by', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _SOFTWAREPACKAGE_INSTALLSTATE,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6448,
+  serialized_end=6739,
+)
+
+
+_BROWSERHISTORYITEM = _descriptor.Descriptor(
+  name='BrowserHistoryItem',
+  full_name='BrowserHistoryItem',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='url', full_name='BrowserHistoryItem.url', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\022\022\020The URL visited.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='domain', full_name='BrowserHistoryItem.domain', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Domain name accessed.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='access_time', full_name='BrowserHistoryItem.access_time', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001)\n\013RDFDatetime\022\032Time the URL was accessed.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='referrer', full_name='BrowserHistoryItem.referrer', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\036\022\034Referrer used for the access'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='title', full_name='BrowserHistoryItem.title', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001+\022)Title attribute of the page if available.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='program_name', full_name='BrowserHistoryItem.program_name', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001<\022:Name of the program that generated the entry, e.g. Chrome.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='source_urn', full_name='BrowserHistoryItem.source_urn', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001:\n\006RDFURN\0220Location of object that this entry was found in.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='download_path', full_name='BrowserHistoryItem.download_path', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030Path of downloaded file.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=6742,
+  serialized_end=7273,
+)
+
+
+_VOLUME = _descriptor.Descriptor(
+  name='Volume',
+  full_name='Volume',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='is_mounted', full_name='Volume.is_mounted', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035True if the volume is mounted'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='name', full_name='Volume.name', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\030\022\026The name of the volume'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='device_path', full_name='Volume.device_path', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001C\022AFull path to the volume, including the device on which it resides'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='file_system_type', full_name='Volume.file_system_type', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001+\022)Name of the filesystem used on the volume'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total_allocation_units', full_name='Volume.total_allocation_units', index=4,
+      number=5, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001:\0228Total number of allocation units available on the volume'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='sectors_per_allocation_unit', full_name='Volume.sectors_per_allocation_unit', index=5,
+      number=6, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0011\022/Number of disk sectors for each allocation unit'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bytes_per_sector', full_name='Volume.bytes_per_sector', index=6,
+      number=7, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0011\022/Number of disk sectors for each allocation unit'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='actual_available_allocation_units', full_name='Volume.actual_available_allocation_units', index=7,
+      number=8, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0014\0222Number of allocation units available on the volume'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='creation_time', full_name='Volume.creation_time', index=8,
+      number=9, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0010\n\013RDFDatetime\022!Creation timestamp for the volume'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='file_system_flag_list', full_name='Volume.file_system_flag_list', index=9,
+      number=10, type=14, cpp_type=8, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030Flags set for the volume'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='serial_number', full_name='Volume.serial_number', index=10,
+      number=11, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\035\022\033Serial number of the volume'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='windowsvolume', full_name='Volume.windowsvolume', index=11,
+      number=12, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001$\022\"Windows specific volume attributes'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='unixvolume', full_name='Volume.unixvolume', index=12,
+      number=13, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001!\022\037Unix specific volume attributes'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _VOLUME_VOLUMEFILESYSTEMFLAGENUM,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=7276,
+  serialized_end=9008,
+)
+
+
+_WINDOWSVOLUME = _descriptor.Descriptor(
+  name='WindowsVolume',
+  full_name='WindowsVolume',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='attributes_list', full_name='WindowsVolume.attributes_list', index=0,
+      number=1, type=14, cpp_type=8, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030Attributes of the volume'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='drive_letter', full_name='WindowsVolume.drive_letter', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\026\022\024Windows drive letter'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='drive_type', full_name='WindowsVolume.drive_type', index=2,
+      number=3, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\026\022\024Windows drive letter'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+    _WINDOWSVOLUME_WINDOWSVOLUMEATTRIBUTEENUM,
+    _WINDOWSVOLUME_WINDOWSDRIVETYPEENUM,
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9011,
+  serialized_end=9524,
+)
+
+
+_UNIXVOLUME = _descriptor.Descriptor(
+  name='UnixVolume',
+  full_name='UnixVolume',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='mount_point', full_name='UnixVolume.mount_point', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\r\022\013Mount point'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='options', full_name='UnixVolume.options', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\'\022%Options used when mounting the volume'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9526,
+  serialized_end=9644,
+)
+
+
+_DISKUSAGE = _descriptor.Descriptor(
+  name='DiskUsage',
+  full_name='DiskUsage',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='path', full_name='DiskUsage.path', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\037\022\035Path this information is for.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='total', full_name='DiskUsage.total', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\"\022 Total number of bytes available.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='used', full_name='DiskUsage.used', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Number of bytes used.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='free', full_name='DiskUsage.free', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\027\022\025Number of free bytes.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9647,
+  serialized_end=9858,
+)
+
+
+_DNSCLIENTCONFIGURATION = _descriptor.Descriptor(
+  name='DNSClientConfiguration',
+  full_name='DNSClientConfiguration',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='dns_server', full_name='DNSClientConfiguration.dns_server', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001/\022-List of DNS servers appended in search order.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dns_suffix', full_name='DNSClientConfiguration.dns_suffix', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0010\022.List of DNS suffixes appended in search order.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=_b('\332\374\343\304\001\'\n%DNS client configuration information.'),
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=9861,
+  serialized_end=10083,
+)
+
+
+_HARDWAREINFO = _descriptor.Descriptor(
+  name='HardwareInfo',
+  full_name='HardwareInfo',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='serial_number', full_name='HardwareInfo.serial_number', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\034\022\032Identifying/Serial Number.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='system_manufacturer', full_name='HardwareInfo.system_manufacturer', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\026\022\024System Manufacturer.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='system_product_name', full_name='HardwareInfo.system_product_name', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\026\022\024System Product Name.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='system_uuid', full_name='HardwareInfo.system_uuid', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\016\022\014System UUID.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='system_sku_number', full_name='HardwareInfo.system_sku_number', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\024\022\022System SKU Number.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='system_family', full_name='HardwareInfo.system_family', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\020\022\016System Family.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bios_vendor', full_name='HardwareInfo.bios_vendor', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\016\022\014BIOS Vendor.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bios_version', full_name='HardwareInfo.bios_version', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\017\022\rBIOS Version.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bios_release_date', full_name='HardwareInfo.bios_release_date', index=8,
+      number=9, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\024\022\022BIOS Release Date.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bios_rom_size', full_name='HardwareInfo.bios_rom_size', index=9,
+      number=10, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\020\022\016BIOS ROM Size.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='bios_revision', full_name='HardwareInfo.bios_revision', index=10,
+      number=11, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\020\022\016BIOS Revision.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='system_assettag', full_name='HardwareInfo.system_assettag', index=11,
+      number=12, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\023\022\021System Asset tag.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10086,
+  serialized_end=10711,
+)
+
+
+_PLISTSTRINGDICTENTRY = _descriptor.Descriptor(
+  name='PlistStringDictEntry',
+  full_name='PlistStringDictEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='PlistStringDictEntry.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='PlistStringDictEntry.value', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10713,
+  serialized_end=10764,
+)
+
+
+_PLISTBOOLDICTENTRY = _descriptor.Descriptor(
+  name='PlistBoolDictEntry',
+  full_name='PlistBoolDictEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='PlistBoolDictEntry.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='PlistBoolDictEntry.value', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10766,
+  serialized_end=10815,
+)
+
+
+_LAUNCHDSTARTCALENDARINTERVALENTRY = _descriptor.Descriptor(
+  name='LaunchdStartCalendarIntervalEntry',
+  full_name='LaunchdStartCalendarIntervalEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='Minute', full_name='LaunchdStartCalendarIntervalEntry.Minute', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Hour', full_name='LaunchdStartCalendarIntervalEntry.Hour', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Day', full_name='LaunchdStartCalendarIntervalEntry.Day', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Weekday', full_name='LaunchdStartCalendarIntervalEntry.Weekday', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Month', full_name='LaunchdStartCalendarIntervalEntry.Month', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10817,
+  serialized_end=10927,
+)
+
+
+_LAUNCHDKEEPALIVE = _descriptor.Descriptor(
+  name='LaunchdKeepAlive',
+  full_name='LaunchdKeepAlive',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='SuccessfulExit', full_name='LaunchdKeepAlive.SuccessfulExit', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='NetworkState', full_name='LaunchdKeepAlive.NetworkState', index=1,
+      number=2, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='PathState', full_name='LaunchdKeepAlive.PathState', index=2,
+      number=3, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='OtherJobEnabled', full_name='LaunchdKeepAlive.OtherJobEnabled', index=3,
+      number=4, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=10930,
+  serialized_end=11080,
+)
+
+
+_LAUNCHDPLIST = _descriptor.Descriptor(
+  name='LaunchdPlist',
+  full_name='LaunchdPlist',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='aff4path', full_name='LaunchdPlist.aff4path', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0016\n\006RDFURN\022,The location of this file in the AFF4 space.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Label', full_name='LaunchdPlist.Label', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Disabled', full_name='LaunchdPlist.Disabled', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='UserName', full_name='LaunchdPlist.UserName', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='GroupName', full_name='LaunchdPlist.GroupName', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Program', full_name='LaunchdPlist.Program', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ProgramArguments', full_name='LaunchdPlist.ProgramArguments', index=6,
+      number=7, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='RootDirectory', full_name='LaunchdPlist.RootDirectory', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='WorkingDirectory', full_name='LaunchdPlist.WorkingDirectory', index=8,
+      number=9, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='OnDemand', full_name='LaunchdPlist.OnDemand', index=9,
+      number=10, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='RunAtLoad', full_name='LaunchdPlist.RunAtLoad', index=10,
+      number=11, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='StartCalendarInterval', full_name='LaunchdPlist.StartCalendarInterval', index=11,
+      number=12, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='EnvironmentVariables', full_name='LaunchdPlist.EnvironmentVariables', index=12,
+      number=13, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='KeepAlive', full_name='LaunchdPlist.KeepAlive', index=13,
+      number=14, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='KeepAliveDict', full_name='LaunchdPlist.KeepAliveDict', index=14,
+      number=15, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='StandardInPath', full_name='LaunchdPlist.StandardInPath', index=15,
+      number=16, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='StandardOutPath', full_name='LaunchdPlist.StandardOutPath', index=16,
+      number=17, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='StandardErrorPath', full_name='LaunchdPlist.StandardErrorPath', index=17,
+      number=18, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='LimitLoadToHosts', full_name='LaunchdPlist.LimitLoadToHosts', index=18,
+      number=19, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='LimitLoadFromHosts', full_name='LaunchdPlist.LimitLoadFromHosts', index=19,
+      number=20, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='LimitLoadToSessionType', full_name='LaunchdPlist.LimitLoadToSessionType', index=20,
+      number=21, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='EnableGlobbing', full_name='LaunchdPlist.EnableGlobbing', index=21,
+      number=22, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='EnableTransactions', full_name='LaunchdPlist.EnableTransactions', index=22,
+      number=23, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Umask', full_name='LaunchdPlist.Umask', index=23,
+      number=24, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='TimeOut', full_name='LaunchdPlist.TimeOut', index=24,
+      number=25, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ExitTimeOut', full_name='LaunchdPlist.ExitTimeOut', index=25,
+      number=26, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ThrottleInterval', full_name='LaunchdPlist.ThrottleInterval', index=26,
+      number=27, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='InitGroups', full_name='LaunchdPlist.InitGroups', index=27,
+      number=28, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='WatchPaths', full_name='LaunchdPlist.WatchPaths', index=28,
+      number=29, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='QueueDirectories', full_name='LaunchdPlist.QueueDirectories', index=29,
+      number=30, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='StartOnMount', full_name='LaunchdPlist.StartOnMount', index=30,
+      number=31, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='StartInterval', full_name='LaunchdPlist.StartInterval', index=31,
+      number=32, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Debug', full_name='LaunchdPlist.Debug', index=32,
+      number=33, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='WaitForDebugger', full_name='LaunchdPlist.WaitForDebugger', index=33,
+      number=34, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Nice', full_name='LaunchdPlist.Nice', index=34,
+      number=35, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ProcessType', full_name='LaunchdPlist.ProcessType', index=35,
+      number=36, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='AbandonProcessGroup', full_name='LaunchdPlist.AbandonProcessGroup', index=36,
+      number=37, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='LowPriorityIO', full_name='LaunchdPlist.LowPriorityIO', index=37,
+      number=38, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='LaunchOnlyOnce', full_name='LaunchdPlist.LaunchOnlyOnce', index=38,
+      number=39, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='inetdCompatabilityWait', full_name='LaunchdPlist.inetdCompatabilityWait', index=39,
+      number=40, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='SoftResourceLimits', full_name='LaunchdPlist.SoftResourceLimits', index=40,
+      number=41, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='HardResourceLimits', full_name='LaunchdPlist.HardResourceLimits', index=41,
+      number=42, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Sockets', full_name='LaunchdPlist.Sockets', index=42,
+      number=43, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=11083,
+  serialized_end=12217,
+)
+
+
+_CRONTABENTRY = _descriptor.Descriptor(
+  name='CronTabEntry',
+  full_name='CronTabEntry',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='minute', full_name='CronTabEntry.minute', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='hour', full_name='CronTabEntry.hour', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dayofmonth', full_name='CronTabEntry.dayofmonth', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='month', full_name='CronTabEntry.month', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='dayofweek', full_name='CronTabEntry.dayofweek', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='command', full_name='CronTabEntry.command', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='comment', full_name='CronTabEntry.comment', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12220,
+  serialized_end=12352,
+)
+
+
+_CRONTABFILE = _descriptor.Descriptor(
+  name='CronTabFile',
+  full_name='CronTabFile',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='aff4path', full_name='CronTabFile.aff4path', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0016\n\006RDFURN\022,The location of this file in the AFF4 space.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='jobs', full_name='CronTabFile.jobs', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12354,
+  serialized_end=12476,
+)
+
+
+_URI = _descriptor.Descriptor(
+  name='URI',
+  full_name='URI',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='transport', full_name='URI.transport', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001-\022+Transport such http, ftp, mailto, file etc.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='host', full_name='URI.host', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0013\0221Host/Port portion of the URI. e.g. google.com:80.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='path', full_name='URI.path', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030Path portion of the URI.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='query', full_name='URI.query', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\033\022\031Query portion of the URI.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='fragment', full_name='URI.fragment', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\036\022\034Fragment portion of the URI.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12479,
+  serialized_end=12783,
+)
+
+
+_WMIACTIVESCRIPTEVENTCONSUMER = _descriptor.Descriptor(
+  name='WMIActiveScriptEventConsumer',
+  full_name='WMIActiveScriptEventConsumer',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='CreatorSID', full_name='WMIActiveScriptEventConsumer.CreatorSID', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030SID of the event creator'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='KillTimeout', full_name='WMIActiveScriptEventConsumer.KillTimeout', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001?\022=Seconds the script is allowed to run. Default is 0, no limit.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MachineName', full_name='WMIActiveScriptEventConsumer.MachineName', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0011\022/Name of the computer to which WMI sends events.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MaximumQueueSize', full_name='WMIActiveScriptEventConsumer.MaximumQueueSize', index=3,
+      number=4, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001/\022-Maximum queue size in bytes for the consumer.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Name', full_name='WMIActiveScriptEventConsumer.Name', index=4,
+      number=5, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001+\022)Unique identifier for the event consumer.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ScriptFilename', full_name='WMIActiveScriptEventConsumer.ScriptFilename', index=5,
+      number=6, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0016\0224Name of the file from which the script text is read.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ScriptingEngine', full_name='WMIActiveScriptEventConsumer.ScriptingEngine', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001]\022[Name of the scripting engine to use, for example, \'VBScript\'. This property cannot be NULL.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ScriptText', full_name='WMIActiveScriptEventConsumer.ScriptText', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\233\001\022\230\001Text of the script that is expressed in a language known to the scripting engine. This property must be NULL if the ScriptFileName property is not NULL.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=12786,
+  serialized_end=13584,
+)
+
+
+_WMICOMMANDLINEEVENTCONSUMER = _descriptor.Descriptor(
+  name='WMICommandLineEventConsumer',
+  full_name='WMICommandLineEventConsumer',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='CreatorSID', full_name='WMICommandLineEventConsumer.CreatorSID', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\032\022\030SID of the event creator'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='CommandLineTemplate', full_name='WMICommandLineEventConsumer.CommandLineTemplate', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\235\001\022\232\001Standard string template that specifies the process to be started. This property can be NULL, and the ExecutablePath property is used as the command line.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='CreateNewConsole', full_name='WMICommandLineEventConsumer.CreateNewConsole', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001T\022RNot used. If a value is assigned to this property, a tracing message is generated.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='CreateNewProcessGroup', full_name='WMICommandLineEventConsumer.CreateNewProcessGroup', index=3,
+      number=4, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\363\001\022\360\001If True, the new process is the root process of a new process group. The process group includes all processes that are descendants of this root process. The process identifier of the new process group is the same as this process identifier.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='CreateSeparateWowVdm', full_name='WMICommandLineEventConsumer.CreateSeparateWowVdm', index=4,
+      number=5, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\235\002\022\232\002If True, the new process runs in a private Virtual DOS Machine (VDM). This is only valid when starting an application running on a 16-bit Windows operating system. If set to False, all applications running on a 16-bit Windows operating system run as threads in a single, shared VDM.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='CreateSharedWowVdm', full_name='WMICommandLineEventConsumer.CreateSharedWowVdm', index=5,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\315\001\022\312\001If True, the CreateProcess method runs the new process in the shared Virtual DOS Machine (VDM). This property can override the DefaultSeparateVDM switch in the Windows section of Win.ini if set to True.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='DesktopName', full_name='WMICommandLineEventConsumer.DesktopName', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001S\022QNot used. If a value is assigned to this property a tracing message is generated.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ExecutablePath', full_name='WMICommandLineEventConsumer.ExecutablePath', index=7,
+      number=8, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\226\004\022\223\004Module to execute. The string can specify the full path and file name of the module to execute, or it can specify a partial name. If a partial name is specified, the current drive and current directory are assumed. The ExecutablePath property can be NULL. In that case, the module name must be the first white space-delimited token in the CommandLineTemplate property value. If using a long file name that contains a space, use quoted strings to indicate where the file name ends and the arguments begin\342\200\224to clarify the file name.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='FillAttribute', full_name='WMICommandLineEventConsumer.FillAttribute', index=8,
+      number=9, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001n\022lSpecifies the initial text and background colors if a new console window is created in a console application'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='FillAttributes', full_name='WMICommandLineEventConsumer.FillAttributes', index=9,
+      number=10, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\222\001\022\217\001Initial text and background colors, if a new console window is created in a console application. This property is ignored in a GUI application.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ForceOffFeedback', full_name='WMICommandLineEventConsumer.ForceOffFeedback', index=10,
+      number=11, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001k\022iIf True, the feedback cursor is forced off while the process is starting. The normal cursor is displayed.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ForceOnFeedback', full_name='WMICommandLineEventConsumer.ForceOnFeedback', index=11,
+      number=12, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\334\002\022\331\002If True, the cursor is in feedback mode for two seconds after CreateProcess is called. During those two seconds, if the process makes the first GUI call, the system gives five more seconds to the process. During those five seconds, if the process shows a window, the system gives another five seconds to the process to finish drawing the window.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='KillTimeout', full_name='WMICommandLineEventConsumer.KillTimeout', index=12,
+      number=13, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\276\001\022\273\001Number, in seconds, that the WMI service waits before killing a process - 0 (zero) indicates a process is not to be killed. Killing a process prevents a process from running indefinitely.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Name', full_name='WMICommandLineEventConsumer.Name', index=13,
+      number=14, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\034\022\032Unique name of a consumer.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Priority', full_name='WMICommandLineEventConsumer.Priority', index=14,
+      number=15, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001l\022jScheduling priority level of the process threads. The following table lists the priority levels available.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='RunInteractively', full_name='WMICommandLineEventConsumer.RunInteractively', index=15,
+      number=16, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\201\004\022\376\003If True, the process is launched in the interactive WinStation. If False, the process is launched in the default service WinStation. This property overrides the DesktopName property. This property is only used locally, and only if the interactive user is the same user who set up the consumer. Starting with Windows Vista, the process running the CommandLineEventConsumer instance is started under the LocalSystem account and is in session 0. Services which run in session 0 cannot interact with user sessions.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ShowWindowCommand', full_name='WMICommandLineEventConsumer.ShowWindowCommand', index=16,
+      number=17, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001\024\022\022Window show state.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='UseDefaultErrorMode', full_name='WMICommandLineEventConsumer.UseDefaultErrorMode', index=17,
+      number=18, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001*\022(If True, the default error mode is used.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='WindowTitle', full_name='WMICommandLineEventConsumer.WindowTitle', index=18,
+      number=19, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001d\022bTitle that appears on the title bar of the process. This property is ignored for GUI applications.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='WorkingDirectory', full_name='WMICommandLineEventConsumer.WorkingDirectory', index=19,
+      number=20, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=_b("").decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001%\022#Working directory for this process.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='XCoordinate', full_name='WMICommandLineEventConsumer.XCoordinate', index=20,
+      number=21, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001s\022qX-offset, in pixels, from the left edge of the screen to the left edge of the window, if a new window is created.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='XNumCharacters', full_name='WMICommandLineEventConsumer.XNumCharacters', index=21,
+      number=22, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001{\022yScreen buffer width, in character columns, if a new console window is created. This property is ignored in a GUI process.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='XSize', full_name='WMICommandLineEventConsumer.XSize', index=22,
+      number=23, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001@\022>Width, in pixels, of a new window, if a new window is created.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='YCoordinate', full_name='WMICommandLineEventConsumer.YCoordinate', index=23,
+      number=24, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001q\022oY-offset, in pixels, from the top edge of the screen to the top edge of the window, if a new window is created.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='YNumCharacters', full_name='WMICommandLineEventConsumer.YNumCharacters', index=24,
+      number=25, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001y\022wScreen buffer height, in character rows, if a new console window is created. This property is ignored in a GUI process.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='YSize', full_name='WMICommandLineEventConsumer.YSize', index=25,
+      number=26, type=13, cpp_type=3, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\001C\022AHeight, in pixels, of the new window, if a new window is created.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MaximumQueueSize', full_name='WMICommandLineEventConsumer.MaximumQueueSize', index=26,
+      number=27, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0012\0220Maximum queue for a specific consumer, in bytes.'), file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='MachineName', full_name='WMICommandLineEventConsumer.MachineName', index=27,
+      number=28, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=_b('\342\374\343\304\0012\0220Maximum queue for a specific consumer, in bytes.'), file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto2',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=13587,
+  serialized_end=18600,
+)
+
+_PROCESS.fields_by_name['connections'].message_type = _NETWORKCONNECTION
+_NETWORKCONNECTION.fields_by_name['family'].enum_type = _NETWORKCONNECTION_FAMILY
+_NETWORKCONNECTION.fields_by_name['type'].enum_type = _NETWORKCONNECTION_TYPE
+_NETWORKCONNECTION.fields_by_name['local_address'].message_type = _NETWORKENDPOINT
+_NETWORKCONNECTION.fields_by_name['remote_address'].message_type = _NETWORKENDPOINT
+_NETWORKCONNECTION.fields_by_name['state'].enum_type = _NETWORKCONNECTION_STATE
+_NETWORKCONNECTION_FAMILY.containing_type = _NETWORKCONNECTION
+_NETWORKCONNECTION_TYPE.containing_type = _NETWORKCONNECTION
+_NETWORKCONNECTION_STATE.containing_type = _NETWORKCONNECTION
+_FILESYSTEM.fields_by_name['options'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_WINDOWSSERVICEINFORMATION.fields_by_name['binary'].message_type = grr_dot_proto_dot_jobs__pb2._STATENTRY
+_WINDOWSSERVICEINFORMATION.fields_by_name['wmi_information'].message_type = grr_dot_proto_dot_jobs__pb2._DICT
+_WINDOWSSERVICEINFORMATION.fields_by_name['error_control'].enum_type = _WINDOWSSERVICEINFORMATION_ERRORCONTROL
+_WINDOWSSERVICEINFORMATION.fields_by_name['startup_type'].enum_type = _WINDOWSSERVICEINFORMATION_SERVICEMODE
+_WINDOWSSERVICEINFORMATION.fields_by_name['service_type'].enum_type = _WINDOWSSERVICEINFORMATION_SERVICETYPE
+_WINDOWSSERVICEINFORMATION_ERRORCONTROL.containing_type = _WINDOWSSERVICEINFORMATION
+_WINDOWSSERVICEINFORMATION_SERVICEMODE.containing_type = _WINDOWSSERVICEINFORMATION
+_WINDOWSSERVICEINFORMATION_SERVICETYPE.containing_type = _WINDOWSSERVICEINFORMATION
+_LINUXSERVICEINFORMATION.fields_by_name['binary'].message_type = grr_dot_proto_dot_jobs__pb2._STATENTRY
+_LINUXSERVICEINFORMATION.fields_by_name['software'].message_type = _SOFTWAREPACKAGE
+_LINUXSERVICEINFORMATION.fields_by_name['start_mode'].enum_type = _LINUXSERVICEINFORMATION_STARTMODE
+_LINUXSERVICEINFORMATION.fields_by_name['config'].message_type = grr_dot_proto_dot_jobs__pb2._ATTRIBUTEDDICT
+_LINUXSERVICEINFORMATION_STARTMODE.containing_type = _LINUXSERVICEINFORMATION
+_SOFTWAREPACKAGE.fields_by_name['install_state'].enum_type = _SOFTWAREPACKAGE_INSTALLSTATE
+_SOFTWAREPACKAGE_INSTALLSTATE.containing_type = _SOFTWAREPACKAGE
+_VOLUME.fields_by_name['file_system_flag_list'].enum_type = _VOLUME_VOLUMEFILESYSTEMFLAGENUM
+_VOLUME.fields_by_name['windowsvolume'].message_type = _WINDOWSVOLUME
+_VOLUME.fields_by_name['unixvolume'].message_type = _UNIXVOLUME
+_VOLUME_VOLUMEFILESYSTEMFLAGENUM.containing_type = _VOLUME
+_WINDOWSVOLUME.fields_by_name['attributes_list'].enum_type = _WINDOWSVOLUME_WINDOWSVOLUMEATTRIBUTEENUM
+_WINDOWSVOLUME.fields_by_name['drive_type'].enum_type = _WINDOWSVOLUME_WINDOWSDRIVETYPEENUM
+_WINDOWSVOLUME_WINDOWSVOLUMEATTRIBUTEENUM.containing_type = _WINDOWSVOLUME
+_WINDOWSVOLUME_WINDOWSDRIVETYPEENUM.containing_type = _WINDOWSVOLUME
+_LAUNCHDKEEPALIVE.fields_by_name['PathState'].message_type = _PLISTBOOLDICTENTRY
+_LAUNCHDKEEPALIVE.fields_by_name['OtherJobEnabled'].message_type = _PLISTBOOLDICTENTRY
+_LAUNCHDPLIST.fields_by_name['StartCalendarInterval'].message_type = _LAUNCHDSTARTCALENDARINTERVALENTRY
+_LAUNCHDPLIST.fields_by_name['EnvironmentVariables'].message_type = _PLISTSTRINGDICTENTRY
+_LAUNCHDPLIST.fields_by_name['KeepAliveDict'].message_type = _LAUNCHDKEEPALIVE
+_CRONTABFILE.fields_by_name['jobs'].message_type = _CRONTABENTRY
+DESCRIPTOR.message_types_by_name['PackageRepository'] = _PACKAGEREPOSITORY
+DESCRIPTOR.message_types_by_name['ManagementAgent'] = _MANAGEMENTAGENT
+DESCRIPTOR.message_types_by_name['PCIDevice'] = _PCIDEVICE
+DESCRIPTOR.message_types_by_name['Process'] = _PROCESS
+DESCRIPTOR.message_types_by_name['NetworkEndpoint'] = _NETWORKENDPOINT
+DESCRIPTOR.message_types_by_name['NetworkConnection'] = _NETWORKCONNECTION
+DESCRIPTOR.message_types_by_name['Filesystem'] = _FILESYSTEM
+DESCRIPTOR.message_types_by_name['RunKey'] = _RUNKEY
+DESCRIPTOR.message_types_by_name['WindowsServiceInformation'] = _WINDOWSSERVICEINFORMATION
+DESCRIPTOR.message_types_by_name['OSXServiceInformation'] = _OSXSERVICEINFORMATION
+DESCRIPTOR.message_types_by_name['LinuxServiceInformation'] = _LINUXSERVICEINFORMATION
+DESCRIPTOR.message_types_by_name['SoftwarePackage'] = _SOFTWAREPACKAGE
+DESCRIPTOR.message_types_by_name['BrowserHistoryItem'] = _BROWSERHISTORYITEM
+DESCRIPTOR.message_types_by_name['Volume'] = _VOLUME
+DESCRIPTOR.message_types_by_name['WindowsVolume'] = _WINDOWSVOLUME
+DESCRIPTOR.message_types_by_name['UnixVolume'] = _UNIXVOLUME
+DESCRIPTOR.message_types_by_name['DiskUsage'] = _DISKUSAGE
+DESCRIPTOR.message_types_by_name['DNSClientConfiguration'] = _DNSCLIENTCONFIGURATION
+DESCRIPTOR.message_types_by_name['HardwareInfo'] = _HARDWAREINFO
+DESCRIPTOR.message_types_by_name['PlistStringDictEntry'] = _PLISTSTRINGDICTENTRY
+DESCRIPTOR.message_types_by_name['PlistBoolDictEntry'] = _PLISTBOOLDICTENTRY
+DESCRIPTOR.message_types_by_name['LaunchdStartCalendarIntervalEntry'] = _LAUNCHDSTARTCALENDARINTERVALENTRY
+DESCRIPTOR.message_types_by_name['LaunchdKeepAlive'] = _LAUNCHDKEEPALIVE
+DESCRIPTOR.message_types_by_name['LaunchdPlist'] = _LAUNCHDPLIST
+DESCRIPTOR.message_types_by_name['CronTabEntry'] = _CRONTABENTRY
+DESCRIPTOR.message_types_by_name['CronTabFile'] = _CRONTABFILE
+DESCRIPTOR.message_types_by_name['URI'] = _URI
+DESCRIPTOR.message_types_by_name['WMIActiveScriptEventConsumer'] = _WMIACTIVESCRIPTEVENTCONSUMER
+DESCRIPTOR.message_types_by_name['WMICommandLineEventConsumer'] = _WMICOMMANDLINEEVENTCONSUMER
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
+
+PackageRepository = _reflection.GeneratedProtocolMessageType('PackageRepository', (_message.Message,), {
+  'DESCRIPTOR' : _PACKAGEREPOSITORY,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:PackageRepository)
+  })
+_sym_db.RegisterMessage(PackageRepository)
+
+ManagementAgent = _reflection.GeneratedProtocolMessageType('ManagementAgent', (_message.Message,), {
+  'DESCRIPTOR' : _MANAGEMENTAGENT,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:ManagementAgent)
+  })
+_sym_db.RegisterMessage(ManagementAgent)
+
+PCIDevice = _reflection.GeneratedProtocolMessageType('PCIDevice', (_message.Message,), {
+  'DESCRIPTOR' : _PCIDEVICE,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:PCIDevice)
+  })
+_sym_db.RegisterMessage(PCIDevice)
+
+Process = _reflection.GeneratedProtocolMessageType('Process', (_message.Message,), {
+  'DESCRIPTOR' : _PROCESS,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:Process)
+  })
+_sym_db.RegisterMessage(Process)
+
+NetworkEndpoint = _reflection.GeneratedProtocolMessageType('NetworkEndpoint', (_message.Message,), {
+  'DESCRIPTOR' : _NETWORKENDPOINT,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:NetworkEndpoint)
+  })
+_sym_db.RegisterMessage(NetworkEndpoint)
+
+NetworkConnection = _reflection.GeneratedProtocolMessageType('NetworkConnection', (_message.Message,), {
+  'DESCRIPTOR' : _NETWORKCONNECTION,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:NetworkConnection)
+  })
+_sym_db.RegisterMessage(NetworkConnection)
+
+Filesystem = _reflection.GeneratedProtocolMessageType('Filesystem', (_message.Message,), {
+  'DESCRIPTOR' : _FILESYSTEM,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:Filesystem)
+  })
+_sym_db.RegisterMessage(Filesystem)
+
+RunKey = _reflection.GeneratedProtocolMessageType('RunKey', (_message.Message,), {
+  'DESCRIPTOR' : _RUNKEY,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:RunKey)
+  })
+_sym_db.RegisterMessage(RunKey)
+
+WindowsServiceInformation = _reflection.GeneratedProtocolMessageType('WindowsServiceInformation', (_message.Message,), {
+  'DESCRIPTOR' : _WINDOWSSERVICEINFORMATION,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:WindowsServiceInformation)
+  })
+_sym_db.RegisterMessage(WindowsServiceInformation)
+
+OSXServiceInformation = _reflection.GeneratedProtocolMessageType('OSXServiceInformation', (_message.Message,), {
+  'DESCRIPTOR' : _OSXSERVICEINFORMATION,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:OSXServiceInformation)
+  })
+_sym_db.RegisterMessage(OSXServiceInformation)
+
+LinuxServiceInformation = _reflection.GeneratedProtocolMessageType('LinuxServiceInformation', (_message.Message,), {
+  'DESCRIPTOR' : _LINUXSERVICEINFORMATION,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:LinuxServiceInformation)
+  })
+_sym_db.RegisterMessage(LinuxServiceInformation)
+
+SoftwarePackage = _reflection.GeneratedProtocolMessageType('SoftwarePackage', (_message.Message,), {
+  'DESCRIPTOR' : _SOFTWAREPACKAGE,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:SoftwarePackage)
+  })
+_sym_db.RegisterMessage(SoftwarePackage)
+
+BrowserHistoryItem = _reflection.GeneratedProtocolMessageType('BrowserHistoryItem', (_message.Message,), {
+  'DESCRIPTOR' : _BROWSERHISTORYITEM,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:BrowserHistoryItem)
+  })
+_sym_db.RegisterMessage(BrowserHistoryItem)
+
+Volume = _reflection.GeneratedProtocolMessageType('Volume', (_message.Message,), {
+  'DESCRIPTOR' : _VOLUME,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:Volume)
+  })
+_sym_db.RegisterMessage(Volume)
+
+WindowsVolume = _reflection.GeneratedProtocolMessageType('WindowsVolume', (_message.Message,), {
+  'DESCRIPTOR' : _WINDOWSVOLUME,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:WindowsVolume)
+  })
+_sym_db.RegisterMessage(WindowsVolume)
+
+UnixVolume = _reflection.GeneratedProtocolMessageType('UnixVolume', (_message.Message,), {
+  'DESCRIPTOR' : _UNIXVOLUME,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:UnixVolume)
+  })
+_sym_db.RegisterMessage(UnixVolume)
+
+DiskUsage = _reflection.GeneratedProtocolMessageType('DiskUsage', (_message.Message,), {
+  'DESCRIPTOR' : _DISKUSAGE,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:DiskUsage)
+  })
+_sym_db.RegisterMessage(DiskUsage)
+
+DNSClientConfiguration = _reflection.GeneratedProtocolMessageType('DNSClientConfiguration', (_message.Message,), {
+  'DESCRIPTOR' : _DNSCLIENTCONFIGURATION,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:DNSClientConfiguration)
+  })
+_sym_db.RegisterMessage(DNSClientConfiguration)
+
+HardwareInfo = _reflection.GeneratedProtocolMessageType('HardwareInfo', (_message.Message,), {
+  'DESCRIPTOR' : _HARDWAREINFO,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:HardwareInfo)
+  })
+_sym_db.RegisterMessage(HardwareInfo)
+
+PlistStringDictEntry = _reflection.GeneratedProtocolMessageType('PlistStringDictEntry', (_message.Message,), {
+  'DESCRIPTOR' : _PLISTSTRINGDICTENTRY,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:PlistStringDictEntry)
+  })
+_sym_db.RegisterMessage(PlistStringDictEntry)
+
+PlistBoolDictEntry = _reflection.GeneratedProtocolMessageType('PlistBoolDictEntry', (_message.Message,), {
+  'DESCRIPTOR' : _PLISTBOOLDICTENTRY,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:PlistBoolDictEntry)
+  })
+_sym_db.RegisterMessage(PlistBoolDictEntry)
+
+LaunchdStartCalendarIntervalEntry = _reflection.GeneratedProtocolMessageType('LaunchdStartCalendarIntervalEntry', (_message.Message,), {
+  'DESCRIPTOR' : _LAUNCHDSTARTCALENDARINTERVALENTRY,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:LaunchdStartCalendarIntervalEntry)
+  })
+_sym_db.RegisterMessage(LaunchdStartCalendarIntervalEntry)
+
+LaunchdKeepAlive = _reflection.GeneratedProtocolMessageType('LaunchdKeepAlive', (_message.Message,), {
+  'DESCRIPTOR' : _LAUNCHDKEEPALIVE,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:LaunchdKeepAlive)
+  })
+_sym_db.RegisterMessage(LaunchdKeepAlive)
+
+LaunchdPlist = _reflection.GeneratedProtocolMessageType('LaunchdPlist', (_message.Message,), {
+  'DESCRIPTOR' : _LAUNCHDPLIST,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:LaunchdPlist)
+  })
+_sym_db.RegisterMessage(LaunchdPlist)
+
+CronTabEntry = _reflection.GeneratedProtocolMessageType('CronTabEntry', (_message.Message,), {
+  'DESCRIPTOR' : _CRONTABENTRY,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:CronTabEntry)
+  })
+_sym_db.RegisterMessage(CronTabEntry)
+
+CronTabFile = _reflection.GeneratedProtocolMessageType('CronTabFile', (_message.Message,), {
+  'DESCRIPTOR' : _CRONTABFILE,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:CronTabFile)
+  })
+_sym_db.RegisterMessage(CronTabFile)
+
+URI = _reflection.GeneratedProtocolMessageType('URI', (_message.Message,), {
+  'DESCRIPTOR' : _URI,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:URI)
+  })
+_sym_db.RegisterMessage(URI)
+
+WMIActiveScriptEventConsumer = _reflection.GeneratedProtocolMessageType('WMIActiveScriptEventConsumer', (_message.Message,), {
+  'DESCRIPTOR' : _WMIACTIVESCRIPTEVENTCONSUMER,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:WMIActiveScriptEventConsumer)
+  })
+_sym_db.RegisterMessage(WMIActiveScriptEventConsumer)
+
+WMICommandLineEventConsumer = _reflection.GeneratedProtocolMessageType('WMICommandLineEventConsumer', (_message.Message,), {
+  'DESCRIPTOR' : _WMICOMMANDLINEEVENTCONSUMER,
+  '__module__' : 'grr.proto.sysinfo_pb2'
+  # @@protoc_insertion_point(class_scope:WMICommandLineEventConsumer)
+  })
+_sym_db.RegisterMessage(WMICommandLineEventConsumer)
+
+
+_PACKAGEREPOSITORY.fields_by_name['id']._options = None
+_PACKAGEREPOSITORY.fields_by_name['name']._options = None
+_PACKAGEREPOSITORY.fields_by_name['revision']._options = None
+_PACKAGEREPOSITORY.fields_by_name['last_update']._options = None
+_PACKAGEREPOSITORY.fields_by_name['num_packages']._options = None
+_PACKAGEREPOSITORY.fields_by_name['size']._options = None
+_PACKAGEREPOSITORY.fields_by_name['baseurl']._options = None
+_PACKAGEREPOSITORY.fields_by_name['timeout']._options = None
+_MANAGEMENTAGENT.fields_by_name['name']._options = None
+_MANAGEMENTAGENT.fields_by_name['last_success']._options = None
+_PCIDEVICE.fields_by_name['domain']._options = None
+_PCIDEVICE.fields_by_name['bus']._options = None
+_PCIDEVICE.fields_by_name['device']._options = None
+_PCIDEVICE.fields_by_name['function']._options = None
+_PCIDEVICE.fields_by_name['class_id']._options = None
+_PCIDEVICE.fields_by_name['vendor']._options = None
+_PCIDEVICE.fields_by_name['vendor_device_id']._options = None
+_PCIDEVICE.fields_by_name['config']._options = None
+_PROCESS._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['name']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['description']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['binary']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['state']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['wmi_information']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['display_name']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['driver_package_id']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['error_control']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['image_path']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['object_name']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['startup_type']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['service_type']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['group_name']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['service_dll']._options = None
+_WINDOWSSERVICEINFORMATION.fields_by_name['registry_key']._options = None
+_WINDOWSSERVICEINFORMATION._options = None
+_OSXSERVICEINFORMATION.fields_by_name['label']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['program']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['args']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['pid']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['sessiontype']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['lastexitstatus']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['timeout']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['ondemand']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['machservice']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['perjobmachservice']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['socket']._options = None
+_OSXSERVICEINFORMATION.fields_by_name['plist']._options = None
+_OSXSERVICEINFORMATION._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['name']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['description']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['binary']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['software']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['start_mode']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['start_on']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['stop_on']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['start_after']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['stop_after']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['config']._options = None
+_LINUXSERVICEINFORMATION.fields_by_name['starts']._options = None
+_LINUXSERVICEINFORMATION._options = None
+_BROWSERHISTORYITEM.fields_by_name['url']._options = None
+_BROWSERHISTORYITEM.fields_by_name['domain']._options = None
+_BROWSERHISTORYITEM.fields_by_name['access_time']._options = None
+_BROWSERHISTORYITEM.fields_by_name['referrer']._options = None
+_BROWSERHISTORYITEM.fields_by_name['title']._options = None
+_BROWSERHISTORYITEM.fields_by_name['program_name']._options = None
+_BROWSERHISTORYITEM.fields_by_name['source_urn']._options = None
+_BROWSERHISTORYITEM.fields_by_name['download_path']._options = None
+_VOLUME.fields_by_name['is_mounted']._options = None
+_VOLUME.fields_by_name['name']._options = None
+_VOLUME.fields_by_name['device_path']._options = None
+_VOLUME.fields_by_name['file_system_type']._options = None
+_VOLUME.fields_by_name['total_allocation_units']._options = None
+_VOLUME.fields_by_name['sectors_per_allocation_unit']._options = None
+_VOLUME.fields_by_name['bytes_per_sector']._options = None
+_VOLUME.fields_by_name['actual_available_allocation_units']._options = None
+_VOLUME.fields_by_name['creation_time']._options = None
+_VOLUME.fields_by_name['file_system_flag_list']._options = None
+_VOLUME.fields_by_name['serial_number']._options = None
+_VOLUME.fields_by_name['windowsvolume']._options = None
+_VOLUME.fields_by_name['unixvolume']._options = None
+_WINDOWSVOLUME.fields_by_name['attributes_list']._options = None
+_WINDOWSVOLUME.fields_by_name['drive_letter']._options = None
+_WINDOWSVOLUME.fields_by_name['drive_type']._options = None
+_UNIXVOLUME.fields_by_name['mount_point']._options = None
+_UNIXVOLUME.fields_by_name['options']._options = None
+_DISKUSAGE.fields_by_name['path']._options = None
+_DISKUSAGE.fields_by_name['total']._options = None
+_DISKUSAGE.fields_by_name['used']._options = None
+_DISKUSAGE.fields_by_name['free']._options = None
+_DNSCLIENTCONFIGURATION.fields_by_name['dns_server']._options = None
+_DNSCLIENTCONFIGURATION.fields_by_name['dns_suffix']._options = None
+_DNSCLIENTCONFIGURATION._options = None
+_HARDWAREINFO.fields_by_name['serial_number']._options = None
+_HARDWAREINFO.fields_by_name['system_manufacturer']._options = None
+_HARDWAREINFO.fields_by_name['system_product_name']._options = None
+_HARDWAREINFO.fields_by_name['system_uuid']._options = None
+_HARDWAREINFO.fields_by_name['system_sku_number']._options = None
+_HARDWAREINFO.fields_by_name['system_family']._options = None
+_HARDWAREINFO.fields_by_name['bios_vendor']._options = None
+_HARDWAREINFO.fields_by_name['bios_version']._options = None
+_HARDWAREINFO.fields_by_name['bios_release_date']._options = None
+_HARDWAREINFO.fields_by_name['bios_rom_size']._options = None
+_HARDWAREINFO.fields_by_name['bios_revision']._options = None
+_HARDWAREINFO.fields_by_name['system_assettag']._options = None
+_LAUNCHDPLIST.fields_by_name['aff4path']._options = None
+_CRONTABFILE.fields_by_name['aff4path']._options = None
+_URI.fields_by_name['transport']._options = None
+_URI.fields_by_name['host']._options = None
+_URI.fields_by_name['path']._options = None
+_URI.fields_by_name['query']._options = None
+_URI.fields_by_name['fragment']._options = None
+_WMIACTIVESCRIPTEVENTCONSUMER.fields_by_name['CreatorSID']._options = None
+_WMIACTIVESCRIPTEVENTCONSUMER.fields_by_name['KillTimeout']._options = None
+_WMIACTIVESCRIPTEVENTCONSUMER.fields_by_name['MachineName']._options = None
+_WMIACTIVESCRIPTEVENTCONSUMER.fields_by_name['MaximumQueueSize']._options = None
+_WMIACTIVESCRIPTEVENTCONSUMER.fields_by_name['Name']._options = None
+_WMIACTIVESCRIPTEVENTCONSUMER.fields_by_name['ScriptFilename']._options = None
+_WMIACTIVESCRIPTEVENTCONSUMER.fields_by_name['ScriptingEngine']._options = None
+_WMIACTIVESCRIPTEVENTCONSUMER.fields_by_name['ScriptText']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['CreatorSID']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['CommandLineTemplate']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['CreateNewConsole']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['CreateNewProcessGroup']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['CreateSeparateWowVdm']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['CreateSharedWowVdm']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['DesktopName']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['ExecutablePath']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['FillAttribute']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['FillAttributes']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['ForceOffFeedback']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['ForceOnFeedback']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['KillTimeout']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['Name']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['Priority']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['RunInteractively']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['ShowWindowCommand']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['UseDefaultErrorMode']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['WindowTitle']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['WorkingDirectory']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['XCoordinate']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['XNumCharacters']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['XSize']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['YCoordinate']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['YNumCharacters']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['YSize']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['MaximumQueueSize']._options = None
+_WMICOMMANDLINEEVENTCONSUMER.fields_by_name['MachineName']._options = None
+# @@protoc_insertion_point(module_scope)